@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
 import contextlib
 from datetime import UTC, datetime, timedelta, timezone
+import hashlib
 import logging
-from typing import Any
+from operator import is_
+from typing import Any, Callable
 
 from load_shedding.libs.sepush import SePush, SePushError
 from load_shedding.providers import Area, Stage
@@ -27,6 +30,7 @@ from homeassistant.const import (
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import issue_registry as ir
 from homeassistant.helpers.entity import DeviceInfo, Entity
+from homeassistant.helpers.json import json_bytes
 from homeassistant.helpers.storage import Store
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
@@ -43,15 +47,38 @@ from .const import (
     ATTR_STAGE,
     ATTR_START_TIME,
     CONF_AREAS,
+    CONF_FORECAST_DAYS,
+    CONF_INVALID_AREA_EXPIRY,
     CONF_MIN_EVENT_DURATION,
+    CONF_MINUTE_COUNTDOWNS,
+    CONF_OUTAGE_MINUTES_HOURS,
+    CONF_PROJECTION_STAGE,
+    CONF_TIMELINE_DAYS,
+    DEFAULT_INVALID_AREA_EXPIRY,
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
     MANUFACTURER,
+    MAX_FORECAST_DAYS,
+    MAX_LIST_ATTR_ITEMS_PER_DAY,
     NAME,
     STAGE_UPDATE_INTERVAL,
     VERSION,
 )
-from .helpers import should_refresh
+from .helpers import (
+    HAS_NUMPY,
+    OutageMinutes,
+    OutageSweep,
+    Slot,
+    StageTimelines,
+    TimestampTable,
+    VectorForecastEngine,
+    prune_area_data,
+    prune_invalid_area_ids,
+    prune_stage_data,
+    should_refresh,
+    sweep_outages,
+)
+from .services import async_setup_services
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -61,7 +88,22 @@ DIAG_CONTEXT = f"[load_shedding {VERSION}, Home Assistant {HA_VERSION}]"
 
 PLATFORMS = [Platform.CALENDAR, Platform.SENSOR]
 
-_STORE_VERSION = 1
+_STORE_VERSION = 2
+# Seconds to hold a cache write so back-to-back saves (e.g. the invalid-area
+# prune on load followed by the first poll) reach disk as a single write.
+_SAVE_DELAY = 10
+# Seconds to hold a cache write that only moves ``last_update`` or the quota
+# snapshot. Bounded, so after a crash the stored ``last_update`` is at most this
+# far behind and a restart still skips the API (#116).
+_IDLE_SAVE_DELAY = 6 * _SAVE_DELAY
+# Payload keys that move on every poll and so do not count as a content change.
+_VOLATILE_KEYS = frozenset({"last_update", "rate_limit"})
+# Count of areas whose schedule cannot be spliced (see ``StageTimelines``) from
+# which their forecasts are derived with the NumPy engine, when NumPy is
+# installed. Measured with week-long schedules, the engine overtakes the
+# per-area loop at about 12 such areas (16: 0.21 ms vs 0.28 ms, 100: 0.75 ms vs
+# 2.2 ms). Spliceable schedules never use it: the splice is faster still.
+_VECTOR_MIN_AREAS = 16
 
 
 # ---------------------------------------------------------------------------
@@ -71,35 +113,74 @@ _STORE_VERSION = 1
 # that must be flattened to JSON-safe primitives before writing to Store and
 # re-inflated after loading.  Deserialization failures are suppressed in the
 # callers so a corrupt/incompatible cache silently falls back to a live poll.
+#
+# Store version 2 writes each slot list column-wise as epoch-minute integers:
+# ``start`` holds the first start followed by deltas from the previous start,
+# ``duration`` the slot lengths in minutes and, where the slots can differ,
+# ``stage`` the stage values. Schedules are keyed by stage, so their slots omit
+# the stage column. SePush times have minute resolution, so nothing is lost.
+
+
+def _encode_slots(slots: list, *, with_stage: bool = True) -> dict:
+    starts: list[int] = []
+    durations: list[int] = []
+    stages: list[int] = []
+    prev = 0
+    for slot in slots:
+        start = int(slot.start_time.timestamp()) // 60
+        starts.append(start - prev)
+        durations.append(int(slot.end_time.timestamp()) // 60 - start)
+        prev = start
+        if with_stage:
+            stages.append(slot.stage.value)
+    encoded: dict = {"start": starts, "duration": durations}
+    if with_stage:
+        encoded[ATTR_STAGE] = stages
+    return encoded
+
+
+def _decode_slots(
+    encoded: dict, timestamps: TimestampTable, stage: Stage | None = None
+) -> list:
+    starts = encoded.get("start", [])
+    stages = encoded.get(ATTR_STAGE) or [None] * len(starts)
+    from_minutes = timestamps.from_minutes
+    slots: list = []
+    start = 0
+    for delta, duration, stage_val in zip(
+        starts, encoded.get("duration", []), stages, strict=True
+    ):
+        start += delta
+        slots.append(
+            Slot(
+                stage if stage_val is None else Stage(stage_val),
+                from_minutes(start),
+                from_minutes(start + duration),
+            )
+        )
+    return slots
 
 
 def _serialize_stage_data(data: dict) -> dict:
     result: dict = {}
     for zone_id, zone_data in data.items():
-        planned = [
-            {
-                ATTR_STAGE: slot[ATTR_STAGE].value,
-                ATTR_START_TIME: slot[ATTR_START_TIME].isoformat(),
-                ATTR_END_TIME: slot[ATTR_END_TIME].isoformat(),
-            }
-            for slot in zone_data.get(ATTR_PLANNED, [])
-        ]
-        result[zone_id] = {ATTR_NAME: zone_data.get(ATTR_NAME, ""), ATTR_PLANNED: planned}
+        result[zone_id] = {
+            ATTR_NAME: zone_data.get(ATTR_NAME, ""),
+            ATTR_PLANNED: _encode_slots(zone_data.get(ATTR_PLANNED, [])),
+        }
     return result
 
 
-def _deserialize_stage_data(stored: dict) -> dict:
+def _deserialize_stage_data(
+    stored: dict, timestamps: TimestampTable | None = None
+) -> dict:
+    timestamps = timestamps or TimestampTable()
     result: dict = {}
     for zone_id, zone_data in stored.items():
-        planned = [
-            {
-                ATTR_STAGE: Stage(int(slot[ATTR_STAGE])),
-                ATTR_START_TIME: datetime.fromisoformat(slot[ATTR_START_TIME]),
-                ATTR_END_TIME: datetime.fromisoformat(slot[ATTR_END_TIME]),
-            }
-            for slot in zone_data.get(ATTR_PLANNED, [])
-        ]
-        result[zone_id] = {ATTR_NAME: zone_data.get(ATTR_NAME, ""), ATTR_PLANNED: planned}
+        result[zone_id] = {
+            ATTR_NAME: zone_data.get(ATTR_NAME, ""),
+            ATTR_PLANNED: _decode_slots(zone_data.get(ATTR_PLANNED, {}), timestamps),
+        }
     return result
 
 
@@ -107,54 +188,189 @@ def _serialize_area_data(data: dict) -> dict:
     # Only events + schedule are persisted; forecast is derived and recomputed.
     result: dict = {}
     for area_id, area_data in data.items():
-        events = [
-            {
-                ATTR_STAGE: s[ATTR_STAGE].value,
-                ATTR_START_TIME: s[ATTR_START_TIME].isoformat(),
-                ATTR_END_TIME: s[ATTR_END_TIME].isoformat(),
-            }
-            for s in area_data.get(ATTR_EVENTS, [])
-        ]
-        schedule: dict[str, list] = {}
-        for stage, slots in area_data.get(ATTR_SCHEDULE, {}).items():
-            schedule[str(stage.value)] = [
-                {
-                    ATTR_STAGE: s[ATTR_STAGE].value,
-                    ATTR_START_TIME: s[ATTR_START_TIME].isoformat(),
-                    ATTR_END_TIME: s[ATTR_END_TIME].isoformat(),
-                }
-                for s in slots
-            ]
-        result[area_id] = {ATTR_EVENTS: events, ATTR_SCHEDULE: schedule}
+        schedule = {
+            str(stage.value): _encode_slots(slots, with_stage=False)
+            for stage, slots in area_data.get(ATTR_SCHEDULE, {}).items()
+        }
+        result[area_id] = {
+            ATTR_EVENTS: _encode_slots(area_data.get(ATTR_EVENTS, [])),
+            ATTR_SCHEDULE: schedule,
+        }
     return result
 
 
-def _deserialize_area_data(stored: dict) -> dict:
+def _deserialize_area_data(
+    stored: dict, timestamps: TimestampTable | None = None
+) -> dict:
+    timestamps = timestamps or TimestampTable()
     result: dict = {}
     for area_id, area_data in stored.items():
-        events = [
-            {
-                ATTR_STAGE: Stage(int(s[ATTR_STAGE])),
-                ATTR_START_TIME: datetime.fromisoformat(s[ATTR_START_TIME]),
-                ATTR_END_TIME: datetime.fromisoformat(s[ATTR_END_TIME]),
-            }
-            for s in area_data.get(ATTR_EVENTS, [])
-        ]
         schedule: dict[Stage, list] = {}
         for stage_val, slots in area_data.get(ATTR_SCHEDULE, {}).items():
             stage = Stage(int(stage_val))
-            schedule[stage] = [
-                {
-                    ATTR_STAGE: Stage(int(s[ATTR_STAGE])),
-                    ATTR_START_TIME: datetime.fromisoformat(s[ATTR_START_TIME]),
-                    ATTR_END_TIME: datetime.fromisoformat(s[ATTR_END_TIME]),
-                }
-                for s in slots
-            ]
-        result[area_id] = {ATTR_EVENTS: events, ATTR_SCHEDULE: schedule}
+            schedule[stage] = _decode_slots(slots, timestamps, stage)
+        result[area_id] = {
+            ATTR_EVENTS: _decode_slots(area_data.get(ATTR_EVENTS, {}), timestamps),
+            ATTR_SCHEDULE: schedule,
+        }
     return result
 
 
+def _deserialize_slots_v1(slots: list) -> list:
+    return [
+        Slot(
+            Stage(int(slot[ATTR_STAGE])),
+            datetime.fromisoformat(slot[ATTR_START_TIME]),
+            datetime.fromisoformat(slot[ATTR_END_TIME]),
+        )
+        for slot in slots
+    ]
+
+
+def _migrate_stage_data_v1(stored: dict) -> dict:
+    """Convert version 1 (per-slot ISO strings) stage data to version 2."""
+    return _serialize_stage_data(
+        {
+            zone_id: {
+                ATTR_NAME: zone_data.get(ATTR_NAME, ""),
+                ATTR_PLANNED: _deserialize_slots_v1(zone_data.get(ATTR_PLANNED, [])),
+            }
+            for zone_id, zone_data in stored.items()
+        }
+    )
+
+
+def _migrate_area_data_v1(stored: dict) -> dict:
+    """Convert version 1 (per-slot ISO strings) area data to version 2."""
+    return _serialize_area_data(
+        {
+            area_id: {
+                ATTR_EVENTS: _deserialize_slots_v1(area_data.get(ATTR_EVENTS, [])),
+                ATTR_SCHEDULE: {
+                    Stage(int(stage_val)): _deserialize_slots_v1(slots)
+                    for stage_val, slots in area_data.get(ATTR_SCHEDULE, {}).items()
+                },
+            }
+            for area_id, area_data in stored.items()
+        }
+    )
+
+
+def _payload_digest(payload: dict) -> bytes:
+    """Digest the cached content, leaving out the ``_VOLATILE_KEYS``."""
+    content = {
+        key: value for key, value in payload.items() if key not in _VOLATILE_KEYS
+    }
+    return hashlib.blake2b(json_bytes(content), digest_size=16).digest()
+
+
+def _build_payload(build_payload: Callable[[], dict]) -> tuple[dict, bytes]:
+    payload = build_payload()
+    return payload, _payload_digest(payload)
+
+
+class LoadSheddingStore(Store):
+    """Coordinator cache Store that migrates older cache formats on load."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        key: str,
+        migrate_data_v1: Callable[[dict], dict],
+    ) -> None:
+        """Initialize the store."""
+        super().__init__(hass, version=_STORE_VERSION, key=key)
+        self._migrate_data_v1 = migrate_data_v1
+        # Digest of the payload last loaded from or queued for disk.
+        self._digest: bytes | None = None
+        # Latest payload not yet written, and whether its content changed.
+        self._pending: dict | None = None
+        self._pending_changed = False
+
+    async def async_load(self) -> dict | None:
+        """Load the cache and remember its digest for change detection."""
+        stored = await super().async_load()
+        if stored is not None:
+            self._digest = await self.hass.async_add_executor_job(
+                _payload_digest, stored
+            )
+        return stored
+
+    async def async_save_if_changed(self, build_payload: Callable[[], dict]) -> None:
+        """Queue a coalesced write of ``build_payload()``.
+
+        A change to the cached content is written after ``_SAVE_DELAY``. A
+        payload that only moves ``last_update`` or the quota snapshot is held
+        for the longer ``_IDLE_SAVE_DELAY``, so a content change that follows
+        soon after is written with it. The payload is built and hashed in the
+        executor, because serializing a large area schedule would otherwise
+        block the event loop.
+        """
+        payload, digest = await self.hass.async_add_executor_job(
+            _build_payload, build_payload
+        )
+        if digest != self._digest:
+            self._digest = digest
+            self._pending_changed = True
+        self._pending = payload
+        self.async_delay_save(
+            self._take_pending,
+            _SAVE_DELAY if self._pending_changed else _IDLE_SAVE_DELAY,
+        )
+
+    def _take_pending(self) -> dict:
+        """Return the pending payload for writing; nothing is pending after."""
+        payload, self._pending = self._pending, None
+        self._pending_changed = False
+        return payload
+
+    async def async_flush(self) -> None:
+        """Write the pending payload straight away."""
+        if self._pending is not None:
+            await self.async_save(self._take_pending())
+
+    async def _async_migrate_func(
+        self, old_major_version: int, old_minor_version: int, old_data: dict
+    ) -> dict:
+        """Migrate the cached payload to the current format.
+
+        A cache that cannot be migrated is dropped rather than failing setup;
+        the coordinator then falls back to a live poll.
+        """
+        if old_major_version == 1:
+            try:
+                old_data = {
+                    **old_data,
+                    "data": self._migrate_data_v1(old_data.get("data") or {}),
+                }
+            except (ValueError, TypeError, KeyError, AttributeError):
+                _LOGGER.warning(
+                    "Discarding unreadable %s cache %s", self.key, DIAG_CONTEXT
+                )
+                return {}
+        return old_data
+
+
+def _serialize_invalid_area_ids(invalid_area_ids: dict) -> dict:
+    return {
+        area_id: {
+            "status_code": entry["status_code"],
+            "timestamp": entry["timestamp"].isoformat(),
+        }
+        for area_id, entry in invalid_area_ids.items()
+    }
+
+
+def _deserialize_invalid_area_ids(stored: dict) -> dict:
+    return {
+        area_id: {
+            "status_code": int(entry["status_code"]),
+            "timestamp": datetime.fromisoformat(entry["timestamp"]),
+        }
+        for area_id, entry in stored.items()
+    }
+
+
 # ---------------------------------------------------------------------------
 # Integration setup / teardown
 # ---------------------------------------------------------------------------
@@ -162,6 +378,7 @@ def _deserialize_area_data(stored: dict) -> dict:
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up this integration using YAML is not supported."""
+    async_setup_services(hass)
     return True
 
 
@@ -201,6 +418,9 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
     stage_coordinator.update_interval = timedelta(
         seconds=config_entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
     )
+    stage_coordinator.forecast_horizon = timedelta(
+        days=config_entry.options.get(CONF_FORECAST_DAYS, MAX_FORECAST_DAYS)
+    )
 
     area_coordinator = LoadSheddingAreaCoordinator(
         hass, sepush, stage_coordinator=stage_coordinator,
@@ -209,6 +429,20 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
     area_coordinator.update_interval = timedelta(
         seconds=config_entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
     )
+    area_coordinator.invalid_area_expiry = timedelta(
+        days=config_entry.options.get(
+            CONF_INVALID_AREA_EXPIRY, DEFAULT_INVALID_AREA_EXPIRY
+        )
+    )
+    if projection_stage := config_entry.options.get(CONF_PROJECTION_STAGE):
+        area_coordinator.projection_stage = Stage(projection_stage)
+    area_coordinator.outage_minutes_hours = config_entry.options.get(
+        CONF_OUTAGE_MINUTES_HOURS, 0
+    )
+    area_coordinator.timeline_days = config_entry.options.get(CONF_TIMELINE_DAYS, 0)
+    area_coordinator.minute_countdowns = config_entry.options.get(
+        CONF_MINUTE_COUNTDOWNS, True
+    )
     for conf in config_entry.options.get(CONF_AREAS, []):
         area = Area(
             id=conf.get(CONF_ID),
@@ -232,21 +466,53 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
     # Restore persisted timestamps and data so the first refresh skips the
     # SePush API when the cached values are still within the update interval.
     # This prevents quota exhaustion on every HA restart (#116).
-    await stage_coordinator.async_load_cache()
-    await area_coordinator.async_load_cache()
+    await asyncio.gather(
+        stage_coordinator.async_load_cache(),
+        area_coordinator.async_load_cache(),
+    )
+    # Derive the forecast from the cached schedule so entities start with the
+    # last known data instead of waiting on the SePush network round-trip.
+    await area_coordinator.async_area_forecast()
 
-    await stage_coordinator.async_config_entry_first_refresh()
-    await area_coordinator.async_config_entry_first_refresh()
     await hass.config_entries.async_forward_entry_setups(config_entry, PLATFORMS)
 
+    # Stale-while-revalidate: entities serve the cached data (flagged ``stale``
+    # when it is older than the update interval) while the first refresh runs
+    # in the background, so HA startup never blocks on SePush.
+    config_entry.async_create_task(
+        hass,
+        _async_first_refresh(stage_coordinator, area_coordinator),
+        f"{DOMAIN} first refresh",
+    )
+
     return True
 
 
+async def _async_first_refresh(
+    stage_coordinator: LoadSheddingStageCoordinator,
+    area_coordinator: LoadSheddingAreaCoordinator,
+) -> None:
+    """Refresh stage then area data after setup has completed."""
+    # Area forecasts are derived from the planned stages, so the stage poll must
+    # land first.
+    await stage_coordinator.async_refresh()
+    await area_coordinator.async_refresh()
+
+
 async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
     """Unload Load Shedding Entry from config_entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(
         config_entry, PLATFORMS
     )
+    # Write queued cache saves now so a reload reads the latest data.
+    if coordinators := hass.data.get(DOMAIN, {}).get(config_entry.entry_id):
+        await asyncio.gather(
+            *(coordinator.async_flush_cache() for coordinator in coordinators.values())
+        )
+    # Services look coordinators up in hass.data; drop this entry's so they
+    # stop serving an unloaded entry.
+    if unload_ok:
+        hass.data.get(DOMAIN, {}).pop(config_entry.entry_id, None)
     return unload_ok
 
 
@@ -346,11 +612,24 @@ class LoadSheddingStageCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self.data = {}
         self.sepush = sepush
         self.last_update: datetime | None = None
+        # True while the data was restored from a cache older than the update
+        # interval and no successful poll has replaced it yet.
+        self.stale = False
+        # How far ahead planned stages (and so area forecasts) are kept.
+        self.forecast_horizon = timedelta(days=MAX_FORECAST_DAYS)
         self._entry_id = entry_id
-        self._store: Store = Store(
-            hass, version=_STORE_VERSION, key=f"{DOMAIN}.stage.{entry_id}"
+        # Planned stage boundaries of this entry; see ``TimestampTable``.
+        self._timestamps = TimestampTable()
+        self._store: Store = LoadSheddingStore(
+            hass, f"{DOMAIN}.stage.{entry_id}", _migrate_stage_data_v1
         )
 
+    @property
+    def list_attr_limit(self) -> int:
+        """Return the most slots a list attribute exposes for the horizon."""
+        days = -(-self.forecast_horizon // timedelta(days=1))
+        return MAX_LIST_ATTR_ITEMS_PER_DAY * days
+
     async def async_load_cache(self) -> None:
         """Pre-seed last_update and data from persistent storage.
 
@@ -363,7 +642,11 @@ class LoadSheddingStageCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             return
         with contextlib.suppress(Exception):
             self.last_update = datetime.fromisoformat(stored["last_update"])
-            self.data = _deserialize_stage_data(stored.get("data", {}))
+            now = datetime.now(UTC).replace(microsecond=0)
+            self.data = prune_stage_data(
+                _deserialize_stage_data(stored.get("data", {}), self._timestamps), now
+            )
+            self.stale = should_refresh(self.last_update, now, STAGE_UPDATE_INTERVAL)
             # Seed the SePush rate-limit cache so the quota sensor reads the
             # persisted quota on restart without a blocking refresh, the same
             # way the stage/area data is restored to skip the API (#116).
@@ -373,15 +656,21 @@ class LoadSheddingStageCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 "Restored stage cache (last_update=%s) %s", self.last_update, DIAG_CONTEXT
             )
 
+    async def async_flush_cache(self) -> None:
+        """Write a pending cache save now, e.g. before the entry unloads."""
+        await self._store.async_flush()
+
     async def _save_cache(self) -> None:
         """Persist last_update and data after a successful API poll."""
-        await self._store.async_save(
-            {
-                "last_update": self.last_update.isoformat() if self.last_update else None,
-                "data": _serialize_stage_data(self.data),
-                # Persist the quota snapshot primed by the status() poll so it
-                # can reseed sepush._rate_limit on the next restart.
-                "rate_limit": dict(getattr(self.sepush, "_rate_limit", None) or {}),
+        last_update, data = self.last_update, self.data
+        # Persist the quota snapshot primed by the status() poll so it can
+        # reseed sepush._rate_limit on the next restart.
+        rate_limit = dict(getattr(self.sepush, "_rate_limit", None) or {})
+        await self._store.async_save_if_changed(
+            lambda: {
+                "last_update": last_update.isoformat() if last_update else None,
+                "data": _serialize_stage_data(data),
+                "rate_limit": rate_limit,
             }
         )
 
@@ -390,6 +679,11 @@ class LoadSheddingStageCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
         now = datetime.now(UTC).replace(microsecond=0)
         if not should_refresh(self.last_update, now, STAGE_UPDATE_INTERVAL):
+            # Drop planned stages that ended since the last poll.
+            data = prune_stage_data(self.data, now)
+            if data is not self.data:
+                self.data = data
+                self._timestamps.prune(now)
             return self.data
 
         try:
@@ -410,7 +704,9 @@ class LoadSheddingStageCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             self.data = {}
         else:
             self.data = stage
+            self._timestamps.prune(now)
             self.last_update = now
+            self.stale = False
             await self._save_cache()
             ir.async_delete_issue(
                 self.hass, DOMAIN, f"sepush_api_failure_{self._entry_id}"
@@ -421,6 +717,7 @@ class LoadSheddingStageCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     async def async_update_stage(self) -> dict:
         """Retrieve latest stage."""
         now = datetime.now(UTC).replace(microsecond=0)
+        horizon = now + self.forecast_horizon
         esp = await self.hass.async_add_executor_job(self.sepush.status)
 
         data = {}
@@ -430,43 +727,34 @@ class LoadSheddingStageCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 stage = Stage(int(area.get("stage", "0")))
                 start_time = datetime.fromisoformat(area.get("stage_updated"))
                 start_time = start_time.replace(second=0, microsecond=0)
-                planned = [
-                    {
-                        ATTR_STAGE: stage,
-                        ATTR_START_TIME: start_time.astimezone(UTC),
-                    }
-                ]
+                transitions = [(stage, start_time.astimezone(UTC))]
 
-                next_stages = area.get("next_stages", [])
-                for i, next_stage in enumerate(next_stages):
-                    # Prev
-                    prev_end = datetime.fromisoformat(
-                        next_stage.get("stage_start_timestamp")
-                    )
-                    prev_end = prev_end.replace(second=0, microsecond=0)
-                    planned[i][ATTR_END_TIME] = prev_end.astimezone(UTC)
-
-                    # Next
+                for next_stage in area.get("next_stages", []):
                     stage = Stage(int(next_stage.get("stage", "0")))
                     start_time = datetime.fromisoformat(
                         next_stage.get("stage_start_timestamp")
                     )
                     start_time = start_time.replace(second=0, microsecond=0)
-                    planned.append(
-                        {
-                            ATTR_STAGE: stage,
-                            ATTR_START_TIME: start_time.astimezone(UTC),
-                        }
-                    )
-
+                    transitions.append((stage, start_time.astimezone(UTC)))
+
+                # Each stage runs until the next one starts. The last one is
+                # open-ended; it runs for a horizon from its own start, so its
+                # end stays put from one poll to the next. ``horizon`` only
+                # decides which stages are kept.
+                ends = [start_time for _, start_time in transitions[1:]]
+                ends.append(transitions[-1][1] + self.forecast_horizon)
                 filtered = []
-                for stage in planned:
-                    if ATTR_END_TIME not in stage:
-                        stage[ATTR_END_TIME] = stage[ATTR_START_TIME] + timedelta(
-                            days=7
+                for (stage, start_time), end_time in zip(transitions, ends):
+                    if start_time >= horizon:
+                        break
+                    if end_time >= now:
+                        filtered.append(
+                            Slot(
+                                stage,
+                                self._timestamps.intern(start_time),
+                                self._timestamps.intern(end_time),
+                            )
                         )
-                    if ATTR_END_TIME in stage and stage.get(ATTR_END_TIME) >= now:
-                        filtered.append(stage)
             except (ValueError, TypeError, KeyError, AttributeError):
                 # A malformed entry for one zone must not abort the others.
                 _LOGGER.exception(
@@ -528,16 +816,83 @@ class LoadSheddingAreaCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self.last_update: datetime | None = None
         self.areas: list[Area] = []
         self.stage_coordinator = stage_coordinator
+        # Areas whose data was restored from a cache older than the update
+        # interval and not yet replaced by a successful fetch. Tracked per area
+        # because one area can fail to fetch while the others succeed.
+        self.stale_area_ids: set[str] = set()
         self._entry_id = entry_id
-        self._invalid_area_ids: set[str] = set()
-        self._store: Store = Store(
-            hass, version=_STORE_VERSION, key=f"{DOMAIN}.area.{entry_id}"
+        # Area ids SePush rejected as permanently invalid, mapped to the
+        # ``status_code`` and ``timestamp`` of the rejection. Persisted with the
+        # area cache so a restart does not spend a credit re-discovering them.
+        self._invalid_area_ids: dict[str, dict] = {}
+        self.invalid_area_expiry = timedelta(days=DEFAULT_INVALID_AREA_EXPIRY)
+        # Stage the area sensors project their schedule for, if any.
+        self.projection_stage: Stage | None = None
+        # Window, in hours, of the per-area outage minutes sensors (0 = none).
+        self.outage_minutes_hours = 0
+        # Days covered by the area sensors' compact timeline attribute (0 = off).
+        self.timeline_days = 0
+        # Whether the area sensors carry the per-minute ends_in/starts_in
+        # attributes; the next start/end timestamp sensors replace them.
+        self.minute_countdowns = True
+        # Per-stage index of each area's schedule, rebuilt when it changes.
+        self._timelines: dict[str, StageTimelines] = {}
+        # Forecasts the any/all-areas sweep was computed from, and the sweep.
+        self._sweep: tuple[list, OutageSweep] | None = None
+        # Per area, the forecast its outage minutes index was built from.
+        self._outage_minutes: dict[str, tuple[list, OutageMinutes]] = {}
+        # Event and schedule slot boundaries of this entry's areas, which
+        # neighbouring areas share; see ``TimestampTable``.
+        self._timestamps = TimestampTable()
+        self._vector_engine = VectorForecastEngine() if HAS_NUMPY else None
+        self._store: Store = LoadSheddingStore(
+            hass, f"{DOMAIN}.area.{entry_id}", _migrate_area_data_v1
         )
 
     def add_area(self, area: Area = None) -> None:
         """Add a area to update."""
         self.areas.append(area)
 
+    def outage_sweep(self) -> OutageSweep:
+        """Return when any and when all areas are off.
+
+        Recomputed only when an area's forecast changes, which
+        ``async_area_forecast`` signals by replacing the list.
+        """
+        forecasts = [data.get(ATTR_FORECAST, ()) for data in self.data.values()]
+        if (
+            self._sweep is None
+            or len(self._sweep[0]) != len(forecasts)
+            or not all(map(is_, self._sweep[0], forecasts))
+        ):
+            self._sweep = (forecasts, sweep_outages(forecasts))
+        return self._sweep[1]
+
+    def outage_minutes(self, area_id: str) -> OutageMinutes:
+        """Return the outage minutes index of an area's forecast.
+
+        Rebuilt only when ``async_area_forecast`` replaces the forecast list.
+        """
+        forecast = self.data.get(area_id, {}).get(ATTR_FORECAST, [])
+        cached = self._outage_minutes.get(area_id)
+        if cached is None or cached[0] is not forecast:
+            cached = (forecast, OutageMinutes.from_forecast(forecast))
+            self._outage_minutes[area_id] = cached
+        return cached[1]
+
+    def project_stage(
+        self, area_id: str, stage: Stage, start: datetime, end: datetime
+    ) -> list[Slot]:
+        """Return the outages ``area_id`` would have at ``stage`` in a window.
+
+        Served from the per-stage schedule index the forecasts are spliced
+        from, which ``async_area_forecast`` keeps current.
+        """
+        timeline = self._timelines.get(area_id)
+        if timeline is None:
+            return []
+        return timeline.project(stage, start, end)
+
     async def async_load_cache(self) -> None:
         """Pre-seed last_update and data from persistent storage.
 
@@ -551,17 +906,58 @@ class LoadSheddingAreaCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             return
         with contextlib.suppress(Exception):
             self.last_update = datetime.fromisoformat(stored["last_update"])
-            self.data = _deserialize_area_data(stored.get("data", {}))
+            now = datetime.now(UTC).replace(microsecond=0)
+            self.data = _deserialize_area_data(
+                stored.get("data", {}), self._timestamps
+            )
+            self._prune_expired(now)
+            if should_refresh(self.last_update, now, AREA_UPDATE_INTERVAL):
+                self.stale_area_ids = set(self.data)
             _LOGGER.debug(
                 "Restored area cache (last_update=%s) %s", self.last_update, DIAG_CONTEXT
             )
+        with contextlib.suppress(Exception):
+            await self._async_restore_invalid_area_ids(
+                _deserialize_invalid_area_ids(stored.get("invalid_area_ids", {}))
+            )
+
+    async def _async_restore_invalid_area_ids(self, invalid_area_ids: dict) -> None:
+        """Honour persisted invalid area ids without another API call.
+
+        Expired entries and ids that are no longer configured (e.g. the area was
+        removed and re-added) are dropped and the pruned set is written back, so
+        the area is retried on the next poll. Surviving entries re-raise the
+        Repairs issue straight away.
+        """
+        now = datetime.now(UTC).replace(microsecond=0)
+        self._invalid_area_ids = prune_invalid_area_ids(
+            invalid_area_ids,
+            (area.id for area in self.areas),
+            now,
+            self.invalid_area_expiry,
+        )
+        if self._invalid_area_ids:
+            self._create_invalid_area_issue()
+        else:
+            ir.async_delete_issue(
+                self.hass, DOMAIN, f"invalid_area_ids_{self._entry_id}"
+            )
+        if len(self._invalid_area_ids) != len(invalid_area_ids):
+            await self._save_cache()
+
+    async def async_flush_cache(self) -> None:
+        """Write a pending cache save now, e.g. before the entry unloads."""
+        await self._store.async_flush()
 
     async def _save_cache(self) -> None:
         """Persist last_update and data after a successful API poll."""
-        await self._store.async_save(
-            {
-                "last_update": self.last_update.isoformat() if self.last_update else None,
-                "data": _serialize_area_data(self.data),
+        last_update, data = self.last_update, dict(self.data)
+        invalid_area_ids = dict(self._invalid_area_ids)
+        await self._store.async_save_if_changed(
+            lambda: {
+                "last_update": last_update.isoformat() if last_update else None,
+                "data": _serialize_area_data(data),
+                "invalid_area_ids": _serialize_invalid_area_ids(invalid_area_ids),
             }
         )
 
@@ -570,6 +966,7 @@ class LoadSheddingAreaCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
         now = datetime.now(UTC).replace(microsecond=0)
         if not should_refresh(self.last_update, now, AREA_UPDATE_INTERVAL):
+            self._prune_expired(now)
             await self.async_area_forecast()
             return self.data
 
@@ -589,15 +986,36 @@ class LoadSheddingAreaCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             # schedule instead of disappearing until the next update interval.
             self.data = {**self.data, **area}
             self.last_update = now
+            self.stale_area_ids.difference_update(area)
+            # SePush returns today's schedule from midnight; keep only what is
+            # still to come in memory and in the cache.
+            self._prune_expired(now)
             await self._save_cache()
 
         await self.async_area_forecast()
         return self.data
 
+    def _prune_expired(self, now: datetime) -> None:
+        """Drop event and schedule slots that ended before ``now``.
+
+        Areas with nothing to drop keep their data (and forecast) objects.
+        """
+        self.data = {
+            area_id: prune_area_data(area_data, now)
+            for area_id, area_data in self.data.items()
+        }
+
     async def async_update_area(self) -> dict:
         """Retrieve area data."""
         area_id_data: dict = {}
 
+        now = datetime.now(UTC).replace(microsecond=0)
+        self._invalid_area_ids = prune_invalid_area_ids(
+            self._invalid_area_ids,
+            (area.id for area in self.areas),
+            now,
+            self.invalid_area_expiry,
+        )
         for area in self.areas:
             if area.id in self._invalid_area_ids:
                 _LOGGER.debug(
@@ -616,7 +1034,10 @@ class LoadSheddingAreaCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                         area.id,
                         DIAG_CONTEXT,
                     )
-                    self._invalid_area_ids.add(area.id)
+                    self._invalid_area_ids[area.id] = {
+                        "status_code": err.status_code,
+                        "timestamp": now,
+                    }
                     self._create_invalid_area_issue()
                 else:
                     _LOGGER.error(
@@ -643,14 +1064,10 @@ class LoadSheddingAreaCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
                     start = datetime.fromisoformat(event.get("start")).astimezone(UTC)
                     end = datetime.fromisoformat(event.get("end")).astimezone(UTC)
+                    start = self._timestamps.intern(start)
+                    end = self._timestamps.intern(end)
 
-                    events.append(
-                        {
-                            ATTR_STAGE: stage,
-                            ATTR_START_TIME: start,
-                            ATTR_END_TIME: end,
-                        }
-                    )
+                    events.append(Slot(stage, start, end))
 
                 # Get schedule for area
                 stage_schedule = {}
@@ -668,11 +1085,11 @@ class LoadSheddingAreaCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                             if end < start:
                                 end = end + timedelta(days=1)
                             stage_schedule[stage].append(
-                                {
-                                    ATTR_STAGE: stage,
-                                    ATTR_START_TIME: start,
-                                    ATTR_END_TIME: end,
-                                }
+                                Slot(
+                                    stage,
+                                    self._timestamps.intern(start),
+                                    self._timestamps.intern(end),
+                                )
                             )
             except (ValueError, TypeError, KeyError, AttributeError):
                 # A malformed payload for one area must not abort the others.
@@ -708,81 +1125,68 @@ class LoadSheddingAreaCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             CONF_MIN_EVENT_DURATION, 30
         )  # minutes
         min_event_duration = timedelta(minutes=min_event_dur)
+        # Slots starting beyond the horizon are left out of the forecast.
+        now = datetime.now(UTC).replace(microsecond=0)
+        horizon = now + self.stage_coordinator.forecast_horizon
 
-        for area_id, data in self.data.items():
-            stage_schedules = data.get(ATTR_SCHEDULE)
-
-            planned_stages = (
+        timelines = self._stage_timelines(min_event_duration)
+        forecasts = {}
+        unspliceable = {}
+        for area_id, timeline in timelines.items():
+            planned = (
                 cape_town_stages if area_id.startswith(cape_town) else eskom_stages
             )
-            forecast = []
-            for planned in planned_stages:
-                planned_stage = planned.get(ATTR_STAGE)
-                planned_start_time = planned.get(ATTR_START_TIME)
-                planned_end_time = planned.get(ATTR_END_TIME)
-
-                if planned_stage in [Stage.NO_LOAD_SHEDDING]:
-                    continue
-
-                schedule = stage_schedules.get(planned_stage, [])
-
-                for timeslot in schedule:
-                    start_time = timeslot.get(ATTR_START_TIME)
-                    end_time = timeslot.get(ATTR_END_TIME)
-
-                    if start_time >= planned_end_time:
-                        continue
-                    if end_time <= planned_start_time:
-                        continue
-
-                    # Clip schedules that overlap planned start time and end time
-                    if (
-                        start_time <= planned_start_time
-                        and end_time <= planned_end_time
-                    ):
-                        start_time = planned_start_time
-                    if (
-                        start_time >= planned_start_time
-                        and end_time >= planned_end_time
-                    ):
-                        end_time = planned_end_time
-
-                    if start_time == end_time:
-                        continue
-
-                    # Minimum event duration
-                    if end_time - start_time < min_event_duration:
-                        continue
-
-                    forecast.append(
-                        {
-                            ATTR_STAGE: planned_stage,
-                            ATTR_START_TIME: start_time,
-                            ATTR_END_TIME: end_time,
-                        }
-                    )
-
-            if not forecast:
-                events = data.get(ATTR_EVENTS)
-
-                for timeslot in events:
-                    stage = timeslot.get(ATTR_STAGE)
-                    start_time = timeslot.get(ATTR_START_TIME)
-                    end_time = timeslot.get(ATTR_END_TIME)
-
-                    # Minimum event duration
-                    if end_time - start_time < min_event_duration:
-                        continue
-
-                    forecast.append(
-                        {
-                            ATTR_STAGE: stage,
-                            ATTR_START_TIME: start_time,
-                            ATTR_END_TIME: end_time,
-                        }
-                    )
-
-            data[ATTR_FORECAST] = forecast
+            if timeline.spliceable:
+                forecasts[area_id] = timeline.forecast(planned, horizon)
+            else:
+                unspliceable[area_id] = (timeline.schedule, timeline.events, planned)
+        if self._vector_engine is not None and len(unspliceable) >= _VECTOR_MIN_AREAS:
+            forecasts.update(
+                self._vector_engine.forecasts(
+                    unspliceable, min_event_duration, horizon
+                )
+            )
+        else:
+            for area_id, (_, _, planned) in unspliceable.items():
+                forecasts[area_id] = timelines[area_id].forecast(planned, horizon)
+
+        replaced = False
+        for area_id, forecast in forecasts.items():
+            data = self.data[area_id]
+            # Keep the existing list when nothing changed so consumers can
+            # skip unchanged areas by identity.
+            if forecast != data.get(ATTR_FORECAST):
+                data[ATTR_FORECAST] = forecast
+                replaced = True
+        # Ended slots leave a forecast by replacing it, so only then can the
+        # table hold instants nothing refers to any more.
+        if replaced:
+            self._timestamps.prune(now)
+
+    def _stage_timelines(
+        self, min_event_duration: timedelta
+    ) -> dict[str, StageTimelines]:
+        """Return each area's ``StageTimelines``, re-indexing changed schedules.
+
+        A stage announcement leaves the schedules alone, so applying it only
+        splices the existing indexes.
+        """
+        timelines = {}
+        for area_id, data in self.data.items():
+            schedule, events = data.get(ATTR_SCHEDULE), data.get(ATTR_EVENTS)
+            timeline = self._timelines.get(area_id)
+            if (
+                timeline is None
+                or timeline.schedule is not schedule
+                or timeline.events is not events
+                or timeline.min_event_duration != min_event_duration
+            ):
+                timeline = StageTimelines(
+                    schedule, events, min_event_duration, timeline
+                )
+            timelines[area_id] = timeline
+        self._timelines = timelines
+        return timelines
 
     def _create_invalid_area_issue(self) -> None:
         """Create a Repairs issue listing all permanently-invalid area IDs."""
@@ -1,6 +1,7 @@
 """Support for the LoadShedding service."""
 from __future__ import annotations
 
+from collections import OrderedDict
 from datetime import UTC, datetime
 
 from homeassistant.components.calendar import (
@@ -15,7 +16,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import LoadSheddingDevice
-from .helpers import build_calendar_events, current_event, events_in_range
+from .helpers import EventIndex, area_calendar_events, merge_calendar_events
 from .const import (
     ATTR_AREA,
     ATTR_FORECAST,
@@ -24,6 +25,10 @@ from .const import (
     NAME,
 )
 
+# Materialized async_get_events() results kept per calendar. The frontend
+# re-requests the same month/week windows while a dashboard is open.
+RANGE_CACHE_SIZE = 8
+
 
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
@@ -59,9 +64,16 @@ class LoadSheddingForecastCalendar(
         )
         self.entity_id = f"{CALENDAR_DOMAIN}.{DOMAIN}_forecast"
         self.multi_stage_events = multi_stage_events
-        # Cache of built event dicts; rebuilt only when coordinator data
+        # Index of built event dicts; rebuilt only when coordinator data
         # changes rather than on every property/read access (review L5).
-        self._event_dicts: list[dict] | None = None
+        self._event_index: EventIndex | None = None
+        # Per-area events with the forecast list and mode they were built
+        # from, so an update only rebuilds the areas whose forecast changed.
+        self._area_events: dict[str, tuple[list | None, bool, list[dict]]] = {}
+        # Bumped whenever the index is rebuilt, so cached ranges from older
+        # data are never served.
+        self._generation = 0
+        self._range_cache: OrderedDict[tuple, list[CalendarEvent]] = OrderedDict()
 
     @property
     def name(self) -> str | None:
@@ -77,30 +89,55 @@ class LoadSheddingForecastCalendar(
         holding on to a stale event.
         """
         now = datetime.now(UTC)
-        event = current_event(self._get_event_dicts(), now)
+        event = self._get_event_index().current(now)
         return self._to_calendar_event(event) if event else None
 
-    def _get_event_dicts(self) -> list[dict]:
-        """Return the cached event dicts, building them on first use.
+    def _get_event_index(self) -> EventIndex:
+        """Return the cached event index, building it on first use.
 
         The event list depends only on the coordinator data (not on the current
         time), so it is cached and invalidated in ``_handle_coordinator_update``.
         """
-        if self._event_dicts is None:
-            self._event_dicts = self._build_event_dicts()
-        return self._event_dicts
-
-    def _build_event_dicts(self) -> list[dict]:
-        """Build the ordered list of forecast events as plain dicts."""
-        area_forecasts = [
-            {
-                "id": area.id,
-                "name": area.name,
-                ATTR_FORECAST: self.data.get(area.id, {}).get(ATTR_FORECAST),
-            }
-            for area in self.coordinator.areas
-        ]
-        return build_calendar_events(area_forecasts, self.multi_stage_events)
+        if self._event_index is None:
+            self._update_area_events()
+            self._event_index = EventIndex(self._merge_area_events())
+        return self._event_index
+
+    def _update_area_events(self) -> bool:
+        """Rebuild the events of areas whose forecast changed.
+
+        The coordinator only replaces an area's forecast list when it changes,
+        so an unchanged list (by identity) reuses that area's events. Returns
+        whether any area's events changed.
+        """
+        area_events = {}
+        area_ids = {area.id for area in self.coordinator.areas}
+        changed = set(self._area_events) != area_ids
+        for area in self.coordinator.areas:
+            forecast = self.data.get(area.id, {}).get(ATTR_FORECAST)
+            cached = self._area_events.get(area.id)
+            if (
+                cached is None
+                or cached[0] is not forecast
+                or cached[1] != self.multi_stage_events
+            ):
+                cached = (
+                    forecast,
+                    self.multi_stage_events,
+                    area_calendar_events(
+                        forecast, area.name, self.multi_stage_events
+                    ),
+                )
+                changed = True
+            area_events[area.id] = cached
+        self._area_events = area_events
+        return changed
+
+    def _merge_area_events(self) -> list[dict]:
+        """Return all areas' events as one list ordered by start."""
+        return merge_calendar_events(
+            events for _, _, events in self._area_events.values()
+        )
 
     @staticmethod
     def _to_calendar_event(event: dict) -> CalendarEvent:
@@ -120,16 +157,31 @@ class LoadSheddingForecastCalendar(
         end_date: datetime,
     ) -> list[CalendarEvent]:
         """Return calendar events within a datetime range."""
-        events = events_in_range(self._get_event_dicts(), start_date, end_date)
-        return [self._to_calendar_event(event) for event in events]
+        key = (self._generation, start_date, end_date)
+        if (events := self._range_cache.get(key)) is not None:
+            self._range_cache.move_to_end(key)
+            return events
+        events = [
+            self._to_calendar_event(event)
+            for event in self._get_event_index().in_range(start_date, end_date)
+        ]
+        self._range_cache[key] = events
+        if len(self._range_cache) > RANGE_CACHE_SIZE:
+            self._range_cache.popitem(last=False)
+        return events
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
         if data := self.coordinator.data:
             self.data = data
-        # Rebuild the cached event list now that the data changed; writing state
-        # re-reads the live ``event`` property so the calendar reflects (or
-        # clears) the current event.
-        self._event_dicts = self._build_event_dicts()
+        # The coordinator pushes every scan interval. Only a changed forecast
+        # needs a new state: event starts and ends in between are written at
+        # the exact time by the alarms CalendarEntity.async_write_ha_state sets.
+        if not self._update_area_events() and self._event_index is not None:
+            return
+        # Writing state re-reads the live ``event`` property so the calendar
+        # reflects (or clears) the current event.
+        self._event_index = EventIndex(self._merge_area_events())
+        self._generation += 1
         self.async_write_ha_state()
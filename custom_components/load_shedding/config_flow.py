@@ -33,11 +33,19 @@ from .const import (
     CONF_AREA_ID,
     CONF_AREAS,
     CONF_DELETE_AREA,
+    CONF_FORECAST_DAYS,
+    CONF_INVALID_AREA_EXPIRY,
     CONF_MIN_EVENT_DURATION,
+    CONF_MINUTE_COUNTDOWNS,
     CONF_MULTI_STAGE_EVENTS,
+    CONF_OUTAGE_MINUTES_HOURS,
+    CONF_PROJECTION_STAGE,
     CONF_SEARCH,
     CONF_SETUP_API,
+    CONF_TIMELINE_DAYS,
+    DEFAULT_INVALID_AREA_EXPIRY,
     DOMAIN,
+    MAX_FORECAST_DAYS,
     NAME,
     VERSION,
 )
@@ -341,6 +349,18 @@ class LoadSheddingOptionsFlowHandler(OptionsFlowWithConfigEntry):
             self.options[CONF_MIN_EVENT_DURATION] = user_input.get(
                 CONF_MIN_EVENT_DURATION
             )
+            self.options[CONF_INVALID_AREA_EXPIRY] = user_input.get(
+                CONF_INVALID_AREA_EXPIRY
+            )
+            self.options[CONF_FORECAST_DAYS] = user_input.get(CONF_FORECAST_DAYS)
+            self.options[CONF_PROJECTION_STAGE] = user_input.get(CONF_PROJECTION_STAGE)
+            self.options[CONF_OUTAGE_MINUTES_HOURS] = user_input.get(
+                CONF_OUTAGE_MINUTES_HOURS
+            )
+            self.options[CONF_TIMELINE_DAYS] = user_input.get(CONF_TIMELINE_DAYS)
+            self.options[CONF_MINUTE_COUNTDOWNS] = user_input.get(
+                CONF_MINUTE_COUNTDOWNS
+            )
             return self.async_create_entry(title=NAME, data=self.options)
 
         OPTIONS_SCHEMA = vol.Schema(
@@ -354,6 +374,32 @@ class LoadSheddingOptionsFlowHandler(OptionsFlowWithConfigEntry):
                     CONF_MIN_EVENT_DURATION,
                     default=self.options.get(CONF_MIN_EVENT_DURATION, 30),
                 ): int,
+                vol.Optional(
+                    CONF_INVALID_AREA_EXPIRY,
+                    default=self.options.get(
+                        CONF_INVALID_AREA_EXPIRY, DEFAULT_INVALID_AREA_EXPIRY
+                    ),
+                ): vol.All(int, vol.Range(min=1)),
+                vol.Optional(
+                    CONF_FORECAST_DAYS,
+                    default=self.options.get(CONF_FORECAST_DAYS, MAX_FORECAST_DAYS),
+                ): vol.All(int, vol.Range(min=1, max=MAX_FORECAST_DAYS)),
+                vol.Optional(
+                    CONF_PROJECTION_STAGE,
+                    default=self.options.get(CONF_PROJECTION_STAGE, 0),
+                ): vol.All(int, vol.Range(min=0, max=8)),
+                vol.Optional(
+                    CONF_OUTAGE_MINUTES_HOURS,
+                    default=self.options.get(CONF_OUTAGE_MINUTES_HOURS, 0),
+                ): vol.All(int, vol.Range(min=0, max=MAX_FORECAST_DAYS * 24)),
+                vol.Optional(
+                    CONF_TIMELINE_DAYS,
+                    default=self.options.get(CONF_TIMELINE_DAYS, 0),
+                ): vol.All(int, vol.Range(min=0, max=MAX_FORECAST_DAYS)),
+                vol.Optional(
+                    CONF_MINUTE_COUNTDOWNS,
+                    default=self.options.get(CONF_MINUTE_COUNTDOWNS, True),
+                ): bool,
             }
         )
         return self.async_show_form(
@@ -9,6 +9,9 @@ API: Final = "API"
 ATTRIBUTION: Final = "Data provided by {provider}"
 DOMAIN: Final = "load_shedding"
 MAX_FORECAST_DAYS: Final = 7
+# Most slots exposed in a forecast/planned list attribute per day of the forecast
+# horizon (a stage 8 day has up to 6 outages); the calendar has the rest.
+MAX_LIST_ATTR_ITEMS_PER_DAY: Final = 8
 NAME: Final = "Load Shedding"
 MANUFACTURER: Final = "@wernerhp"
 VERSION: Final = json.loads(
@@ -18,6 +21,7 @@ DEFAULT_SCAN_INTERVAL: Final = 60  # 60sec / every minute
 AREA_UPDATE_INTERVAL: Final = 86400  # 60sec * 60min * 24h / every day
 QUOTA_UPDATE_INTERVAL: Final = 3600  # 60sec * 60min       / every hour
 STAGE_UPDATE_INTERVAL: Final = 3600  # 60sec * 60min       / every hourly
+DEFAULT_INVALID_AREA_EXPIRY: Final = 7  # days an invalid area id stays skipped
 
 CONF_DEFAULT_SCHEDULE_STAGE: Final = "default_schedule_stage"
 CONF_MUNICIPALITY: Final = "municipality"
@@ -34,6 +38,12 @@ CONF_DELETE_AREA = "delete_area"
 CONF_SETUP_API = "setup_api"
 CONF_MULTI_STAGE_EVENTS = "multi_stage_events"
 CONF_MIN_EVENT_DURATION = "min_event_duration"
+CONF_INVALID_AREA_EXPIRY = "invalid_area_expiry"
+CONF_FORECAST_DAYS = "forecast_days"
+CONF_PROJECTION_STAGE = "projection_stage"
+CONF_OUTAGE_MINUTES_HOURS = "outage_minutes_hours"
+CONF_TIMELINE_DAYS = "timeline_days"
+CONF_MINUTE_COUNTDOWNS = "minute_countdowns"
 CONF_API_KEY: Final = "api_key"
 CONF_AREA: Final = "area"
 CONF_AREAS: Final = "areas"
@@ -49,24 +59,39 @@ ATTR_AREA: Final = "area"
 ATTR_AREAS: Final = "areas"
 ATTR_AREA_ID: Final = "area_id"
 ATTR_CURRENT: Final = "current"
+ATTR_DURATION: Final = "duration"
+ATTR_END: Final = "end"
 ATTR_END_IN: Final = "ends_in"
 ATTR_END_TIME: Final = "end_time"
 ATTR_EVENTS: Final = "events"
 ATTR_FORECAST: Final = "forecast"
 ATTR_FORECAST_CALENDAR: Final = "forecast_calendar"
+ATTR_HORIZON: Final = "horizon"
 ATTR_LAST_UPDATE: Final = "last_update"
 ATTR_NEXT: Final = "next"
 ATTR_NEXT_END_TIME: Final = "next_end_time"
 ATTR_NEXT_STAGE: Final = "next_stage"
 ATTR_NEXT_START_TIME: Final = "next_start_time"
+ATTR_OUTAGES: Final = "outages"
 ATTR_PLANNED: Final = "planned"
+ATTR_PROJECTION: Final = "projection"
+ATTR_STAGES: Final = "stages"
 ATTR_QUOTA: Final = "quota"
 ATTR_SCHEDULE: Final = "schedule"
 ATTR_SCHEDULES: Final = "schedules"
 ATTR_SCHEDULE_STAGE: Final = "schedule_stage"
+ATTR_STALE: Final = "stale"
 ATTR_STAGE: Final = "stage"
 ATTR_STAGE_DATA: Final = "stage_data"
 ATTR_STAGE_FORECAST: Final = "stage_forecast"
+ATTR_START: Final = "start"
 ATTR_START_IN: Final = "starts_in"
 ATTR_START_TIME: Final = "start_time"
 ATTR_TIME_UNTIL: Final = "time_until"
+ATTR_TIMELINE: Final = "timeline"
+ATTR_UNAVAILABLE_AREAS: Final = "unavailable_areas"
+ATTR_WINDOWS: Final = "windows"
+
+SERVICE_FIND_FREE_WINDOWS: Final = "find_free_windows"
+SERVICE_OUTAGE_MINUTES: Final = "outage_minutes"
+SERVICE_PROJECT_STAGE: Final = "project_stage"
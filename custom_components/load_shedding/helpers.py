@@ -7,10 +7,24 @@ modules import these functions and supply the HA-specific glue (entity classes,
 """
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable
+from datetime import UTC, datetime, timedelta
+from functools import lru_cache
+import heapq
+from itertools import accumulate
+from operator import attrgetter, is_, itemgetter
+from typing import NamedTuple
 
 from load_shedding.providers import Stage
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; ``area_forecast`` needs nothing extra.
+    np = None
+
+HAS_NUMPY = np is not None
+
 # Support both the Home Assistant runtime (package submodule, ``__package__``
 # set) and the standalone unit tests that put the component dir on ``sys.path``
 # and ``import helpers`` directly (``__package__`` empty). An explicit check
@@ -19,12 +33,14 @@ if __package__:
     from .const import (
         ATTR_END_IN,
         ATTR_END_TIME,
+        ATTR_EVENTS,
         ATTR_FORECAST,
         ATTR_FORECAST_CALENDAR,
         ATTR_NEXT_END_TIME,
         ATTR_NEXT_STAGE,
         ATTR_NEXT_START_TIME,
         ATTR_PLANNED,
+        ATTR_SCHEDULE,
         ATTR_STAGE,
         ATTR_START_IN,
         ATTR_START_TIME,
@@ -33,18 +49,82 @@ else:
     from const import (  # type: ignore[no-redef]
         ATTR_END_IN,
         ATTR_END_TIME,
+        ATTR_EVENTS,
         ATTR_FORECAST,
         ATTR_FORECAST_CALENDAR,
         ATTR_NEXT_END_TIME,
         ATTR_NEXT_STAGE,
         ATTR_NEXT_START_TIME,
         ATTR_PLANNED,
+        ATTR_SCHEDULE,
         ATTR_STAGE,
         ATTR_START_IN,
         ATTR_START_TIME,
     )
 
 
+# ``str(Stage)`` builds a lookup dict on every call, so each label is computed
+# once here and shared by every slot, block and calendar event.
+STAGE_LABELS: dict[Stage, str] = {stage: str(stage) for stage in Stage}
+
+
+def stage_label(stage: Stage) -> str:
+    """Return the display label of ``stage``, e.g. "Stage 2"."""
+    label = STAGE_LABELS.get(stage)
+    return label if label is not None else str(stage)
+
+
+@lru_cache(maxsize=256)
+def join_stage_labels(labels: tuple[str, ...]) -> str:
+    """Return the merged label of a multi-stage block, e.g. "Stage 2/Stage 4"."""
+    return "/".join(labels)
+
+
+class TimestampTable:
+    """Hand out one shared ``datetime`` object per distinct UTC instant.
+
+    Areas in the same block share their slot boundaries. Each coordinator
+    routes the times it parses and decodes through its own table, keeping a
+    single object per instant instead of one per slot.
+    Values must be UTC: equal instants in other zones would compare equal but
+    render differently.
+    """
+
+    __slots__ = ("_by_minute", "_values")
+
+    def __init__(self) -> None:
+        self._values: dict[datetime, datetime] = {}
+        self._by_minute: dict[int, datetime] = {}
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def intern(self, value: datetime) -> datetime:
+        """Return the shared object for ``value``."""
+        return self._values.setdefault(value, value)
+
+    def from_minutes(self, minutes: int) -> datetime:
+        """Return the shared datetime ``minutes`` after the Unix epoch."""
+        value = self._by_minute.get(minutes)
+        if value is None:
+            value = self.intern(datetime.fromtimestamp(minutes * 60, UTC))
+            self._by_minute[minutes] = value
+        return value
+
+    def prune(self, before: datetime) -> None:
+        """Forget the instants before ``before``.
+
+        Slots still holding them are unaffected; a later parse of the same
+        instant just starts a new shared object.
+        """
+        self._values = {
+            key: value for key, value in self._values.items() if key >= before
+        }
+        self._by_minute = {
+            key: value for key, value in self._by_minute.items() if value >= before
+        }
+
+
 def should_refresh(
     last_update: datetime | None, now: datetime, interval: int
 ) -> bool:
@@ -62,48 +142,589 @@ def should_refresh(
     return not (0 < diff < interval)
 
 
-def continuous_block_end(forecast: list, start_index: int) -> tuple[datetime, int]:
-    """Return ``(end_time, next_index)`` for a continuous outage block.
+def prune_invalid_area_ids(
+    invalid_area_ids: dict, configured_ids, now: datetime, max_age: timedelta
+) -> dict:
+    """Return the invalid-area entries that should still be honoured.
 
-    Walks forward across back-to-back slots (one slot's end equals the next
-    slot's start) so the end reflects the true continuous outage even when the
-    stage changes mid-block. ``next_index`` is the first slot not in the block.
+    ``invalid_area_ids`` maps an area id to ``{"status_code", "timestamp"}``.
+    Entries are dropped once they are older than ``max_age`` (so the id is
+    retried) or when the id is no longer configured, which is how removing and
+    re-adding an area clears it.
     """
-    end_time = forecast[start_index][ATTR_END_TIME]
-    index = start_index + 1
-    while index < len(forecast) and forecast[index][ATTR_START_TIME] == end_time:
-        end_time = forecast[index][ATTR_END_TIME]
+    configured_ids = set(configured_ids)
+    return {
+        area_id: entry
+        for area_id, entry in invalid_area_ids.items()
+        if area_id in configured_ids and now - entry["timestamp"] < max_age
+    }
+
+
+class Slot(NamedTuple):
+    """One load shedding slot: ``stage`` from ``start_time`` until ``end_time``.
+
+    Used for planned stages, area events, schedules and forecasts alike. Field
+    names match the ``stage``/``start_time``/``end_time`` attribute keys, so
+    ``_asdict()`` gives the dict exposed in state attributes.
+    """
+
+    stage: Stage
+    start_time: datetime
+    end_time: datetime
+
+
+class ForecastBlock(NamedTuple):
+    """A run of back-to-back forecast slots (one slot's end is the next start)."""
+
+    first: int
+    """Index of the block's first slot."""
+    stop: int
+    """Index after the block's last slot."""
+    labels: tuple[str, ...]
+    """Distinct stage labels in the block, in order of appearance."""
+
+
+def forecast_blocks(forecast: list) -> list[ForecastBlock]:
+    """Return the run-length table of contiguous blocks in ``forecast``.
+
+    Computed in one pass; ``continuous_block_end``, ``summarize_forecast``,
+    ``merge_forecast`` and ``ForecastTimeline`` all read block boundaries and
+    merged labels from it instead of re-walking the slots.
+    """
+    blocks: list[ForecastBlock] = []
+    first = 0
+    labels: dict[str, None] = {}
+    for index, slot in enumerate(forecast):
+        if index and forecast[index - 1].end_time != slot.start_time:
+            blocks.append(ForecastBlock(first, index, tuple(labels)))
+            first, labels = index, {}
+        labels[stage_label(slot.stage)] = None
+    if forecast:
+        blocks.append(ForecastBlock(first, len(forecast), tuple(labels)))
+    return blocks
+
+
+def _block_containing(blocks: list[ForecastBlock], index: int) -> ForecastBlock:
+    return blocks[bisect_right(blocks, index, key=attrgetter("first")) - 1]
+
+
+def drop_ended(slots: list, now: datetime) -> list:
+    """Return ``slots`` without the leading slots that ended before ``now``.
+
+    Slots are start-ordered with ends in the same order, so ended slots form a
+    prefix. ``slots`` itself is returned when nothing ended, letting callers
+    detect a change by identity.
+    """
+    index = 0
+    while index < len(slots) and slots[index].end_time < now:
         index += 1
-    return end_time, index
+    return slots[index:] if index else slots
+
+
+def prune_area_data(area_data: dict, now: datetime) -> dict:
+    """Return ``area_data`` with ended event and schedule slots dropped.
+
+    ``area_data`` itself is returned when nothing ended. The derived forecast
+    is carried over as is; it is recomputed from the pruned schedule.
+    """
+    events = area_data.get(ATTR_EVENTS, [])
+    pruned_events = drop_ended(events, now)
+    schedule = area_data.get(ATTR_SCHEDULE, {})
+    pruned_schedule = {
+        stage: drop_ended(slots, now) for stage, slots in schedule.items()
+    }
+    if pruned_events is events and all(
+        pruned_schedule[stage] is slots for stage, slots in schedule.items()
+    ):
+        return area_data
+    return {**area_data, ATTR_EVENTS: pruned_events, ATTR_SCHEDULE: pruned_schedule}
+
+
+def prune_stage_data(stage_data: dict, now: datetime) -> dict:
+    """Return ``stage_data`` with ended planned stages dropped.
+
+    ``stage_data`` itself is returned when nothing ended.
+    """
+    pruned: dict = {}
+    changed = False
+    for zone_id, zone_data in stage_data.items():
+        planned = zone_data.get(ATTR_PLANNED, [])
+        pruned_planned = drop_ended(planned, now)
+        if pruned_planned is not planned:
+            zone_data = {**zone_data, ATTR_PLANNED: pruned_planned}
+            changed = True
+        pruned[zone_id] = zone_data
+    return pruned if changed else stage_data
+
+
+def continuous_block_end(
+    forecast: list, start_index: int, blocks: list[ForecastBlock] | None = None
+) -> tuple[datetime, int]:
+    """Return ``(end_time, next_index)`` for a continuous outage block.
+
+    Spans back-to-back slots (one slot's end equals the next slot's start) so
+    the end reflects the true continuous outage even when the stage changes
+    mid-block. ``next_index`` is the first slot not in the block. Pass the
+    ``blocks`` table of ``forecast`` when making several lookups.
+    """
+    if blocks is None:
+        blocks = forecast_blocks(forecast)
+    block = _block_containing(blocks, start_index)
+    return forecast[block.stop - 1].end_time, block.stop
 
 
-def merge_forecast(forecast: list) -> list:
+def merge_forecast(
+    forecast: list, blocks: list[ForecastBlock] | None = None
+) -> list:
     """Merge back-to-back forecast slots into calendar-style blocks.
 
     Contiguous slots are combined into one entry; when the stage changes across
     the block the stage labels are joined (e.g. "Stage 2/Stage 4").
     """
-    merged: list = []
-    for slot in forecast:
-        start = slot.get(ATTR_START_TIME)
-        end = slot.get(ATTR_END_TIME)
-        stage = str(slot.get(ATTR_STAGE))
-
-        if merged and merged[-1][ATTR_END_TIME] == start:
-            prev = merged[-1]
-            prev[ATTR_END_TIME] = end
-            if stage not in prev[ATTR_STAGE].split("/"):
-                prev[ATTR_STAGE] = f"{prev[ATTR_STAGE]}/{stage}"
-        else:
-            merged.append(
-                {
-                    ATTR_STAGE: stage,
-                    ATTR_START_TIME: start,
-                    ATTR_END_TIME: end,
-                }
+    if blocks is None:
+        blocks = forecast_blocks(forecast)
+    return [
+        {
+            ATTR_STAGE: join_stage_labels(block.labels),
+            ATTR_START_TIME: forecast[block.first].start_time,
+            ATTR_END_TIME: forecast[block.stop - 1].end_time,
+        }
+        for block in blocks
+    ]
+
+
+def area_forecast(
+    schedule: dict,
+    events: list,
+    planned: list,
+    min_event_duration: timedelta,
+    horizon: datetime,
+) -> list:
+    """Derive an area's forecast from its schedule and the planned stages.
+
+    Each planned stage's schedule slots are clipped to the stage window; slots
+    shorter than ``min_event_duration`` or starting at/after ``horizon`` are
+    dropped. Without a planned stage producing anything, the area's own
+    ``events`` are used instead. Unclipped slots are the schedule's objects.
+    """
+    forecast = []
+    for planned_stage, planned_start_time, planned_end_time in planned:
+        if planned_stage in [Stage.NO_LOAD_SHEDDING]:
+            continue
+
+        for timeslot in schedule.get(planned_stage, []):
+            _, start_time, end_time = timeslot
+
+            if start_time >= planned_end_time or start_time >= horizon:
+                continue
+            if end_time <= planned_start_time:
+                continue
+
+            # Clip schedules that overlap planned start time and end time
+            if start_time <= planned_start_time and end_time <= planned_end_time:
+                start_time = planned_start_time
+            if start_time >= planned_start_time and end_time >= planned_end_time:
+                end_time = planned_end_time
+
+            if start_time == end_time:
+                continue
+
+            # Minimum event duration
+            if end_time - start_time < min_event_duration:
+                continue
+
+            # Unclipped slots are shared with the schedule.
+            if (start_time, end_time) != timeslot[1:]:
+                timeslot = Slot(planned_stage, start_time, end_time)
+            forecast.append(timeslot)
+
+    if not forecast:
+        forecast = _event_forecast(events, min_event_duration, horizon)
+
+    return forecast
+
+
+def _event_forecast(
+    events: list, min_event_duration: timedelta, horizon: datetime
+) -> list:
+    """Return the area's own ``events`` that qualify as a forecast."""
+    return [
+        event
+        for event in events
+        if event.start_time < horizon
+        and event.end_time - event.start_time >= min_event_duration
+    ]
+
+
+def _clip_slot(
+    slot: Slot,
+    stage: Stage,
+    window_start: datetime,
+    window_end: datetime,
+    min_event_duration: timedelta,
+) -> Slot | None:
+    """Clip one overlapping schedule slot as ``area_forecast`` does."""
+    start_time, end_time = slot.start_time, slot.end_time
+    if start_time <= window_start and end_time <= window_end:
+        start_time = window_start
+    if start_time >= window_start and end_time >= window_end:
+        end_time = window_end
+    if start_time == end_time or end_time - start_time < min_event_duration:
+        return None
+    if (start_time, end_time) == slot[1:]:
+        return slot
+    return Slot(stage, start_time, end_time)
+
+
+def _stage_index(slots: list, min_event_duration: timedelta) -> tuple | None:
+    """Return ``(slots, kept, starts, ends)`` for one stage's schedule slots.
+
+    ``kept`` are the slots long enough for ``min_event_duration``: clipping
+    only shortens a slot, so one too short (or empty) to begin with never makes
+    it into a forecast. Returns None unless the slots are ordered by start and
+    by end.
+    """
+    kept = [
+        slot
+        for slot in slots
+        if slot.end_time > slot.start_time
+        and slot.end_time - slot.start_time >= min_event_duration
+    ]
+    starts = [slot.start_time for slot in kept]
+    ends = [slot.end_time for slot in kept]
+    if (
+        any(slot.end_time < slot.start_time for slot in slots)
+        or starts != sorted(starts)
+        or ends != sorted(ends)
+    ):
+        return None
+    return slots, kept, starts, ends
+
+
+class StageTimelines:
+    """An area's schedule indexed per stage, for splicing forecasts together.
+
+    Built once per schedule (``schedule`` and ``events`` are kept so callers
+    can tell when to rebuild). Each stage keeps the slots long enough for
+    ``min_event_duration`` with their start and end times, so a planned stage
+    window is applied with a few bisects: the slots wholly inside the window
+    are spliced in as they are, and only the ones crossing its edges are
+    clipped. ``forecast`` returns exactly what ``area_forecast`` would.
+
+    The splice needs each stage's slots ordered by start and by end, as SePush
+    schedules usually are; other schedules (e.g. mixing slot lengths so a
+    later slot ends first) are passed to ``area_forecast``.
+    """
+
+    __slots__ = ("events", "min_event_duration", "schedule", "_stages")
+
+    def __init__(
+        self,
+        schedule: dict,
+        events: list,
+        min_event_duration: timedelta,
+        previous: StageTimelines | None = None,
+    ) -> None:
+        """Index ``schedule``, reusing ``previous``'s index of unchanged stages.
+
+        Pruning ended slots only replaces the lists of the stages it touched,
+        so the other stages keep their index.
+        """
+        self.schedule = schedule
+        self.events = events
+        self.min_event_duration = min_event_duration
+        reuse = {}
+        if (
+            previous is not None
+            and previous._stages is not None
+            and previous.min_event_duration == min_event_duration
+        ):
+            reuse = previous._stages
+        self._stages: dict | None = {}
+        for stage, slots in schedule.items():
+            index = reuse.get(stage)
+            if index is None or index[0] is not slots:
+                index = _stage_index(slots, min_event_duration)
+                if index is None:
+                    self._stages = None
+                    break
+            self._stages[stage] = index
+
+    @property
+    def spliceable(self) -> bool:
+        """Return False when ``forecast`` falls back to ``area_forecast``."""
+        return self._stages is not None
+
+    def forecast(self, planned: list, horizon: datetime) -> list:
+        """Return the forecast for the ``planned`` stages up to ``horizon``."""
+        if self._stages is None:
+            return area_forecast(
+                self.schedule,
+                self.events,
+                planned,
+                self.min_event_duration,
+                horizon,
+            )
+        forecast: list = []
+        for stage, window_start, window_end in planned:
+            if stage in [Stage.NO_LOAD_SHEDDING]:
+                continue
+            self._splice(stage, window_start, window_end, horizon, forecast)
+
+        if not forecast:
+            forecast = _event_forecast(self.events, self.min_event_duration, horizon)
+        return forecast
+
+    def project(self, stage: Stage, start: datetime, end: datetime) -> list:
+        """Return the outages ``stage`` would bring from ``start`` until ``end``.
+
+        Clipped like a planned stage window, but without the fallback to the
+        area's events.
+        """
+        if self._stages is None:
+            planned = [Slot(stage, start, end)]
+            return area_forecast(
+                self.schedule, [], planned, self.min_event_duration, end
+            )
+        projection: list = []
+        if stage not in [Stage.NO_LOAD_SHEDDING]:
+            self._splice(stage, start, end, end, projection)
+        return projection
+
+    def _splice(
+        self,
+        stage: Stage,
+        window_start: datetime,
+        window_end: datetime,
+        horizon: datetime,
+        out: list,
+    ) -> None:
+        """Append the slots of ``stage`` in one window to ``out``."""
+        if stage not in self._stages:
+            return
+        _, slots, starts, ends = self._stages[stage]
+        # Slots that end after the window starts and start before it (or the
+        # horizon) ends.
+        first = bisect_right(ends, window_start)
+        stop = bisect_left(starts, min(window_end, horizon), first)
+        if first >= stop:
+            return
+        # Split into slots starting before the window, slots inside it and
+        # slots running past its end; only the outer two are clipped.
+        inner = bisect_left(starts, window_start, first, stop)
+        outer = bisect_left(ends, window_end, inner, stop)
+        min_event_duration = self.min_event_duration
+        for slot in slots[first:inner]:
+            clipped = _clip_slot(
+                slot, stage, window_start, window_end, min_event_duration
+            )
+            if clipped is not None:
+                out.append(clipped)
+        out.extend(slots[inner:outer])
+        for slot in slots[outer:stop]:
+            clipped = _clip_slot(
+                slot, stage, window_start, window_end, min_event_duration
+            )
+            if clipped is not None:
+                out.append(clipped)
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _epoch_us(value: datetime) -> int:
+    """Return ``value`` as exact integer microseconds since the epoch."""
+    return (value - _EPOCH) // _MICROSECOND
+
+
+class _PackedArea(NamedTuple):
+    """One area's schedule and events as flat arrays (see VectorForecastEngine)."""
+
+    schedule: dict
+    events: list
+    slots: list
+    stages: object
+    starts: object
+    ends: object
+    event_starts: object
+    event_ends: object
+
+
+class _Combined(NamedTuple):
+    """Every packed area's slots concatenated (see VectorForecastEngine)."""
+
+    packed: list
+    slots: list
+    area_of: object
+    stages: object
+    starts: object
+    ends: object
+
+
+class VectorForecastEngine:
+    """``area_forecast`` for every area at once, using NumPy.
+
+    Each area's schedule and events are packed into int64 arrays of epoch
+    microseconds when they change (the coordinator replaces the lists rather
+    than mutating them, so identity tells), and the areas' arrays are joined
+    while none of them changes. Every update then clips all areas against each
+    planned stage window with array operations; only clipped slots are built
+    in Python. The forecasts equal ``area_forecast`` slot for slot, and
+    unclipped slots are the schedule's own objects.
+
+    Only usable when NumPy is installed (``HAS_NUMPY``).
+    """
+
+    def __init__(self) -> None:
+        self._packed: dict[str, _PackedArea] = {}
+        self._combined: _Combined | None = None
+
+    def _pack(self, area_id: str, schedule: dict, events: list) -> _PackedArea:
+        packed = self._packed.get(area_id)
+        if packed is not None and packed.schedule is schedule and (
+            packed.events is events
+        ):
+            return packed
+        slots = [slot for stage_slots in schedule.values() for slot in stage_slots]
+        # Slots are matched to a planned stage by their schedule key, as in
+        # ``area_forecast``.
+        stages = [
+            stage.value
+            for stage, stage_slots in schedule.items()
+            for _ in range(len(stage_slots))
+        ]
+        packed = self._packed[area_id] = _PackedArea(
+            schedule,
+            events,
+            slots,
+            np.array(stages, dtype=np.int8),
+            np.array([_epoch_us(slot.start_time) for slot in slots], dtype=np.int64),
+            np.array([_epoch_us(slot.end_time) for slot in slots], dtype=np.int64),
+            np.array([_epoch_us(slot.start_time) for slot in events], dtype=np.int64),
+            np.array([_epoch_us(slot.end_time) for slot in events], dtype=np.int64),
+        )
+        return packed
+
+    def _combine(self, packed: list[_PackedArea]) -> _Combined:
+        combined = self._combined
+        if (
+            combined is not None
+            and len(combined.packed) == len(packed)
+            and all(map(is_, combined.packed, packed))
+        ):
+            return combined
+        self._combined = combined = _Combined(
+            packed,
+            [slot for area in packed for slot in area.slots],
+            np.repeat(np.arange(len(packed)), [len(area.slots) for area in packed]),
+            np.concatenate([area.stages for area in packed]),
+            np.concatenate([area.starts for area in packed]),
+            np.concatenate([area.ends for area in packed]),
+        )
+        return combined
+
+    def forecasts(
+        self,
+        areas: dict[str, tuple[dict, list, list]],
+        min_event_duration: timedelta,
+        horizon: datetime,
+    ) -> dict[str, list]:
+        """Return ``{area_id: forecast}`` for ``{area_id: (schedule, events,
+        planned)}``, as ``area_forecast`` would for each area."""
+        for area_id in self._packed.keys() - areas.keys():
+            del self._packed[area_id]
+        if not areas:
+            self._combined = None
+            return {}
+        packed = [
+            self._pack(area_id, schedule, events)
+            for area_id, (schedule, events, _) in areas.items()
+        ]
+        combined = self._combine(packed)
+        area_of, stages = combined.area_of, combined.stages
+        starts, ends = combined.starts, combined.ends
+        horizon_us = _epoch_us(horizon)
+        min_us = min_event_duration // _MICROSECOND
+
+        # Areas sharing a planned list (one per stage provider) are clipped
+        # together, one planned window at a time.
+        planned_lists = [planned for _, _, planned in areas.values()]
+        groups: dict[int, tuple[list, list[int]]] = {}
+        for index, planned in enumerate(planned_lists):
+            groups.setdefault(id(planned), (planned, []))[1].append(index)
+
+        picks = []
+        for planned, members in groups.values():
+            member = np.zeros(len(packed), dtype=bool)
+            member[members] = True
+            in_group = member[area_of]
+            for window, (stage, planned_start, planned_end) in enumerate(planned):
+                if stage in [Stage.NO_LOAD_SHEDDING]:
+                    continue
+                window_start = _epoch_us(planned_start)
+                window_end = _epoch_us(planned_end)
+                (index,) = np.nonzero(
+                    in_group
+                    & (stages == stage.value)
+                    & (starts < window_end)
+                    & (starts < horizon_us)
+                    & (ends > window_start)
+                )
+                start, end = starts[index], ends[index]
+                clip_start = (start <= window_start) & (end <= window_end)
+                clipped_start = np.where(clip_start, window_start, start)
+                clip_end = (clipped_start >= window_start) & (end >= window_end)
+                clipped_end = np.where(clip_end, window_end, end)
+                keep = (clipped_start != clipped_end) & (
+                    clipped_end - clipped_start >= min_us
+                )
+                picks.append(
+                    (
+                        index[keep],
+                        np.full(np.count_nonzero(keep), window),
+                        (clipped_start != start)[keep],
+                        (clipped_end != end)[keep],
+                    )
+                )
+
+        forecasts: list[list] = [[] for _ in packed]
+        if picks:
+            index, window, clip_start, clip_end = (
+                np.concatenate(column) for column in zip(*picks, strict=True)
             )
+            # Same order as area_forecast: by area, planned window, then slot.
+            order = np.lexsort((index, window, area_of[index]))
+            index, window = index[order], window[order]
+            clip_start, clip_end = clip_start[order], clip_end[order]
+            picked = list(map(combined.slots.__getitem__, index.tolist()))
+            (clipped,) = np.nonzero(clip_start | clip_end)
+            for position in clipped.tolist():
+                slot = picked[position]
+                stage, planned_start, planned_end = planned_lists[
+                    int(area_of[index[position]])
+                ][int(window[position])]
+                picked[position] = Slot(
+                    stage,
+                    planned_start if clip_start[position] else slot.start_time,
+                    planned_end if clip_end[position] else slot.end_time,
+                )
+            bounds = np.searchsorted(area_of[index], np.arange(len(packed) + 1))
+            forecasts = [
+                picked[lo:hi]
+                for lo, hi in zip(bounds[:-1].tolist(), bounds[1:].tolist())
+            ]
 
-    return merged
+        for area, forecast in zip(packed, forecasts, strict=True):
+            if forecast or not area.events:
+                continue
+            (keep,) = np.nonzero(
+                (area.event_starts < horizon_us)
+                & (area.event_ends - area.event_starts >= min_us)
+            )
+            forecast.extend(area.events[i] for i in keep.tolist())
+
+        return dict(zip(areas, forecasts, strict=True))
 
 
 def is_load_shedding_active(forecast: list, now: datetime) -> bool:
@@ -114,17 +735,12 @@ def is_load_shedding_active(forecast: list, now: datetime) -> bool:
     ends, even when every forecast event is already in the past (#103/#104).
     """
     for event in forecast:
-        end_time = event.get(ATTR_END_TIME)
-        start_time = event.get(ATTR_START_TIME)
-
-        if end_time is not None and end_time < now:
+        if event.end_time < now:
             continue
 
-        return bool(
-            event.get(ATTR_STAGE) != Stage.NO_LOAD_SHEDDING
-            and start_time is not None
-            and end_time is not None
-            and start_time <= now <= end_time
+        return (
+            event.stage != Stage.NO_LOAD_SHEDDING
+            and event.start_time <= now <= event.end_time
         )
     return False
 
@@ -154,61 +770,427 @@ def summarize_forecast(
     if not forecast:
         return result
 
-    cur: dict = {}
-    nxt: dict = {}
+    cur: Slot | None = None
+    nxt: Slot | None = None
     nxt_index: int | None = None
+    blocks = forecast_blocks(forecast) if merge_contiguous else None
 
-    if now < forecast[0].get(ATTR_START_TIME):
+    if now < forecast[0].start_time:
         # before
         nxt, nxt_index = forecast[0], 0
-    elif forecast[0].get(ATTR_START_TIME) <= now <= forecast[0].get(ATTR_END_TIME, now):
+    elif forecast[0].start_time <= now <= forecast[0].end_time:
         # during
         cur = forecast[0]
         if merge_contiguous:
-            _, next_index = continuous_block_end(forecast, 0)
+            _, next_index = continuous_block_end(forecast, 0, blocks)
         else:
             next_index = 1
         if next_index < len(forecast):
             nxt, nxt_index = forecast[next_index], next_index
-    elif forecast[0].get(ATTR_END_TIME) < now:
+    else:
         # after
         if len(forecast) > 1:
             nxt, nxt_index = forecast[1], 1
 
     if cur:
-        try:
-            result[ATTR_STAGE] = cur.get(ATTR_STAGE).value
-        except AttributeError:
-            result[ATTR_STAGE] = Stage.NO_LOAD_SHEDDING.value
-        result[ATTR_START_TIME] = cur.get(ATTR_START_TIME)
+        result[ATTR_STAGE] = _stage_value(cur)
+        result[ATTR_START_TIME] = cur.start_time
 
         if merge_contiguous:
-            end_time, _ = continuous_block_end(forecast, 0)
+            end_time, _ = continuous_block_end(forecast, 0, blocks)
         else:
-            end_time = cur.get(ATTR_END_TIME)
-        if end_time is not None:
-            result[ATTR_END_TIME] = end_time
-            result[ATTR_END_IN] = _minutes(end_time - now)
+            end_time = cur.end_time
+        result[ATTR_END_TIME] = end_time
+        result[ATTR_END_IN] = _minutes(end_time - now)
 
     if nxt:
-        try:
-            result[ATTR_NEXT_STAGE] = nxt.get(ATTR_STAGE).value
-        except AttributeError:
-            result[ATTR_NEXT_STAGE] = Stage.NO_LOAD_SHEDDING.value
-        result[ATTR_NEXT_START_TIME] = nxt.get(ATTR_START_TIME)
-
-        if merge_contiguous and nxt_index is not None:
-            next_end_time, _ = continuous_block_end(forecast, nxt_index)
+        result[ATTR_NEXT_STAGE] = _stage_value(nxt)
+        result[ATTR_NEXT_START_TIME] = nxt.start_time
+
+        if merge_contiguous:
+            result[ATTR_NEXT_END_TIME], _ = continuous_block_end(
+                forecast, nxt_index, blocks
+            )
         else:
-            next_end_time = nxt.get(ATTR_END_TIME)
-        if next_end_time is not None:
-            result[ATTR_NEXT_END_TIME] = next_end_time
+            result[ATTR_NEXT_END_TIME] = nxt.end_time
 
-        result[ATTR_START_IN] = _minutes(nxt.get(ATTR_START_TIME) - now)
+        result[ATTR_START_IN] = _minutes(nxt.start_time - now)
 
     return result
 
 
+_HALF_HOUR = timedelta(minutes=30)
+_HALF_HOUR_US = _HALF_HOUR // _MICROSECOND
+SLOTS_PER_DAY = 48
+
+
+def _half_hour_index(value: datetime) -> int | None:
+    """Return the half hours since the epoch at ``value``, None if in between."""
+    index, rest = divmod(_epoch_us(value), _HALF_HOUR_US)
+    return None if rest else index
+
+
+class OutageMask:
+    """Half-hour outage bitmap: one 48-bit mask per UTC day.
+
+    SePush slots start and end on the half hour, so a day of outages fits in
+    48 bits (bit ``n`` covers the half hour from ``n * 30`` minutes after
+    midnight UTC) and whether load shedding is on is a bit test. Days without
+    outages are not stored.
+    """
+
+    __slots__ = ("_days",)
+
+    def __init__(self, days: dict[int, int] | None = None) -> None:
+        self._days = {day: bits for day, bits in (days or {}).items() if bits}
+
+    @classmethod
+    def from_slots(cls, slots: Iterable[Slot]) -> OutageMask | None:
+        """Return the mask of the load shedding ``slots``.
+
+        Returns None when a slot does not start and end on the half hour (e.g.
+        an event with odd times), or is a NO_LOAD_SHEDDING slot, which clears
+        the slots it overlaps in ``is_load_shedding_active`` and so has no bit
+        pattern of its own. Callers then fall back to the slots.
+        """
+        days: dict[int, int] = {}
+        for slot in slots:
+            if slot.stage == Stage.NO_LOAD_SHEDDING:
+                return None
+            start = _half_hour_index(slot.start_time)
+            end = _half_hour_index(slot.end_time)
+            if start is None or end is None:
+                return None
+            while start < end:
+                day, first = divmod(start, SLOTS_PER_DAY)
+                stop = min(end - day * SLOTS_PER_DAY, SLOTS_PER_DAY)
+                days[day] = days.get(day, 0) | ((1 << stop) - (1 << first))
+                start = (day + 1) * SLOTS_PER_DAY
+        return cls(days)
+
+    def _bit(self, index: int) -> int:
+        day, bit = divmod(index, SLOTS_PER_DAY)
+        return self._days.get(day, 0) >> bit & 1
+
+    def is_off(self, when: datetime, *, inclusive_end: bool = False) -> bool:
+        """Return True if load shedding is on at ``when``.
+
+        Outages cover ``[start, end)``; with ``inclusive_end`` the instant an
+        outage ends still counts, as in ``is_load_shedding_active``.
+        """
+        index, rest = divmod(_epoch_us(when), _HALF_HOUR_US)
+        if self._bit(index):
+            return True
+        return inclusive_end and not rest and bool(self._bit(index - 1))
+
+
+def encode_timeline(forecast: list, start: datetime, days: int) -> str:
+    """Return the forecast as one stage digit per half hour from ``start``.
+
+    ``days * SLOTS_PER_DAY`` characters; character ``n`` is the highest stage
+    of the slots overlapping the half hour ``n * 30`` minutes after ``start``,
+    ``0`` when none is. Dashboards index into the string instead of looping
+    over the forecast for every half hour they draw.
+    """
+    count = days * SLOTS_PER_DAY
+    stages = [0] * count
+    for slot in forecast:
+        value = _stage_value(slot)
+        if value <= 0:
+            continue
+        first = max((slot.start_time - start) // _HALF_HOUR, 0)
+        stop = min(-((start - slot.end_time) // _HALF_HOUR), count)
+        for index in range(first, stop):
+            if stages[index] < value:
+                stages[index] = value
+    return "".join(map(str, stages))
+
+
+class ForecastTimeline:
+    """Precomputed transitions of a start-ordered forecast for bisect queries.
+
+    Built once per forecast list (``forecast`` keeps the source so callers can
+    tell when to rebuild) and answers the same questions as
+    ``is_load_shedding_active``/``summarize_forecast`` without walking the
+    list: the first slot still running or upcoming is found by bisecting a
+    running maximum of the slot ends, and continuous blocks come from the
+    ``forecast_blocks`` table, with each slot mapped to its block.
+
+    Slots that have ended are skipped from the front, which matches filtering
+    them out as long as slot ends are ordered like their starts (true for
+    SePush schedules and planned stages). When every slot is an outage on the
+    half hour, whether load shedding is active is read from an ``OutageMask``
+    instead.
+    """
+
+    __slots__ = (
+        "blocks",
+        "forecast",
+        "mask",
+        "merge_contiguous",
+        "_block_of",
+        "_max_ends",
+    )
+
+    def __init__(self, forecast: list, *, merge_contiguous: bool) -> None:
+        self.forecast = forecast
+        self.merge_contiguous = merge_contiguous
+        self._max_ends = list(accumulate((slot.end_time for slot in forecast), max))
+        self.blocks = forecast_blocks(forecast)
+        self.mask = OutageMask.from_slots(forecast)
+        # Index into ``blocks`` of the block each slot belongs to.
+        self._block_of: list[int] = []
+        for block_index, block in enumerate(self.blocks):
+            self._block_of.extend([block_index] * (block.stop - block.first))
+
+    def _block_end(self, index: int) -> tuple[datetime, int]:
+        """Return ``(end_time, next_index)`` as used by the summary."""
+        if not self.merge_contiguous:
+            return self.forecast[index].end_time, index + 1
+        block = self.blocks[self._block_of[index]]
+        return self.forecast[block.stop - 1].end_time, block.stop
+
+    def pending_index(self, now: datetime) -> int:
+        """Return the index of the first slot that has not ended at ``now``."""
+        return bisect_left(self._max_ends, now)
+
+    def pending(self, now: datetime) -> list:
+        """Return the slots that have not ended at ``now``."""
+        return self.forecast[self.pending_index(now) :]
+
+    def is_active(self, now: datetime) -> bool:
+        """Return True if a load shedding slot is running at ``now``."""
+        return self._is_active(self.pending_index(now), now)
+
+    def summary(self, now: datetime) -> dict:
+        """Return the ``summarize_forecast`` fields for the pending slots."""
+        return self._summary(self.pending_index(now), now)
+
+    def merged(self, now: datetime) -> list:
+        """Return ``merge_forecast`` of the slots that have not ended at ``now``."""
+        return self._merged(self.pending_index(now))
+
+    def view(self, now: datetime) -> ForecastView:
+        """Return the active flag, pending slots, merged view and summary at once.
+
+        All four are derived from the same ``now`` and a single lookup of the
+        first pending slot.
+        """
+        index = self.pending_index(now)
+        return ForecastView(
+            self._is_active(index, now),
+            self.forecast[index:],
+            self._merged(index),
+            self._summary(index, now),
+        )
+
+    def _is_active(self, index: int, now: datetime) -> bool:
+        if self.mask is not None:
+            return self.mask.is_off(now, inclusive_end=True)
+        if index == len(self.forecast):
+            return False
+        slot = self.forecast[index]
+        return slot.stage != Stage.NO_LOAD_SHEDDING and slot.start_time <= now
+
+    def _summary(self, index: int, now: datetime) -> dict:
+        result: dict = {}
+        if index == len(self.forecast):
+            return result
+
+        slot = self.forecast[index]
+        nxt_index: int | None = index
+        if slot.start_time <= now:
+            result[ATTR_STAGE] = _stage_value(slot)
+            result[ATTR_START_TIME] = slot.start_time
+            end_time, nxt_index = self._block_end(index)
+            result[ATTR_END_TIME] = end_time
+            result[ATTR_END_IN] = _minutes(end_time - now)
+            if nxt_index >= len(self.forecast):
+                nxt_index = None
+
+        if nxt_index is not None:
+            nxt = self.forecast[nxt_index]
+            result[ATTR_NEXT_STAGE] = _stage_value(nxt)
+            result[ATTR_NEXT_START_TIME] = nxt.start_time
+            result[ATTR_NEXT_END_TIME], _ = self._block_end(nxt_index)
+            result[ATTR_START_IN] = _minutes(nxt.start_time - now)
+
+        return result
+
+    def _merged(self, index: int) -> list:
+        if index == len(self.forecast):
+            return []
+        blocks = self.blocks[self._block_of[index] :]
+        block = blocks[0]
+        if block.first != index:
+            # The first block has partly ended; relabel from the pending slot.
+            labels = dict.fromkeys(
+                stage_label(slot.stage)
+                for slot in self.forecast[index : block.stop]
+            )
+            blocks[0] = ForecastBlock(index, block.stop, tuple(labels))
+        return merge_forecast(self.forecast, blocks)
+
+
+class ForecastView(NamedTuple):
+    """What a sensor shows for a forecast at one instant."""
+
+    active: bool
+    """Whether a load shedding slot is running."""
+    pending: list
+    """Slots that have not ended."""
+    merged: list
+    """``merge_forecast`` of the pending slots."""
+    summary: dict
+    """``summarize_forecast`` fields of the pending slots."""
+
+
+class OutageSweep(NamedTuple):
+    """The outages of several areas combined (see ``sweep_outages``)."""
+
+    union: list[tuple[datetime, datetime]]
+    """``(start, end)`` of each spell with any of the areas off."""
+    intersection: list[tuple[datetime, datetime]]
+    """``(start, end)`` of each spell with every area off."""
+
+
+def sweep_outages(forecasts: list[list]) -> OutageSweep:
+    """Return when any and when all of the areas in ``forecasts`` are off.
+
+    One sweep over the sorted slot boundaries of every forecast, so
+    O(n log n) in the number of slots. Overlapping slots of one area count
+    once, NO_LOAD_SHEDDING slots are not outages, and outages that touch end
+    to start are joined, as continuous blocks are in a forecast.
+    """
+    edges = []
+    for area, forecast in enumerate(forecasts):
+        for slot in forecast:
+            if slot.stage == Stage.NO_LOAD_SHEDDING:
+                continue
+            # Starts sort before ends at the same instant, joining the spells.
+            edges.append((slot.start_time, 0, area))
+            edges.append((slot.end_time, 1, area))
+    edges.sort()
+
+    union: list[tuple[datetime, datetime]] = []
+    intersection: list[tuple[datetime, datetime]] = []
+    every = len(forecasts)
+    depth = [0] * every  # slots of each area covering the sweep position
+    off = 0  # areas with a slot covering the sweep position
+    any_start = all_start = None
+    for when, is_end, area in edges:
+        if not is_end:
+            depth[area] += 1
+            if depth[area] == 1:
+                off += 1
+                if off == 1:
+                    any_start = when
+                if off == every:
+                    all_start = when
+            continue
+        depth[area] -= 1
+        if depth[area]:
+            continue
+        if off == every and when > all_start:
+            intersection.append((all_start, when))
+        off -= 1
+        if not off and when > any_start:
+            union.append((any_start, when))
+    return OutageSweep(union, intersection)
+
+
+def summarize_outages(outages: list[tuple[datetime, datetime]], now: datetime) -> dict:
+    """Return the current and next outage fields of disjoint, sorted ``outages``.
+
+    The counterpart of ``summarize_forecast`` for ``OutageSweep`` spells:
+    start_time, end_time and ends_in while one is running (ends included),
+    then next_start_time, next_end_time and starts_in.
+    """
+    result: dict = {}
+    index = bisect_left(outages, now, key=itemgetter(1))
+    if index < len(outages) and outages[index][0] <= now:
+        result[ATTR_START_TIME], result[ATTR_END_TIME] = outages[index]
+        result[ATTR_END_IN] = _minutes(result[ATTR_END_TIME] - now)
+        index += 1
+    if index < len(outages):
+        result[ATTR_NEXT_START_TIME], result[ATTR_NEXT_END_TIME] = outages[index]
+        result[ATTR_START_IN] = _minutes(result[ATTR_NEXT_START_TIME] - now)
+    return result
+
+
+def free_windows(
+    outages: list[tuple[datetime, datetime]],
+    start: datetime,
+    end: datetime,
+    min_duration: timedelta,
+) -> list[tuple[datetime, datetime]]:
+    """Return the gaps of at least ``min_duration`` between ``outages``.
+
+    ``outages`` are disjoint and sorted, like ``OutageSweep.union``; only the
+    part of each gap between ``start`` and ``end`` is returned.
+    """
+    windows = []
+    free_from = start
+    for index in range(bisect_right(outages, start, key=itemgetter(1)), len(outages)):
+        outage_start, outage_end = outages[index]
+        if outage_start >= end:
+            break
+        if outage_start > free_from and outage_start - free_from >= min_duration:
+            windows.append((free_from, outage_start))
+        free_from = max(free_from, outage_end)
+    if free_from < end and end - free_from >= min_duration:
+        windows.append((free_from, end))
+    return windows
+
+
+class OutageMinutes:
+    """Prefix sums of outage time over a forecast, for window queries.
+
+    ``minutes(start, end)`` is two bisects and a subtraction instead of a walk
+    over the forecast, so O(log n) however often it is asked.
+    """
+
+    __slots__ = ("_starts", "_ends", "_before")
+
+    def __init__(self, outages: list[tuple[datetime, datetime]]) -> None:
+        """Index ``outages``, disjoint and sorted like ``OutageSweep.union``."""
+        self._starts = [start for start, _ in outages]
+        self._ends = [end for _, end in outages]
+        # Outage time before each outage starts, then the total.
+        self._before = list(
+            accumulate((end - start for start, end in outages), initial=timedelta(0))
+        )
+
+    @classmethod
+    def from_forecast(cls, forecast: list) -> OutageMinutes:
+        """Index one area's forecast; overlapping slots count once."""
+        return cls(sweep_outages([forecast]).union)
+
+    def _until(self, when: datetime) -> timedelta:
+        """Return the outage time from the first outage up to ``when``."""
+        index = bisect_right(self._starts, when) - 1
+        if index < 0:
+            return timedelta(0)
+        return self._before[index] + min(when, self._ends[index]) - self._starts[index]
+
+    def total(self, start: datetime, end: datetime) -> timedelta:
+        """Return the outage time between ``start`` and ``end``."""
+        if end <= start:
+            return timedelta(0)
+        return self._until(end) - self._until(start)
+
+    def minutes(self, start: datetime, end: datetime) -> int:
+        """Return the whole minutes of outage between ``start`` and ``end``."""
+        return _minutes(self.total(start, end))
+
+
+def _stage_value(slot: Slot) -> int:
+    try:
+        return slot.stage.value
+    except AttributeError:
+        return Stage.NO_LOAD_SHEDDING.value
+
+
 def build_sensor_attrs(
     forecast: list,
     stage: Stage,
@@ -216,6 +1198,7 @@ def build_sensor_attrs(
     now: datetime,
     *,
     merge_contiguous: bool,
+    summary: dict | None = None,
 ) -> dict:
     """Build the full, HA-serialisable sensor attribute dict.
 
@@ -223,6 +1206,9 @@ def build_sensor_attrs(
     are one continuous outage, #54) and False for the *stage planned* list
     (contiguous entries are distinct stage transitions whose individual
     boundaries and ``next_*`` fields must be preserved — review HIGH finding).
+
+    ``summary`` takes fields already computed for ``forecast`` at ``now``
+    (e.g. ``ForecastTimeline.summary``) instead of re-walking ``forecast``.
     """
     if not forecast:
         return {ATTR_STAGE: stage.value}
@@ -230,7 +1216,10 @@ def build_sensor_attrs(
     data = dict(default_data)
     data[ATTR_STAGE] = stage.value
 
-    summary = summarize_forecast(forecast, now, merge_contiguous=merge_contiguous)
+    if summary is None:
+        summary = summarize_forecast(
+            forecast, now, merge_contiguous=merge_contiguous
+        )
     for key, value in summary.items():
         data[key] = value.isoformat() if isinstance(value, datetime) else value
 
@@ -283,6 +1272,46 @@ def _rehydrate_slot(slot: dict) -> dict:
     return rehydrated
 
 
+def area_calendar_events(
+    forecast: list | None, location: str, multi_stage_events: bool
+) -> list:
+    """Build one area's calendar events as plain dicts, ordered by start.
+
+    Each event is ``{"start", "end", "summary", "location"}``. When
+    ``multi_stage_events`` is set, contiguous slots are merged as they are
+    read. The result only depends on this area's forecast, so callers can keep
+    it until that forecast changes.
+    """
+    events: list = []
+    labels: list[str] = []
+    for slot in sorted(forecast or (), key=attrgetter("start_time")):
+        start = slot.start_time
+        summary = stage_label(slot.stage)
+        if multi_stage_events and events and events[-1]["end"] == start:
+            labels.append(summary)
+            events[-1]["summary"] = join_stage_labels(tuple(labels))
+            events[-1]["end"] = slot.end_time
+            continue
+        labels = [summary]
+        events.append(
+            {
+                "start": start,
+                "end": slot.end_time,
+                "summary": summary,
+                "location": location,
+            }
+        )
+    return events
+
+
+def merge_calendar_events(area_events: Iterable[list]) -> list:
+    """K-way merge per-area event lists (each ordered by start) into one.
+
+    Events starting together keep the order of their areas.
+    """
+    return list(heapq.merge(*area_events, key=itemgetter("start")))
+
+
 def build_calendar_events(area_forecasts: list, multi_stage_events: bool) -> list:
     """Build the ordered list of forecast calendar events as plain dicts.
 
@@ -294,59 +1323,37 @@ def build_calendar_events(area_forecasts: list, multi_stage_events: bool) -> lis
     location** so that adjacent slots from different areas are never combined
     into one event (review M1).
     """
-    events: list = []
-    for area in area_forecasts:
-        forecast = area.get(ATTR_FORECAST)
-        if not forecast:
-            continue
-        for slot in forecast:
-            events.append(
-                {
-                    "start": slot.get(ATTR_START_TIME),
-                    "end": slot.get(ATTR_END_TIME),
-                    "summary": str(slot.get(ATTR_STAGE)),
-                    "location": area.get("name"),
-                }
-            )
+    return merge_calendar_events(
+        area_calendar_events(
+            area.get(ATTR_FORECAST), area.get("name"), multi_stage_events
+        )
+        for area in area_forecasts
+    )
 
-    events.sort(key=lambda event: event["start"])
-
-    if multi_stage_events:
-        # Merge contiguous slots, but only within the same location.
-        by_location: dict = {}
-        order: list = []
-        for event in events:
-            location = event["location"]
-            if location not in by_location:
-                by_location[location] = []
-                order.append(location)
-            group = by_location[location]
-            if group and group[-1]["end"] == event["start"]:
-                group[-1]["summary"] = f"{group[-1]['summary']}/{event['summary']}"
-                group[-1]["end"] = event["end"]
-            else:
-                group.append(event)
-        events = [event for location in order for event in by_location[location]]
-        events.sort(key=lambda event: event["start"])
 
-    return events
+class EventIndex:
+    """Start-ordered calendar events with bisect range lookups.
 
+    ``events`` must be sorted by start, as returned by ``build_calendar_events``.
+    Events can overlap (several areas), so ends are not ordered; a running
+    maximum of the ends is indexed instead, which bounds where events that have
+    not ended by a given time can begin.
+    """
 
-def current_event(events: list, now: datetime) -> dict | None:
-    """Return the first event that has not yet ended, or None."""
-    for event in events:
-        if event["end"] > now:
-            return event
-    return None
+    __slots__ = ("events", "_max_ends", "_starts")
 
+    def __init__(self, events: list) -> None:
+        self.events = events
+        self._starts = [event["start"] for event in events]
+        self._max_ends = list(accumulate((event["end"] for event in events), max))
 
-def events_in_range(events: list, start_date: datetime, end_date: datetime) -> list:
-    """Return events overlapping the ``[start_date, end_date)`` window."""
-    result: list = []
-    for event in events:
-        if event["end"] <= start_date:
-            continue
-        if event["start"] >= end_date:
-            continue
-        result.append(event)
-    return result
+    def current(self, now: datetime) -> dict | None:
+        """Return the first event that has not yet ended, or None."""
+        idx = bisect_right(self._max_ends, now)
+        return self.events[idx] if idx < len(self.events) else None
+
+    def in_range(self, start_date: datetime, end_date: datetime) -> list:
+        """Return events overlapping the ``[start_date, end_date)`` window."""
+        lo = bisect_right(self._max_ends, start_date)
+        hi = bisect_left(self._starts, end_date, lo)
+        return [event for event in self.events[lo:hi] if event["end"] > start_date]
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from typing import Any, cast
 
 from load_shedding.libs.sepush import SePushError
@@ -13,23 +13,28 @@ from load_shedding.providers import Area, Stage
 from homeassistant.components.sensor import (
     DOMAIN as SENSOR_DOMAIN,
     RestoreSensor,
+    SensorDeviceClass,
+    SensorEntity,
     SensorEntityDescription,
+    SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import ATTR_ATTRIBUTION, STATE_OFF, STATE_ON
+from homeassistant.const import ATTR_ATTRIBUTION, STATE_OFF, STATE_ON, UnitOfTime
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import StateType
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
 
 from . import LoadSheddingDevice
 from .helpers import (
+    ForecastTimeline,
     build_sensor_attrs,
+    encode_timeline,
     filter_restorable_attrs,
-    is_load_shedding_active,
-    merge_forecast,
     rehydrate_restored_datetimes,
+    summarize_outages,
 )
 from .const import (
     ATTR_AREA,
@@ -42,11 +47,17 @@ from .const import (
     ATTR_NEXT_END_TIME,
     ATTR_NEXT_STAGE,
     ATTR_NEXT_START_TIME,
+    ATTR_OUTAGES,
     ATTR_PLANNED,
+    ATTR_PROJECTION,
     ATTR_SCHEDULE,
     ATTR_STAGE,
+    ATTR_STAGES,
+    ATTR_STALE,
+    ATTR_START,
     ATTR_START_IN,
     ATTR_START_TIME,
+    ATTR_TIMELINE,
     ATTRIBUTION,
     DOMAIN,
     NAME,
@@ -97,6 +108,20 @@ RESTORABLE_ATTRS = (
     ATTR_AREA_ID,
 )
 
+# Current/next outage attributes of the any/all-areas sensors.
+AGGREGATE_ATTRS = (
+    ATTR_START_TIME,
+    ATTR_END_TIME,
+    ATTR_END_IN,
+    ATTR_NEXT_START_TIME,
+    ATTR_NEXT_END_TIME,
+    ATTR_START_IN,
+)
+
+# Minute countdowns dropped when the ``minute_countdowns`` option is off: they
+# change every minute, so every poll would write a new state.
+COUNTDOWN_ATTRS = (ATTR_END_IN, ATTR_START_IN)
+
 # Quota attributes restored after a restart as a fallback for when the #116
 # restart cache has no persisted rate-limit snapshot to reseed (e.g. a fresh or
 # corrupt cache), so count/limit/remaining survive until the first live poll.
@@ -117,6 +142,22 @@ def restorable_attrs(last_state, allowed=RESTORABLE_ATTRS) -> dict:
     return rehydrate_restored_datetimes(restored)
 
 
+async def async_restore_last_state(
+    entity: RestoreSensor, allowed=RESTORABLE_ATTRS
+) -> None:
+    """Seed ``entity`` from its last recorded state.
+
+    Only used when the coordinator restored nothing for the entity from its own
+    cache (#116): that data is already deserialized once per entry, whereas the
+    recorded attributes have to be re-parsed for every entity.
+    """
+    if restored_data := await entity.async_get_last_sensor_data():
+        entity._attr_native_value = restored_data.native_value
+    if attrs := restorable_attrs(await entity.async_get_last_state(), allowed):
+        if not getattr(entity, "_attr_extra_state_attributes", None):
+            entity._attr_extra_state_attributes = attrs
+
+
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ) -> None:
@@ -151,6 +192,21 @@ async def async_setup_entry(
     for area in area_coordinator.areas:
         area_entity = LoadSheddingAreaSensorEntity(area_coordinator, area)
         entities.append(area_entity)
+        entities.extend(
+            LoadSheddingAreaTimestampSensorEntity(area_coordinator, area, end=end)
+            for end in (False, True)
+        )
+    # With several areas, also say when any and when all of them are off.
+    if len(area_coordinator.areas) > 1:
+        entities.extend(
+            LoadSheddingAreasSensorEntity(area_coordinator, every=every)
+            for every in (False, True)
+        )
+    if hours := area_coordinator.outage_minutes_hours:
+        entities.extend(
+            LoadSheddingOutageMinutesSensorEntity(area_coordinator, area, hours)
+            for area in area_coordinator.areas
+        )
 
     # Quota sensor subscribes to the stage coordinator — the stage poll (status)
     # populates sepush.rate_limit() as a side-effect, so no dedicated quota call
@@ -176,6 +232,7 @@ class LoadSheddingStageSensorEntity(
         super().__init__(coordinator)
         self.idx = idx
         self.data = self.coordinator.data.get(self.idx)
+        self._timeline: ForecastTimeline | None = None
 
         self.entity_description = LoadSheddingSensorDescription(
             key=f"{DOMAIN} stage",
@@ -188,21 +245,19 @@ class LoadSheddingStageSensorEntity(
 
     async def async_added_to_hass(self) -> None:
         """Handle entity which will be added."""
-        if restored_data := await self.async_get_last_sensor_data():
-            self._attr_native_value = restored_data.native_value
-        # Restore last known attributes so the planned schedule survives a
-        # restart while the API quota is exhausted, until the first poll (#31).
-        if attrs := restorable_attrs(await self.async_get_last_state()):
-            if not hasattr(self, "_attr_extra_state_attributes"):
-                self._attr_extra_state_attributes = {}
-            if not self._attr_extra_state_attributes:
-                self._attr_extra_state_attributes = attrs
+        # Without cached zone data, restore the last known attributes so the
+        # planned schedule survives a restart while the API quota is exhausted,
+        # until the first poll (#31).
+        if not self.data:
+            await async_restore_last_state(self)
         await super().async_added_to_hass()
 
     @property
     def name(self) -> str | None:
         """Return the stage sensor name."""
-        name = self.data.get("name", "Unknown")
+        # The zone may be missing from a later poll than the one (or the cache)
+        # the entity was created from.
+        name = (self.data or {}).get("name", "Unknown")
         return f"{name} Stage"
 
     @property
@@ -215,9 +270,7 @@ class LoadSheddingStageSensorEntity(
         if not planned:
             return Stage.NO_LOAD_SHEDDING
 
-        stage = planned[0].get(ATTR_STAGE, Stage.NO_LOAD_SHEDDING)
-
-        self._attr_native_value = cast(StateType, stage)
+        self._attr_native_value = cast(StateType, planned[0].stage)
         return self._attr_native_value
 
     @property
@@ -231,30 +284,25 @@ class LoadSheddingStageSensorEntity(
             return self._attr_extra_state_attributes
 
         now = datetime.now(UTC)
+        self._timeline = cached_timeline(
+            self._timeline, self.data.get(ATTR_PLANNED, []), merge_contiguous=False
+        )
         # Rebuild the planned list from live coordinator data unconditionally so
         # stale entries (and derived next_*/ends_in fields) are dropped when the
-        # planned list empties (C2).
-        planned = []
-        for event in self.data.get(ATTR_PLANNED, []):
-            if ATTR_END_TIME in event and event.get(ATTR_END_TIME) < now:
-                continue
-
-            entry = {
-                ATTR_STAGE: event.get(ATTR_STAGE),
-                ATTR_START_TIME: event.get(ATTR_START_TIME),
-            }
-            if ATTR_END_TIME in event:
-                entry[ATTR_END_TIME] = event.get(ATTR_END_TIME)
-
-            planned.append(entry)
+        # planned list empties (C2). The list is capped to bound the state size.
+        limit = self.coordinator.list_attr_limit
+        planned = [event._asdict() for event in self._timeline.pending(now)[:limit]]
 
         cur_stage = Stage.NO_LOAD_SHEDDING
         if planned:
-            cur_stage = planned[0].get(ATTR_STAGE, Stage.NO_LOAD_SHEDDING)
+            cur_stage = planned[0][ATTR_STAGE]
 
-        attrs = get_sensor_attrs(planned, cur_stage)
+        attrs = get_sensor_attrs(
+            planned, cur_stage, now=now, summary=self._timeline.summary(now)
+        )
         attrs[ATTR_PLANNED] = planned
         attrs[ATTR_LAST_UPDATE] = self.coordinator.last_update
+        attrs[ATTR_STALE] = self.coordinator.stale
         attrs = clean(attrs)
 
         self._attr_extra_state_attributes = attrs
@@ -280,6 +328,9 @@ class LoadSheddingAreaSensorEntity(
         super().__init__(coordinator)
         self.area = area
         self.data = self.coordinator.data.get(self.area.id)
+        self._timeline: ForecastTimeline | None = None
+        # Forecast, start and days the compact timeline was encoded for.
+        self._compact: tuple[list, datetime, int, dict] | None = None
 
         self.entity_description = LoadSheddingSensorDescription(
             key=f"{DOMAIN} schedule {area.id}",
@@ -294,15 +345,13 @@ class LoadSheddingAreaSensorEntity(
 
     async def async_added_to_hass(self) -> None:
         """Handle entity which will be added."""
-        if restored_data := await self.async_get_last_sensor_data():
-            self._attr_native_value = restored_data.native_value
-        # Restore last known attributes so the forecast/schedule survive a
-        # restart while the API quota is exhausted, until the first poll (#31).
-        if attrs := restorable_attrs(await self.async_get_last_state()):
-            if not hasattr(self, "_attr_extra_state_attributes"):
-                self._attr_extra_state_attributes = {}
-            if not self._attr_extra_state_attributes:
-                self._attr_extra_state_attributes = attrs
+        # Without cached area data, restore the last known attributes so the
+        # forecast/schedule survive a restart while the API quota is exhausted,
+        # until the first poll (#31).
+        if self.data:
+            self._update_from_data()
+        else:
+            await async_restore_last_state(self)
         await super().async_added_to_hass()
 
     @property
@@ -310,67 +359,283 @@ class LoadSheddingAreaSensorEntity(
         """Return the area sensor name."""
         return self.area.name
 
-    @property
-    def native_value(self) -> StateType:
-        """Return the area state."""
-        if not self.data:
-            return self._attr_native_value
+    def _get_timeline(self) -> ForecastTimeline:
+        """Return the timeline of the area forecast, rebuilt when it changes."""
+        self._timeline = cached_timeline(
+            self._timeline, self.data.get(ATTR_FORECAST, []), merge_contiguous=True
+        )
+        return self._timeline
 
-        events = self.data.get(ATTR_FORECAST, [])
+    @callback
+    def _update_from_data(self) -> None:
+        """Derive the state and attributes from the area forecast.
+
+        Everything comes from one ``ForecastTimeline.view`` at a single ``now``,
+        so the state and the attributes always agree.
+        """
         now = datetime.now(UTC)
+        view = self._get_timeline().view(now)
 
         # Default to OFF; only ON for a currently-active event. Guarantees the
         # state clears when load shedding ends (#103/#104).
-        state = STATE_ON if is_load_shedding_active(events, now) else STATE_OFF
-        self._attr_native_value = cast(StateType, state)
-        return self._attr_native_value
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return the state attributes."""
-        if not hasattr(self, "_attr_extra_state_attributes"):
-            self._attr_extra_state_attributes = {}
+        self._attr_native_value = STATE_ON if view.active else STATE_OFF
 
-        if not self.data:
-            return self._attr_extra_state_attributes
-
-        now = datetime.now(UTC)
         # Rebuild the forecast from live coordinator data unconditionally so
         # stale events (and derived next_*/ends_in fields) are dropped when the
         # forecast empties at the end of load shedding (C2).
-        forecast = []
-        for event in self.data.get(ATTR_FORECAST, []):
-            if ATTR_END_TIME in event and event.get(ATTR_END_TIME) < now:
-                continue
-
-            forecast.append(
-                {
-                    ATTR_STAGE: event.get(ATTR_STAGE),
-                    ATTR_START_TIME: event.get(ATTR_START_TIME),
-                    ATTR_END_TIME: event.get(ATTR_END_TIME),
-                }
-            )
-
-        attrs = get_sensor_attrs(forecast, merge_contiguous=True)
+        limit = self.coordinator.stage_coordinator.list_attr_limit
+        forecast = [event._asdict() for event in view.pending[:limit]]
+
+        attrs = get_sensor_attrs(
+            forecast, merge_contiguous=True, now=now, summary=view.summary
+        )
         attrs[ATTR_AREA_ID] = self.area.id
+        # List attributes are capped to bound the state size; the calendar
+        # exposes the full forecast.
         attrs[ATTR_FORECAST] = forecast
-        attrs[ATTR_FORECAST_CALENDAR] = merge_forecast(forecast)
+        attrs[ATTR_FORECAST_CALENDAR] = view.merged[:limit]
+        if (stage := self.coordinator.projection_stage) is not None:
+            attrs[ATTR_PROJECTION] = self._projection(stage, now)
+        if days := self.coordinator.timeline_days:
+            attrs[ATTR_TIMELINE] = self._compact_timeline(days)
         attrs[ATTR_LAST_UPDATE] = self.coordinator.last_update
-        attrs = clean(attrs)
+        attrs[ATTR_STALE] = self.area.id in self.coordinator.stale_area_ids
+        if not self.coordinator.minute_countdowns:
+            for key in COUNTDOWN_ATTRS:
+                attrs.pop(key, None)
+        self._attr_extra_state_attributes = clean(attrs)
+
+    def _projection(self, stage: Stage, now: datetime) -> dict:
+        """Return the compact ``projection`` attribute for ``stage``.
+
+        Outages are ``[start, end]`` pairs that have not ended, until the
+        forecast horizon. The window is anchored to the start of the local day
+        rather than to now, so a running outage keeps its start and the
+        attribute only changes when an outage ends or the day rolls over.
+        """
+        start = dt_util.start_of_local_day()
+        end = start + self.coordinator.stage_coordinator.forecast_horizon
+        slots = self.coordinator.project_stage(self.area.id, stage, start, end)
+        outages = [
+            [slot.start_time, slot.end_time] for slot in slots if slot.end_time > now
+        ]
+        limit = self.coordinator.stage_coordinator.list_attr_limit
+        return {ATTR_STAGE: stage.value, ATTR_OUTAGES: outages[:limit]}
 
-        self._attr_extra_state_attributes = attrs
-        return self._attr_extra_state_attributes
+    def _compact_timeline(self, days: int) -> dict:
+        """Return the ``timeline`` attribute: ``days`` of stages from midnight.
+
+        Encoded only when the forecast or the day changes.
+        """
+        forecast = self.data.get(ATTR_FORECAST, [])
+        start = dt_util.start_of_local_day()
+        compact = self._compact
+        if (
+            compact is None
+            or compact[0] is not forecast
+            or compact[1:3] != (start, days)
+        ):
+            attr = {
+                ATTR_START: start,
+                ATTR_STAGES: encode_timeline(forecast, start, days),
+            }
+            compact = self._compact = (forecast, start, days, attr)
+        return compact[3]
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
         if data := self.coordinator.data:
             self.data = data.get(self.area.id)
-            # Explicitly get the native value to force state update
-            self._attr_native_value = self.native_value
+            if self.data:
+                self._update_from_data()
             self.async_write_ha_state()
 
 
+class LoadSheddingAreasSensorEntity(
+    LoadSheddingDevice, CoordinatorEntity, SensorEntity
+):
+    """Define a sensor combining the outages of every configured area.
+
+    On while any area is off, or with ``every`` while all of them are. The
+    combined outages come from the coordinator's ``outage_sweep``, which is
+    only recomputed when an area forecast changes.
+    """
+
+    def __init__(self, coordinator: CoordinatorEntity, every: bool) -> None:
+        """Initialize."""
+        super().__init__(coordinator)
+        self.every = every
+        kind = "all_areas" if every else "any_area"
+
+        self.entity_description = LoadSheddingSensorDescription(
+            key=f"{DOMAIN} {kind}",
+            icon="mdi:home-group",
+            name=f"{DOMAIN} {kind}",
+            entity_registry_enabled_default=True,
+        )
+        self._attr_unique_id = f"{self.coordinator.config_entry.entry_id}_{kind}"
+        self.entity_id = f"{SENSOR_DOMAIN}.{DOMAIN}_{kind}"
+
+    async def async_added_to_hass(self) -> None:
+        """Handle entity which will be added."""
+        self._update_from_data()
+        await super().async_added_to_hass()
+
+    @property
+    def name(self) -> str | None:
+        """Return the aggregate sensor name."""
+        return "All areas off" if self.every else "Any area off"
+
+    @callback
+    def _update_from_data(self) -> None:
+        """Derive the state and the current/next outage from the sweep."""
+        sweep = self.coordinator.outage_sweep()
+        outages = sweep.intersection if self.every else sweep.union
+        summary = summarize_outages(outages, datetime.now(UTC))
+        self._attr_native_value = STATE_ON if ATTR_START_TIME in summary else STATE_OFF
+
+        attrs = {key: DEFAULT_DATA[key] for key in AGGREGATE_ATTRS}
+        for key, value in summary.items():
+            attrs[key] = value.isoformat() if isinstance(value, datetime) else value
+        attrs[ATTR_LAST_UPDATE] = self.coordinator.last_update
+        if not self.coordinator.minute_countdowns:
+            for key in COUNTDOWN_ATTRS:
+                attrs.pop(key, None)
+        self._attr_extra_state_attributes = attrs
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_from_data()
+        self.async_write_ha_state()
+
+
+class LoadSheddingAreaTimestampSensorEntity(
+    LoadSheddingDevice, CoordinatorEntity, SensorEntity
+):
+    """Define a sensor of when an area's next outage starts, or with ``end`` ends.
+
+    The end is that of the running outage, if any. Unlike the ``starts_in`` and
+    ``ends_in`` minutes the state only changes at outage boundaries; the
+    frontend renders the countdown.
+    """
+
+    _attr_device_class = SensorDeviceClass.TIMESTAMP
+
+    def __init__(self, coordinator: CoordinatorEntity, area: Area, end: bool) -> None:
+        """Initialize."""
+        super().__init__(coordinator)
+        self.area = area
+        self.end = end
+        self._timeline: ForecastTimeline | None = None
+        kind = "next_end" if end else "next_start"
+
+        self.entity_description = LoadSheddingSensorDescription(
+            key=f"{DOMAIN} {kind} {area.id}",
+            icon="mdi:timer-off-outline" if end else "mdi:timer-outline",
+            name=f"{DOMAIN} {kind} {area.name}",
+            entity_registry_enabled_default=True,
+        )
+        self._attr_unique_id = (
+            f"{self.coordinator.config_entry.entry_id}_{kind}_{area.id}"
+        )
+        self.entity_id = f"{SENSOR_DOMAIN}.{DOMAIN}_{kind}_{area.id.replace('-', '_')}"
+
+    async def async_added_to_hass(self) -> None:
+        """Handle entity which will be added."""
+        self._update_from_data()
+        await super().async_added_to_hass()
+
+    @property
+    def name(self) -> str | None:
+        """Return the timestamp sensor name."""
+        return f"{self.area.name} next {'end' if self.end else 'start'}"
+
+    @callback
+    def _update_from_data(self) -> None:
+        """Read the boundary from the summary of the area forecast."""
+        data = self.coordinator.data.get(self.area.id)
+        if not data:
+            self._attr_native_value = None
+            return
+        self._timeline = cached_timeline(
+            self._timeline, data.get(ATTR_FORECAST, []), merge_contiguous=True
+        )
+        summary = self._timeline.summary(datetime.now(UTC))
+        if not self.end:
+            self._attr_native_value = summary.get(ATTR_NEXT_START_TIME)
+        elif ATTR_END_TIME in summary:
+            self._attr_native_value = summary[ATTR_END_TIME]
+        else:
+            self._attr_native_value = summary.get(ATTR_NEXT_END_TIME)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_from_data()
+        self.async_write_ha_state()
+
+
+class LoadSheddingOutageMinutesSensorEntity(
+    LoadSheddingDevice, CoordinatorEntity, SensorEntity
+):
+    """Define a sensor of an area's outage minutes in the next ``hours``.
+
+    Read from the coordinator's prefix sums over the forecast, so each update
+    is two bisects rather than a walk over the forecast.
+    """
+
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_native_unit_of_measurement = UnitOfTime.MINUTES
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(self, coordinator: CoordinatorEntity, area: Area, hours: int) -> None:
+        """Initialize."""
+        super().__init__(coordinator)
+        self.area = area
+        self.hours = hours
+        area_id = area.id.replace("-", "_")
+
+        self.entity_description = LoadSheddingSensorDescription(
+            key=f"{DOMAIN} outage minutes {area.id}",
+            icon="mdi:timer-outline",
+            name=f"{DOMAIN} outage minutes {area.name}",
+            entity_registry_enabled_default=True,
+        )
+        self._attr_unique_id = (
+            f"{self.coordinator.config_entry.entry_id}_outage_minutes_{area.id}"
+        )
+        self.entity_id = f"{SENSOR_DOMAIN}.{DOMAIN}_outage_minutes_{area_id}"
+
+    async def async_added_to_hass(self) -> None:
+        """Handle entity which will be added."""
+        self._update_from_data()
+        await super().async_added_to_hass()
+
+    @property
+    def name(self) -> str | None:
+        """Return the outage minutes sensor name."""
+        return f"{self.area.name} outage minutes next {self.hours}h"
+
+    @callback
+    def _update_from_data(self) -> None:
+        """Sum the forecast outages from now until ``hours`` from now."""
+        now = datetime.now(UTC).replace(microsecond=0)
+        index = self.coordinator.outage_minutes(self.area.id)
+        self._attr_native_value = index.minutes(now, now + timedelta(hours=self.hours))
+        self._attr_extra_state_attributes = {
+            ATTR_AREA_ID: self.area.id,
+            ATTR_LAST_UPDATE: self.coordinator.last_update,
+        }
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_from_data()
+        self.async_write_ha_state()
+
+
 class LoadSheddingQuotaSensorEntity(
     LoadSheddingDevice, CoordinatorEntity, RestoreSensor
 ):
@@ -401,18 +666,11 @@ class LoadSheddingQuotaSensorEntity(
 
     async def async_added_to_hass(self) -> None:
         """Handle entity which will be added."""
-        if restored_data := await self.async_get_last_sensor_data():
-            self._attr_native_value = restored_data.native_value
         # Fallback for when the #116 cache has no persisted rate-limit snapshot
         # to reseed: restore the last known quota attributes so count/limit/
         # remaining survive until the first live poll repopulates them.
-        if attrs := restorable_attrs(
-            await self.async_get_last_state(), QUOTA_RESTORABLE_ATTRS
-        ):
-            if not hasattr(self, "_attr_extra_state_attributes"):
-                self._attr_extra_state_attributes = {}
-            if not self._attr_extra_state_attributes:
-                self._attr_extra_state_attributes = attrs
+        if not getattr(self.coordinator.sepush, "_rate_limit", None):
+            await async_restore_last_state(self, QUOTA_RESTORABLE_ATTRS)
         await super().async_added_to_hass()
 
     def _quota(self) -> dict:
@@ -500,25 +758,42 @@ def stage_forecast_to_data(stage_forecast: list) -> list:
     return data
 
 
+def cached_timeline(
+    timeline: ForecastTimeline | None, forecast: list, *, merge_contiguous: bool
+) -> ForecastTimeline:
+    """Return ``timeline`` if it was built from ``forecast``, else a new one.
+
+    Coordinators replace a forecast list rather than mutating it, so identity
+    tells whether the timeline is still current.
+    """
+    if timeline is None or timeline.forecast is not forecast:
+        timeline = ForecastTimeline(forecast, merge_contiguous=merge_contiguous)
+    return timeline
+
+
 def get_sensor_attrs(
     forecast: list,
     stage: Stage = Stage.NO_LOAD_SHEDDING,
     *,
     merge_contiguous: bool = False,
+    now: datetime | None = None,
+    summary: dict | None = None,
 ) -> dict:
     """Get sensor attributes for the given forecast and stage.
 
     ``merge_contiguous`` extends end times across back-to-back slots. It must be
     True only for the area forecast (#54); the stage ``planned`` list is
     contiguous by construction and must keep its per-stage boundaries and
-    ``next_*`` fields (default False).
+    ``next_*`` fields (default False). ``now`` defaults to the current time;
+    ``summary`` takes precomputed summary fields for that ``now``.
     """
     return build_sensor_attrs(
         forecast,
         stage,
         DEFAULT_DATA,
-        datetime.now(UTC),
+        now or datetime.now(UTC),
         merge_contiguous=merge_contiguous,
+        summary=summary,
     )
 
 
@@ -0,0 +1,238 @@
+"""Services for the Load Shedding integration."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from datetime import UTC, datetime
+
+from load_shedding.providers import Stage
+import voluptuous as vol
+
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    ATTR_AREA,
+    ATTR_AREA_ID,
+    ATTR_AREAS,
+    ATTR_DURATION,
+    ATTR_END,
+    ATTR_END_TIME,
+    ATTR_FORECAST,
+    ATTR_HORIZON,
+    ATTR_STAGE,
+    ATTR_START,
+    ATTR_START_TIME,
+    ATTR_UNAVAILABLE_AREAS,
+    ATTR_WINDOWS,
+    DOMAIN,
+    SERVICE_FIND_FREE_WINDOWS,
+    SERVICE_OUTAGE_MINUTES,
+    SERVICE_PROJECT_STAGE,
+)
+from .helpers import free_windows, sweep_outages
+
+PROJECT_STAGE_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_STAGE): vol.All(vol.Coerce(int), vol.Range(min=1, max=8)),
+        vol.Optional(ATTR_AREA_ID): cv.string,
+        vol.Optional(ATTR_START): cv.datetime,
+        vol.Optional(ATTR_END): cv.datetime,
+    }
+)
+
+FIND_FREE_WINDOWS_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_DURATION): cv.positive_time_period,
+        vol.Optional(ATTR_HORIZON): cv.positive_time_period,
+        vol.Optional(ATTR_AREA_ID): vol.All(cv.ensure_list, [cv.string]),
+    }
+)
+
+OUTAGE_MINUTES_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_AREA_ID): cv.string,
+        vol.Optional(ATTR_START): cv.datetime,
+        vol.Optional(ATTR_END): cv.datetime,
+    }
+)
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the Load Shedding services."""
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PROJECT_STAGE,
+        _async_project_stage,
+        schema=PROJECT_STAGE_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_FIND_FREE_WINDOWS,
+        _async_find_free_windows,
+        schema=FIND_FREE_WINDOWS_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_OUTAGE_MINUTES,
+        _async_outage_minutes,
+        schema=OUTAGE_MINUTES_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Return ``value`` in UTC, reading a naive value as local time."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=dt_util.get_default_time_zone())
+    return value.astimezone(UTC)
+
+
+def _area_coordinators(hass: HomeAssistant, area_ids: Iterable[str] = ()) -> list:
+    """Return the area coordinators to serve, one per config entry.
+
+    Raises ``ServiceValidationError`` when one of ``area_ids`` is not
+    configured.
+    """
+    coordinators = [
+        entry_data[ATTR_AREA] for entry_data in hass.data.get(DOMAIN, {}).values()
+    ]
+    configured = {area.id for coordinator in coordinators for area in coordinator.areas}
+    for area_id in area_ids:
+        if area_id not in configured:
+            raise ServiceValidationError(
+                translation_domain=DOMAIN,
+                translation_key="unknown_area",
+                translation_placeholders={ATTR_AREA_ID: area_id},
+            )
+    return coordinators
+
+
+def _call_window(call: ServiceCall) -> tuple[datetime, datetime | None]:
+    """Return the ``start`` (default now) and optional ``end`` of a call.
+
+    Raises ``ServiceValidationError`` when ``end`` is not after ``start``.
+    """
+    start = _as_utc(call.data.get(ATTR_START) or datetime.now(UTC))
+    end = call.data.get(ATTR_END)
+    if end is not None:
+        end = _as_utc(end)
+        if end <= start:
+            raise ServiceValidationError(
+                translation_domain=DOMAIN, translation_key="invalid_window"
+            )
+    return start, end
+
+
+def _window(start: datetime, end: datetime) -> dict:
+    """Return a ``start_time``/``end_time`` response entry."""
+    return {ATTR_START_TIME: start.isoformat(), ATTR_END_TIME: end.isoformat()}
+
+
+async def _async_project_stage(call: ServiceCall) -> ServiceResponse:
+    """Return each area's outages if ``stage`` applied over the window.
+
+    The window defaults to now until the forecast horizon.
+    """
+    stage = Stage(call.data[ATTR_STAGE])
+    area_id = call.data.get(ATTR_AREA_ID)
+    start, end = _call_window(call)
+
+    areas: dict[str, list] = {}
+    area_ids = [] if area_id is None else [area_id]
+    for coordinator in _area_coordinators(call.hass, area_ids):
+        window_end = end or start + coordinator.stage_coordinator.forecast_horizon
+        for area in coordinator.areas:
+            if area_id is not None and area.id != area_id:
+                continue
+            areas[area.id] = [
+                _window(slot.start_time, slot.end_time)
+                for slot in coordinator.project_stage(
+                    area.id, stage, start, window_end
+                )
+            ]
+    return {ATTR_STAGE: stage.value, ATTR_AREAS: areas}
+
+
+async def _async_find_free_windows(call: ServiceCall) -> ServiceResponse:
+    """Return the windows of at least ``duration`` with none of the areas off.
+
+    The areas default to every configured area. Windows run from now until
+    ``horizon``, capped at the forecast horizon: beyond it nothing is known.
+    Areas without a forecast yet are left out and listed as unavailable, since
+    counting them as never off would report their outages as free. When the
+    search covers every area of a single entry, its cached any-area sweep is
+    reused.
+    """
+    area_ids = call.data.get(ATTR_AREA_ID, [])
+    forecasts = []
+    horizons = []
+    unavailable = []
+    # Coordinators searched with every area; the only one may reuse its sweep.
+    whole = []
+    for coordinator in _area_coordinators(call.hass, area_ids):
+        selected = []
+        for area in coordinator.areas:
+            if area_ids and area.id not in area_ids:
+                continue
+            if ATTR_FORECAST in coordinator.data.get(area.id, {}):
+                selected.append(area.id)
+            else:
+                unavailable.append(area.id)
+        if not selected:
+            continue
+        if len(selected) == len(coordinator.data):
+            whole.append(coordinator)
+        horizons.append(coordinator.stage_coordinator.forecast_horizon)
+        forecasts.extend(
+            coordinator.data[area_id][ATTR_FORECAST] for area_id in selected
+        )
+    if not forecasts:
+        return {ATTR_WINDOWS: [], ATTR_UNAVAILABLE_AREAS: unavailable}
+
+    if len(horizons) == 1 and whole:
+        outages = whole[0].outage_sweep().union
+    else:
+        outages = sweep_outages(forecasts).union
+    horizon = min(horizons)
+    if ATTR_HORIZON in call.data:
+        horizon = min(horizon, call.data[ATTR_HORIZON])
+    now = datetime.now(UTC).replace(microsecond=0)
+    windows = free_windows(outages, now, now + horizon, call.data[ATTR_DURATION])
+    return {
+        ATTR_WINDOWS: [_window(start, end) for start, end in windows],
+        ATTR_UNAVAILABLE_AREAS: unavailable,
+    }
+
+
+async def _async_outage_minutes(call: ServiceCall) -> ServiceResponse:
+    """Return each area's minutes of forecast outage in the window.
+
+    The window defaults to now until the forecast horizon. Answered from the
+    coordinator's prefix sums, not by walking the forecast.
+    """
+    area_id = call.data.get(ATTR_AREA_ID)
+    start, end = _call_window(call)
+
+    areas: dict[str, int] = {}
+    area_ids = [] if area_id is None else [area_id]
+    for coordinator in _area_coordinators(call.hass, area_ids):
+        window_end = end or start + coordinator.stage_coordinator.forecast_horizon
+        for area in coordinator.areas:
+            if area_id is not None and area.id != area_id:
+                continue
+            areas[area.id] = coordinator.outage_minutes(area.id).minutes(
+                start, window_end
+            )
+    return {ATTR_AREAS: areas}
@@ -30,6 +30,26 @@ if str(_COMPONENT_DIR) not in sys.path:
     # dependency-free ``helpers``/``const`` modules to import standalone.
     sys.path.append(str(_COMPONENT_DIR))
 
+# ``user_properties`` key the setup latency benchmarks report their results under.
+BENCHMARK_PROPERTY = "benchmark"
+
+
+def pytest_terminal_summary(terminalreporter) -> None:
+    """Print the setup latency benchmark results after the test run."""
+    lines = [
+        value
+        for outcome in ("passed", "failed")
+        for report in terminalreporter.stats.get(outcome, [])
+        if report.when == "call"
+        for name, value in report.user_properties
+        if name == BENCHMARK_PROPERTY
+    ]
+    if lines:
+        terminalreporter.section("setup latency")
+        for line in lines:
+            terminalreporter.write_line(line)
+
+
 API_KEY = "test-api-key"
 
 # A valid v3 SePush area id (underscores) and its human name.
@@ -0,0 +1,286 @@
+"""Setup latency benchmarks for the Load Shedding integration.
+
+Times ``async_setup_entry`` for 1, 10 and 100 areas against a mocked SePush with
+a cold cache (nothing persisted), a warm cache (within the update interval) and a
+stale cache (older than the update interval), and prints a per-phase breakdown:
+
+* ``store_io``     — loading both coordinator Stores
+* ``deserialize``  — re-inflating the cached stage/area data
+* ``entities``     — forwarding the calendar/sensor platforms
+* ``setup``        — ``async_setup_entry`` returning (what blocks HA startup)
+* ``refresh``      — the background first refresh (stage then area)
+* ``total``        — setup plus everything it scheduled, until idle
+
+Phases that run concurrently (the two Store loads) overlap in the breakdown.
+
+The benchmarks are deselected by default (see ``pytest.ini``); run them with
+``./scripts/benchmark``. Set ``LOAD_SHEDDING_BENCH_MAX_SETUP_MS`` and/or
+``LOAD_SHEDDING_BENCH_MAX_TOTAL_MS`` to fail when a scenario exceeds the given
+budget, so startup regressions are caught. The results are printed in a
+"setup latency" section of the test summary.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Callable, Generator
+from contextlib import contextmanager
+from datetime import UTC, datetime, timedelta
+import os
+import time
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from homeassistant.const import CONF_ID, CONF_NAME
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+import custom_components.load_shedding as load_shedding
+from custom_components.load_shedding.const import (
+    AREA_UPDATE_INTERVAL,
+    DOMAIN,
+    STAGE_UPDATE_INTERVAL,
+)
+
+from .conftest import BENCHMARK_PROPERTY, build_config_entry
+
+pytestmark = pytest.mark.benchmark
+
+AREA_COUNTS = (1, 10, 100)
+CACHE_STATES = ("cold", "warm", "stale")
+FORECAST_DAYS = 7
+
+MAX_SETUP_MS = os.environ.get("LOAD_SHEDDING_BENCH_MAX_SETUP_MS")
+MAX_TOTAL_MS = os.environ.get("LOAD_SHEDDING_BENCH_MAX_TOTAL_MS")
+
+
+def _area_payload(days: int = FORECAST_DAYS) -> dict:
+    """Return a SePush ``/area`` payload with a full 8-stage schedule per day.
+
+    Stage ``n`` has ``n`` two-hour slots per day, spread four hours apart, which
+    roughly matches the slot density of a real municipal schedule.
+    """
+    start = datetime.now(UTC).date()
+    schedule_days = []
+    for offset in range(days):
+        stages = [
+            [
+                f"{(4 * slot + stage) % 24:02d}:00-{(4 * slot + stage + 2) % 24:02d}:30"
+                for slot in range(stage + 1)
+            ]
+            for stage in range(8)
+        ]
+        schedule_days.append(
+            {"date": (start + timedelta(days=offset)).isoformat(), "stages": stages}
+        )
+    return {
+        "events": [
+            {
+                "note": "Stage 2",
+                "start": f"{start.isoformat()}T20:00:00+02:00",
+                "end": f"{start.isoformat()}T22:30:00+02:00",
+            }
+        ],
+        "schedule": {"days": schedule_days},
+    }
+
+
+def _areas(count: int) -> list[dict]:
+    """Return ``count`` configured v3 areas."""
+    return [
+        {
+            CONF_ID: f"za_bench_area_{idx}",
+            CONF_NAME: f"Bench Area {idx}",
+            "description": f"Bench Area {idx}",
+        }
+        for idx in range(count)
+    ]
+
+
+class PhaseTimer:
+    """Accumulate wall-clock time per named setup phase."""
+
+    def __init__(self) -> None:
+        """Initialize the timer."""
+        self.totals: dict[str, float] = defaultdict(float)
+
+    @contextmanager
+    def phase(self, name: str) -> Generator[None]:
+        """Add the time spent in the block to ``name``."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.totals[name] += time.perf_counter() - start
+
+    def wrap_sync(self, name: str, func: Callable) -> Callable:
+        """Return ``func`` timed under ``name``."""
+
+        def _timed(*args: Any, **kwargs: Any) -> Any:
+            with self.phase(name):
+                return func(*args, **kwargs)
+
+        return _timed
+
+    def wrap_async(self, name: str, func: Callable) -> Callable:
+        """Return the coroutine function ``func`` timed under ``name``."""
+
+        async def _timed(*args: Any, **kwargs: Any) -> Any:
+            with self.phase(name):
+                return await func(*args, **kwargs)
+
+        return _timed
+
+    def ms(self, name: str) -> float:
+        """Return the total for ``name`` in milliseconds."""
+        return self.totals.get(name, 0.0) * 1000
+
+
+@contextmanager
+def _instrumented(hass: HomeAssistant, timer: PhaseTimer) -> Generator[None]:
+    """Patch the integration's setup phases to report into ``timer``."""
+    orig_load = Store.async_load
+
+    async def _timed_load(store: Store) -> Any:
+        if not store.key.startswith(f"{DOMAIN}."):
+            return await orig_load(store)
+        with timer.phase("store_io"):
+            return await orig_load(store)
+
+    with (
+        patch.object(Store, "async_load", _timed_load),
+        patch.object(
+            load_shedding,
+            "_deserialize_stage_data",
+            timer.wrap_sync("deserialize", load_shedding._deserialize_stage_data),
+        ),
+        patch.object(
+            load_shedding,
+            "_deserialize_area_data",
+            timer.wrap_sync("deserialize", load_shedding._deserialize_area_data),
+        ),
+        patch.object(
+            load_shedding,
+            "async_setup_entry",
+            timer.wrap_async("setup", load_shedding.async_setup_entry),
+        ),
+        patch.object(
+            load_shedding,
+            "_async_first_refresh",
+            timer.wrap_async("refresh", load_shedding._async_first_refresh),
+        ),
+        patch.object(
+            hass.config_entries,
+            "async_forward_entry_setups",
+            timer.wrap_async(
+                "entities", hass.config_entries.async_forward_entry_setups
+            ),
+        ),
+    ):
+        yield
+
+
+async def _prime_cache(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    entry_id: str,
+    cache_state: str,
+) -> None:
+    """Populate the Stores with a real poll, then age them for ``cache_state``.
+
+    The benchmark runs on the real clock (a frozen clock would also freeze
+    ``perf_counter``), so the cache age is set explicitly rather than ticked.
+    """
+    assert await hass.config_entries.async_setup(entry_id)
+    await hass.async_block_till_done()
+    assert await hass.config_entries.async_unload(entry_id)
+    await hass.async_block_till_done()
+
+    now = datetime.now(UTC)
+    ages = {
+        # should_refresh() treats a zero-age cache as due, so keep it non-zero.
+        "warm": {"stage": timedelta(minutes=1), "area": timedelta(minutes=1)},
+        "stale": {
+            "stage": timedelta(seconds=STAGE_UPDATE_INTERVAL + 60),
+            "area": timedelta(seconds=AREA_UPDATE_INTERVAL + 60),
+        },
+    }[cache_state]
+    for kind, age in ages.items():
+        hass_storage[f"{DOMAIN}.{kind}.{entry_id}"]["data"]["last_update"] = (
+            now - age
+        ).isoformat()
+
+
+def _run_in_executor(sepush: MagicMock) -> tuple[MagicMock, MagicMock]:
+    """Route SePush calls through the executor like the real client.
+
+    The HA test harness resolves executor jobs whose target is a ``Mock``
+    inline, which would run the whole background refresh inside
+    ``async_setup_entry``. Plain function wrappers keep the real scheduling.
+    Returns the underlying ``status``/``area`` mocks for call assertions.
+    """
+    status, area = sepush.status, sepush.area
+    sepush.status = lambda *args, **kwargs: status(*args, **kwargs)
+    sepush.area = lambda *args, **kwargs: area(*args, **kwargs)
+    return status, area
+
+
+def _report(
+    area_count: int, cache_state: str, timer: PhaseTimer, api_calls: int
+) -> str:
+    """Format one benchmark result line."""
+    phases = ("store_io", "deserialize", "entities", "setup", "refresh", "total")
+    breakdown = "  ".join(f"{name}={timer.ms(name):8.2f}ms" for name in phases)
+    return (
+        f"areas={area_count:<3d} cache={cache_state:<5s} {breakdown}  "
+        f"api_calls={api_calls}"
+    )
+
+
+@pytest.mark.parametrize("cache_state", CACHE_STATES)
+@pytest.mark.parametrize("area_count", AREA_COUNTS)
+async def test_setup_latency(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    mock_sepush: MagicMock,
+    record_property: Callable[[str, object], None],
+    area_count: int,
+    cache_state: str,
+) -> None:
+    """Time config entry setup for the given area count and cache state."""
+    mock_sepush.area.return_value = _area_payload()
+    entry = build_config_entry(areas=_areas(area_count))
+    entry.add_to_hass(hass)
+
+    if cache_state != "cold":
+        await _prime_cache(hass, hass_storage, entry.entry_id, cache_state)
+    mock_sepush.reset_mock()
+    status, area = _run_in_executor(mock_sepush)
+
+    timer = PhaseTimer()
+    with _instrumented(hass, timer):
+        with timer.phase("total"):
+            assert await hass.config_entries.async_setup(entry.entry_id)
+            await hass.async_block_till_done()
+
+    api_calls = status.call_count + area.call_count
+    record_property(
+        BENCHMARK_PROPERTY, _report(area_count, cache_state, timer, api_calls)
+    )
+
+    # A warm cache must be served without touching SePush at all (#116).
+    if cache_state == "warm":
+        status.assert_not_called()
+        area.assert_not_called()
+
+    if MAX_SETUP_MS is not None:
+        assert timer.ms("setup") <= float(MAX_SETUP_MS), (
+            f"setup took {timer.ms('setup'):.2f}ms, budget {MAX_SETUP_MS}ms"
+        )
+    if MAX_TOTAL_MS is not None:
+        assert timer.ms("total") <= float(MAX_TOTAL_MS), (
+            f"setup + first refresh took {timer.ms('total'):.2f}ms, "
+            f"budget {MAX_TOTAL_MS}ms"
+        )
@@ -1,25 +1,30 @@
 """Tests for the Load Shedding calendar platform."""
 
 from datetime import UTC, datetime, timedelta
+from unittest.mock import patch
+
+from freezegun.api import FrozenDateTimeFactory
 
 from homeassistant.components.calendar import (
     DOMAIN as CALENDAR_DOMAIN,
     SERVICE_GET_EVENTS,
 )
+from homeassistant.const import STATE_OFF, STATE_ON
 from homeassistant.core import HomeAssistant
 
 from custom_components.load_shedding.const import (
     ATTR_AREA,
-    ATTR_END_TIME,
     ATTR_FORECAST,
-    ATTR_STAGE,
-    ATTR_START_TIME,
     DOMAIN,
 )
+from custom_components.load_shedding.helpers import Slot
 
 from .conftest import AREA_ID
 
-from pytest_homeassistant_custom_component.common import MockConfigEntry
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
 
 
 async def test_calendar_entity_created(
@@ -61,8 +66,8 @@ async def test_calendar_multi_stage_events(
     mid = start + timedelta(hours=2)
     end = mid + timedelta(hours=2)
     area_coordinator.data[AREA_ID][ATTR_FORECAST] = [
-        {ATTR_STAGE: 2, ATTR_START_TIME: start, ATTR_END_TIME: mid},
-        {ATTR_STAGE: 4, ATTR_START_TIME: mid, ATTR_END_TIME: end},
+        Slot(2, start, mid),
+        Slot(4, mid, end),
     ]
 
     entity = hass.data["calendar"].get_entity("calendar.load_shedding_forecast")
@@ -91,3 +96,81 @@ async def test_calendar_updates_on_coordinator_push(
 
     state = hass.states.get("calendar.load_shedding_forecast")
     assert state is not None
+
+
+async def test_calendar_range_cache_invalidated_on_update(
+    hass: HomeAssistant, init_integration: MockConfigEntry
+) -> None:
+    """Repeated range queries are served from cache until the data changes."""
+    entry = init_integration
+    area_coordinator = hass.data[DOMAIN][entry.entry_id][ATTR_AREA]
+    entity = hass.data["calendar"].get_entity("calendar.load_shedding_forecast")
+    window = (
+        datetime(2026, 6, 18, 0, 0, tzinfo=UTC),
+        datetime(2026, 6, 25, 0, 0, tzinfo=UTC),
+    )
+
+    first = await entity.async_get_events(hass, *window)
+    assert await entity.async_get_events(hass, *window) is first
+
+    area_coordinator.data[AREA_ID][ATTR_FORECAST] = []
+    area_coordinator.async_set_updated_data(area_coordinator.data)
+    await hass.async_block_till_done()
+    assert await entity.async_get_events(hass, *window) == []
+
+
+async def test_calendar_rebuilds_only_changed_areas(
+    hass: HomeAssistant, init_integration: MockConfigEntry
+) -> None:
+    """An update reuses the events of areas whose forecast did not change."""
+    entry = init_integration
+    area_coordinator = hass.data[DOMAIN][entry.entry_id][ATTR_AREA]
+    entity = hass.data["calendar"].get_entity("calendar.load_shedding_forecast")
+    entity._get_event_index()
+    events = entity._area_events[AREA_ID][2]
+
+    await area_coordinator.async_area_forecast()
+    area_coordinator.async_set_updated_data(area_coordinator.data)
+    await hass.async_block_till_done()
+    assert entity._area_events[AREA_ID][2] is events
+
+    start = datetime(2026, 6, 18, 18, 0, tzinfo=UTC)
+    end = start + timedelta(hours=2)
+    area_coordinator.data[AREA_ID][ATTR_FORECAST] = [
+        Slot(2, start, end),
+    ]
+    area_coordinator.async_set_updated_data(area_coordinator.data)
+    await hass.async_block_till_done()
+    assert entity._area_events[AREA_ID][2] is not events
+    assert entity._area_events[AREA_ID][2][0]["start"] == start
+
+
+async def test_calendar_writes_state_only_at_transitions(
+    hass: HomeAssistant,
+    init_integration: MockConfigEntry,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Unchanged coordinator pushes do not rewrite the calendar state.
+
+    The state turns on exactly at the event start instead of at the next
+    coordinator tick.
+    """
+    entity = hass.data["calendar"].get_entity("calendar.load_shedding_forecast")
+    event = entity.event
+    assert event is not None
+    assert hass.states.get("calendar.load_shedding_forecast").state == STATE_OFF
+
+    with patch.object(
+        entity, "async_write_ha_state", wraps=entity.async_write_ha_state
+    ) as write_state:
+        freezer.move_to(event.start - timedelta(seconds=90))
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+        write_state.assert_not_called()
+
+        freezer.move_to(event.start)
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+
+    assert write_state.call_count == 1
+    assert hass.states.get("calendar.load_shedding_forecast").state == STATE_ON
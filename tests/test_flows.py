@@ -1,28 +1,37 @@
 """Tests for the Load Shedding config and options flows."""
 
+from datetime import timedelta
 from unittest.mock import MagicMock, patch
 
 from freezegun.api import FrozenDateTimeFactory
 from load_shedding.libs.sepush import SePushError
-from load_shedding.providers import Area, Province, ProviderError
+from load_shedding.providers import Area, Province, ProviderError, Stage
 import pytest
 
 from homeassistant.config_entries import SOURCE_USER
 from homeassistant.const import CONF_API_KEY, CONF_ID, CONF_NAME
 from homeassistant.core import HomeAssistant
-from homeassistant.data_entry_flow import FlowResultType
+from homeassistant.data_entry_flow import FlowResultType, InvalidData
 
 from custom_components.load_shedding.config_flow import _get_sepush_status_code
 from custom_components.load_shedding.const import (
+    ATTR_AREA,
+    ATTR_STAGE,
     CONF_ACTION,
     CONF_ADD_AREA,
     CONF_AREA_ID,
     CONF_AREAS,
     CONF_DELETE_AREA,
+    CONF_FORECAST_DAYS,
+    CONF_INVALID_AREA_EXPIRY,
     CONF_MIN_EVENT_DURATION,
+    CONF_MINUTE_COUNTDOWNS,
     CONF_MULTI_STAGE_EVENTS,
+    CONF_OUTAGE_MINUTES_HOURS,
+    CONF_PROJECTION_STAGE,
     CONF_SEARCH,
     CONF_SETUP_API,
+    CONF_TIMELINE_DAYS,
     DOMAIN,
 )
 
@@ -200,7 +209,7 @@ async def test_user_flow_area_search_error_codes(
 async def test_options_flow_set_durations(
     hass: HomeAssistant, init_integration: MockConfigEntry
 ) -> None:
-    """The options init step stores the event options."""
+    """The options init step stores the event and horizon options."""
     result = await hass.config_entries.options.async_init(
         init_integration.entry_id
     )
@@ -209,12 +218,44 @@ async def test_options_flow_set_durations(
 
     result = await hass.config_entries.options.async_configure(
         result["flow_id"],
-        {CONF_MULTI_STAGE_EVENTS: False, CONF_MIN_EVENT_DURATION: 45},
+        {
+            CONF_MULTI_STAGE_EVENTS: False,
+            CONF_MIN_EVENT_DURATION: 45,
+            CONF_FORECAST_DAYS: 3,
+            CONF_PROJECTION_STAGE: 6,
+            CONF_OUTAGE_MINUTES_HOURS: 24,
+            CONF_TIMELINE_DAYS: 2,
+            CONF_MINUTE_COUNTDOWNS: False,
+        },
     )
     await hass.async_block_till_done()
     assert result["type"] is FlowResultType.CREATE_ENTRY
     assert init_integration.options[CONF_MIN_EVENT_DURATION] == 45
     assert init_integration.options[CONF_MULTI_STAGE_EVENTS] is False
+    assert init_integration.options[CONF_FORECAST_DAYS] == 3
+    assert init_integration.options[CONF_PROJECTION_STAGE] == 6
+    coordinators = hass.data[DOMAIN][init_integration.entry_id]
+    assert coordinators[ATTR_STAGE].forecast_horizon == timedelta(days=3)
+    assert coordinators[ATTR_STAGE].list_attr_limit == 24
+    assert coordinators[ATTR_AREA].projection_stage is Stage.STAGE_6
+    assert coordinators[ATTR_AREA].outage_minutes_hours == 24
+    assert coordinators[ATTR_AREA].timeline_days == 2
+    assert coordinators[ATTR_AREA].minute_countdowns is False
+
+
+
+@pytest.mark.parametrize("expiry", [0, -1])
+async def test_options_flow_rejects_invalid_area_expiry(
+    hass: HomeAssistant, init_integration: MockConfigEntry, expiry: int
+) -> None:
+    """Invalid areas must be remembered for at least a day."""
+    result = await hass.config_entries.options.async_init(
+        init_integration.entry_id
+    )
+    with pytest.raises(InvalidData):
+        await hass.config_entries.options.async_configure(
+            result["flow_id"], {CONF_INVALID_AREA_EXPIRY: expiry}
+        )
 
 
 async def test_options_flow_add_area(
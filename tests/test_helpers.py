@@ -5,9 +5,11 @@ the integration's behaviour can be verified without a full Home Assistant
 install. ``conftest.py`` puts the component directory on ``sys.path``.
 """
 from datetime import datetime, timedelta, timezone
+import random
 
 import helpers
 from load_shedding.providers import Stage
+import pytest
 
 UTC = timezone.utc
 NOW = datetime(2026, 6, 18, 12, 0, tzinfo=UTC)
@@ -20,11 +22,11 @@ ATTR_FORECAST = "forecast"
 
 def _slot(stage, start_min, end_min):
     """Build a forecast slot using minute offsets from NOW."""
-    return {
-        ATTR_STAGE: Stage(stage) if isinstance(stage, int) else stage,
-        ATTR_START_TIME: NOW + timedelta(minutes=start_min),
-        ATTR_END_TIME: NOW + timedelta(minutes=end_min),
-    }
+    return helpers.Slot(
+        Stage(stage) if isinstance(stage, int) else stage,
+        NOW + timedelta(minutes=start_min),
+        NOW + timedelta(minutes=end_min),
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -55,6 +57,113 @@ class TestShouldRefresh:
         ) is False
 
 
+# ---------------------------------------------------------------------------
+# prune_invalid_area_ids — persisted negative cache for legacy area ids
+# ---------------------------------------------------------------------------
+
+class TestPruneInvalidAreaIds:
+    MAX_AGE = timedelta(days=7)
+
+    def _entry(self, age):
+        return {"status_code": 400, "timestamp": NOW - age}
+
+    def test_keeps_fresh_configured_entry(self):
+        invalid = {"a-1": self._entry(timedelta(days=1))}
+        out = helpers.prune_invalid_area_ids(invalid, ["a-1"], NOW, self.MAX_AGE)
+        assert out == invalid
+
+    def test_drops_expired_entry(self):
+        invalid = {"a-1": self._entry(timedelta(days=7))}
+        assert helpers.prune_invalid_area_ids(
+            invalid, ["a-1"], NOW, self.MAX_AGE
+        ) == {}
+
+    def test_drops_unconfigured_entry(self):
+        # Removing (and re-adding) the area clears its negative cache entry.
+        invalid = {"a-1": self._entry(timedelta(hours=1))}
+        assert helpers.prune_invalid_area_ids(
+            invalid, ["b_2"], NOW, self.MAX_AGE
+        ) == {}
+
+
+# ---------------------------------------------------------------------------
+# stage labels / TimestampTable
+# ---------------------------------------------------------------------------
+
+class TestInterning:
+    def test_stage_label_table(self):
+        assert helpers.stage_label(Stage.STAGE_2) == "Stage 2"
+        assert helpers.stage_label(Stage.STAGE_2) is helpers.stage_label(
+            Stage.STAGE_2
+        )
+        assert helpers.stage_label(2) == "2"
+
+    def test_joined_labels_are_shared(self):
+        first = helpers.join_stage_labels(("Stage 2", "Stage 4"))
+        assert first == "Stage 2/Stage 4"
+        assert helpers.join_stage_labels(("Stage 2", "Stage 4")) is first
+
+    def test_equal_instants_share_one_object(self):
+        table = helpers.TimestampTable()
+        first = table.intern(NOW)
+        again = table.intern(datetime(2026, 6, 18, 12, 0, tzinfo=UTC))
+        assert again is first
+        minutes = int(NOW.timestamp()) // 60
+        assert table.from_minutes(minutes) is first
+        assert table.from_minutes(minutes + 30) == NOW + timedelta(minutes=30)
+        assert len(table) == 2
+
+    def test_prune_forgets_past_instants(self):
+        table = helpers.TimestampTable()
+        past = table.from_minutes(int(NOW.timestamp()) // 60 - 1)
+        future = table.intern(NOW + timedelta(hours=1))
+        table.prune(NOW)
+        assert len(table) == 1
+        assert table.intern(NOW + timedelta(hours=1)) is future
+        assert table.intern(past) is past
+
+
+# ---------------------------------------------------------------------------
+# drop_ended / prune_area_data / prune_stage_data
+# ---------------------------------------------------------------------------
+
+class TestPruneEnded:
+    def test_drop_ended_prefix(self):
+        slots = [_slot(2, -120, -60), _slot(2, -30, 0), _slot(2, 60, 120)]
+        assert helpers.drop_ended(slots, NOW) == slots[1:]
+
+    def test_nothing_ended_returns_same_list(self):
+        slots = [_slot(2, 0, 60)]
+        assert helpers.drop_ended(slots, NOW) is slots
+
+    def test_prune_area_data(self):
+        forecast = [_slot(4, 60, 120)]
+        area = {
+            "events": [_slot(4, -60, -30), _slot(4, 60, 120)],
+            "schedule": {Stage.STAGE_4: [_slot(4, -60, -30), _slot(4, 60, 120)]},
+            ATTR_FORECAST: forecast,
+        }
+        pruned = helpers.prune_area_data(area, NOW)
+        assert pruned["events"] == [_slot(4, 60, 120)]
+        assert pruned["schedule"] == {Stage.STAGE_4: [_slot(4, 60, 120)]}
+        assert pruned[ATTR_FORECAST] is forecast
+        assert helpers.prune_area_data(pruned, NOW) is pruned
+
+    def test_prune_stage_data(self):
+        current = {"name": "National", "planned": [_slot(2, 0, 60)]}
+        stages = {
+            "eskom": {
+                "name": "National",
+                "planned": [_slot(2, -60, -1), _slot(4, 0, 60)],
+            },
+            "capetown": current,
+        }
+        pruned = helpers.prune_stage_data(stages, NOW)
+        assert pruned["eskom"]["planned"] == [_slot(4, 0, 60)]
+        assert pruned["capetown"] is current
+        assert helpers.prune_stage_data(pruned, NOW) is pruned
+
+
 # ---------------------------------------------------------------------------
 # continuous_block_end
 # ---------------------------------------------------------------------------
@@ -63,7 +172,7 @@ class TestContinuousBlockEnd:
     def test_single_slot(self):
         f = [_slot(2, 0, 120)]
         end, nxt = helpers.continuous_block_end(f, 0)
-        assert end == f[0][ATTR_END_TIME]
+        assert end == f[0].end_time
         assert nxt == 1
 
     def test_contiguous_run(self):
@@ -78,6 +187,35 @@ class TestContinuousBlockEnd:
         assert end == NOW + timedelta(minutes=120)
         assert nxt == 1
 
+    def test_from_middle_of_block(self):
+        f = [_slot(2, 0, 120), _slot(4, 120, 360), _slot(4, 360, 480)]
+        blocks = helpers.forecast_blocks(f)
+        assert helpers.continuous_block_end(f, 1, blocks) == (
+            NOW + timedelta(minutes=480),
+            3,
+        )
+
+
+class TestForecastBlocks:
+    def test_run_length_table(self):
+        f = [
+            _slot(2, 0, 120),
+            _slot(4, 120, 360),
+            _slot(2, 360, 480),
+            _slot(4, 600, 720),
+        ]
+        assert helpers.forecast_blocks(f) == [
+            (0, 3, ("Stage 2", "Stage 4")),
+            (3, 4, ("Stage 4",)),
+        ]
+
+    def test_overlap_is_not_contiguous(self):
+        f = [_slot(2, 0, 150), _slot(2, 120, 270)]
+        assert [b.stop for b in helpers.forecast_blocks(f)] == [1, 2]
+
+    def test_empty(self):
+        assert helpers.forecast_blocks([]) == []
+
 
 # ---------------------------------------------------------------------------
 # merge_forecast
@@ -152,6 +290,444 @@ class TestSummarizeForecast:
         assert out["starts_in"] == 60
 
 
+# ---------------------------------------------------------------------------
+# ForecastTimeline — must agree with the linear helpers it replaces
+# ---------------------------------------------------------------------------
+
+class TestForecastTimeline:
+    # Back-to-back stage change, a 30-minute overlap (SePush 2h30 slots every
+    # 2h), a gap and a NO_LOAD_SHEDDING slot.
+    FORECAST = [
+        _slot(2, -90, 30),
+        _slot(4, 30, 180),
+        _slot(4, 150, 300),
+        _slot(0, 420, 480),
+        _slot(6, 600, 690),
+        _slot(6, 690, 720),
+    ]
+
+    def test_matches_linear_helpers(self):
+        for merge in (True, False):
+            timeline = helpers.ForecastTimeline(self.FORECAST, merge_contiguous=merge)
+            for offset in range(-120, 750, 15):
+                now = NOW + timedelta(minutes=offset, seconds=offset % 2)
+                pending = [s for s in self.FORECAST if s.end_time >= now]
+                assert timeline.pending(now) == pending
+                assert timeline.is_active(now) == helpers.is_load_shedding_active(
+                    self.FORECAST, now
+                )
+                assert timeline.summary(now) == helpers.summarize_forecast(
+                    pending, now, merge_contiguous=merge
+                ), (merge, offset)
+                assert timeline.merged(now) == helpers.merge_forecast(pending)
+                assert timeline.view(now) == (
+                    timeline.is_active(now),
+                    pending,
+                    timeline.merged(now),
+                    timeline.summary(now),
+                )
+
+    def test_boundaries_are_inclusive(self):
+        timeline = helpers.ForecastTimeline(
+            [_slot(2, 0, 60)], merge_contiguous=True
+        )
+        assert timeline.is_active(NOW)
+        assert timeline.is_active(NOW + timedelta(minutes=60))
+        assert not timeline.is_active(NOW + timedelta(minutes=60, seconds=1))
+
+    def test_empty(self):
+        timeline = helpers.ForecastTimeline([], merge_contiguous=True)
+        assert not timeline.is_active(NOW)
+        assert timeline.summary(NOW) == {}
+        assert timeline.pending(NOW) == []
+        assert timeline.merged(NOW) == []
+
+    def test_no_load_shedding_slot_clears_an_overlapping_outage(self):
+        # The first pending slot decides, as in is_load_shedding_active.
+        forecast = [_slot(0, 0, 60), _slot(2, 30, 120)]
+        timeline = helpers.ForecastTimeline(forecast, merge_contiguous=True)
+        assert timeline.mask is None
+        assert not timeline.is_active(NOW + timedelta(minutes=45))
+        assert timeline.is_active(NOW + timedelta(minutes=90))
+        for offset in range(-10, 130, 5):
+            now = NOW + timedelta(minutes=offset)
+            assert timeline.is_active(now) == helpers.is_load_shedding_active(
+                forecast, now
+            )
+
+    def test_unaligned_forecast_skips_the_mask(self):
+        forecast = [_slot(2, 0, 45), _slot(4, 100, 130)]
+        timeline = helpers.ForecastTimeline(forecast, merge_contiguous=True)
+        assert timeline.mask is None
+        for offset in range(-10, 140, 5):
+            now = NOW + timedelta(minutes=offset)
+            assert timeline.is_active(now) == helpers.is_load_shedding_active(
+                forecast, now
+            )
+
+
+# ---------------------------------------------------------------------------
+# OutageMask — half-hour bitmaps
+# ---------------------------------------------------------------------------
+
+
+class TestOutageMask:
+    # NOW is 12:00 UTC: a midnight-crossing slot and a back-to-back stage
+    # change.
+    FORECAST = [
+        _slot(2, 690, 780),
+        _slot(4, 780, 810),
+        _slot(6, 1260, 1320),
+    ]
+
+    def test_unaligned_or_no_load_shedding_slots_have_no_mask(self):
+        assert helpers.OutageMask.from_slots([_slot(2, 0, 45)]) is None
+        assert helpers.OutageMask.from_slots([_slot(0, 0, 60)]) is None
+        assert helpers.OutageMask.from_slots([_slot(2, 0, 60)]) is not None
+
+    def test_is_off_matches_the_slots(self):
+        mask = helpers.OutageMask.from_slots(self.FORECAST)
+        for offset in range(0, 1400, 10):
+            now = NOW + timedelta(minutes=offset, seconds=offset % 3)
+            assert mask.is_off(now) == any(
+                slot.start_time <= now < slot.end_time for slot in self.FORECAST
+            ), offset
+
+    def test_inclusive_end(self):
+        mask = helpers.OutageMask.from_slots([_slot(2, 0, 60)])
+        end = NOW + timedelta(minutes=60)
+        assert not mask.is_off(end)
+        assert mask.is_off(end, inclusive_end=True)
+        assert not mask.is_off(end + timedelta(seconds=1), inclusive_end=True)
+
+
+# ---------------------------------------------------------------------------
+# sweep_outages / summarize_outages — any/all areas off
+# ---------------------------------------------------------------------------
+
+
+def _spell(start_min, end_min):
+    return (NOW + timedelta(minutes=start_min), NOW + timedelta(minutes=end_min))
+
+
+class TestSweepOutages:
+    def test_union_and_intersection(self):
+        first = [_slot(2, 0, 120), _slot(4, 120, 180), _slot(2, 300, 360)]
+        # Overlapping slots of one area count once; NO_LOAD_SHEDDING is not off.
+        second = [_slot(2, 60, 150), _slot(2, 90, 240), _slot(0, 300, 360)]
+        sweep = helpers.sweep_outages([first, second])
+        assert sweep.union == [_spell(0, 240), _spell(300, 360)]
+        assert sweep.intersection == [_spell(60, 180)]
+
+    def test_touching_spells_of_different_areas(self):
+        sweep = helpers.sweep_outages([[_slot(2, 0, 60)], [_slot(2, 60, 120)]])
+        assert sweep.union == [_spell(0, 120)]
+        assert sweep.intersection == []
+
+    def test_an_area_without_outages_is_never_off(self):
+        sweep = helpers.sweep_outages([[_slot(2, 0, 60)], []])
+        assert sweep == ([_spell(0, 60)], [])
+        assert helpers.sweep_outages([]) == ([], [])
+
+    def test_matches_minute_by_minute(self):
+        rng = random.Random(46)
+        for _ in range(50):
+            forecasts = [
+                [
+                    _slot(rng.choice((0, 2, 4)), start, start + length)
+                    for start in rng.sample(range(0, 1440, 30), rng.randint(0, 8))
+                    for length in [rng.choice((0, 30, 150))]
+                ]
+                for _ in range(rng.randint(1, 4))
+            ]
+            sweep = helpers.sweep_outages(forecasts)
+            for minute in range(0, 1600, 15):
+                now = NOW + timedelta(minutes=minute, seconds=1)
+                off = [
+                    any(
+                        s.stage != Stage.NO_LOAD_SHEDDING
+                        and s.start_time <= now < s.end_time
+                        for s in forecast
+                    )
+                    for forecast in forecasts
+                ]
+                assert any(s <= now < e for s, e in sweep.union) == any(off)
+                assert any(s <= now < e for s, e in sweep.intersection) == all(off)
+
+
+class TestSummarizeOutages:
+    OUTAGES = [_spell(0, 60), _spell(120, 180)]
+
+    def test_during(self):
+        now = NOW + timedelta(minutes=30)
+        assert helpers.summarize_outages(self.OUTAGES, now) == {
+            ATTR_START_TIME: NOW,
+            ATTR_END_TIME: NOW + timedelta(minutes=60),
+            "ends_in": 30,
+            "next_start_time": NOW + timedelta(minutes=120),
+            "next_end_time": NOW + timedelta(minutes=180),
+            "starts_in": 90,
+        }
+
+    def test_between_and_after(self):
+        now = NOW + timedelta(minutes=61)
+        assert helpers.summarize_outages(self.OUTAGES, now) == {
+            "next_start_time": NOW + timedelta(minutes=120),
+            "next_end_time": NOW + timedelta(minutes=180),
+            "starts_in": 59,
+        }
+        assert helpers.summarize_outages(self.OUTAGES, NOW + timedelta(days=1)) == {}
+
+    def test_end_is_inclusive(self):
+        summary = helpers.summarize_outages(self.OUTAGES, NOW + timedelta(minutes=60))
+        assert summary[ATTR_END_TIME] == NOW + timedelta(minutes=60)
+
+
+class TestFreeWindows:
+    OUTAGES = [_spell(60, 120), _spell(180, 300)]
+
+    def test_gaps_between_start_and_end(self):
+        windows = helpers.free_windows(
+            self.OUTAGES, NOW, NOW + timedelta(minutes=400), timedelta(minutes=60)
+        )
+        assert windows == [_spell(0, 60), _spell(120, 180), _spell(300, 400)]
+
+    def test_short_gaps_are_dropped(self):
+        windows = helpers.free_windows(
+            self.OUTAGES, NOW, NOW + timedelta(minutes=330), timedelta(minutes=61)
+        )
+        assert windows == []
+
+    def test_starting_inside_an_outage(self):
+        start = NOW + timedelta(minutes=90)
+        windows = helpers.free_windows(
+            self.OUTAGES, start, NOW + timedelta(minutes=240), timedelta(minutes=30)
+        )
+        assert windows == [_spell(120, 180)]
+        # Touching the end of an outage, not inside it.
+        start = NOW + timedelta(minutes=120)
+        windows = helpers.free_windows(
+            self.OUTAGES, start, NOW + timedelta(minutes=180), timedelta(minutes=30)
+        )
+        assert windows == [_spell(120, 180)]
+
+    def test_no_outages(self):
+        end = NOW + timedelta(minutes=30)
+        assert helpers.free_windows([], NOW, end, timedelta(0)) == [(NOW, end)]
+
+
+class TestEncodeTimeline:
+    def test_stage_per_half_hour(self):
+        forecast = [_slot(2, 60, 120), _slot(4, 90, 150), _slot(0, 180, 240)]
+        encoded = helpers.encode_timeline(forecast, NOW, 1)
+        assert len(encoded) == helpers.SLOTS_PER_DAY
+        assert encoded[:6] == "002440"
+        assert set(encoded[6:]) == {"0"}
+
+    def test_partial_slots_and_window_edges(self):
+        # A slot marks every half hour it overlaps, clipped to the window.
+        forecast = [_slot(2, -45, 15), _slot(6, 75, 80), _slot(4, 1425, 1500)]
+        encoded = helpers.encode_timeline(forecast, NOW, 1)
+        assert encoded[:3] == "206"
+        assert encoded[-1] == "4"
+        assert helpers.encode_timeline(forecast, NOW, 0) == ""
+
+
+class TestOutageMinutes:
+    def test_window_queries(self):
+        # Overlapping slots count once; NO_LOAD_SHEDDING is not off.
+        forecast = [
+            _slot(2, 60, 120),
+            _slot(4, 90, 150),
+            _slot(0, 200, 260),
+            _slot(2, 300, 330),
+        ]
+        index = helpers.OutageMinutes.from_forecast(forecast)
+        assert index.minutes(NOW, NOW + timedelta(days=1)) == 120
+        assert index.minutes(*_spell(100, 310)) == 60
+        assert index.minutes(*_spell(150, 300)) == 0
+        assert index.minutes(*_spell(320, 100)) == 0
+        assert index.total(*_spell(0, 61)) == timedelta(minutes=1)
+
+    def test_empty_forecast(self):
+        index = helpers.OutageMinutes.from_forecast([])
+        assert index.minutes(NOW, NOW + timedelta(days=1)) == 0
+
+    def test_matches_summing_the_forecast(self):
+        rng = random.Random(48)
+        for _ in range(50):
+            forecast = [
+                _slot(rng.choice((0, 2, 4)), start, start + rng.choice((30, 150)))
+                for start in sorted(rng.sample(range(0, 1440, 30), rng.randint(0, 8)))
+            ]
+            index = helpers.OutageMinutes.from_forecast(forecast)
+            for _ in range(20):
+                start, end = sorted(rng.sample(range(-60, 1700, 5), 2))
+                off = sum(
+                    any(
+                        s.stage != Stage.NO_LOAD_SHEDDING
+                        and s.start_time <= NOW + timedelta(minutes=m) < s.end_time
+                        for s in forecast
+                    )
+                    for m in range(start, end)
+                )
+                assert index.minutes(*_spell(start, end)) == off
+
+
+# ---------------------------------------------------------------------------
+# area_forecast / VectorForecastEngine — the engines must agree exactly
+# ---------------------------------------------------------------------------
+
+MIN_30 = timedelta(minutes=30)
+HORIZON = NOW + timedelta(days=7)
+
+
+class TestAreaForecast:
+    def test_clips_to_planned_window(self):
+        schedule = {Stage.STAGE_2: [_slot(2, -60, 60), _slot(2, 120, 240)]}
+        planned = [_slot(2, 0, 180)]
+        forecast = helpers.area_forecast(schedule, [], planned, MIN_30, HORIZON)
+        assert forecast == [_slot(2, 0, 60), _slot(2, 120, 180)]
+
+    def test_unclipped_slots_are_shared(self):
+        slot = _slot(4, 60, 120)
+        planned = [_slot(4, 0, 180)]
+        forecast = helpers.area_forecast(
+            {Stage.STAGE_4: [slot]}, [], planned, MIN_30, HORIZON
+        )
+        assert forecast[0] is slot
+
+    def test_drops_short_and_beyond_horizon(self):
+        schedule = {Stage.STAGE_2: [_slot(2, 0, 20), _slot(2, 60, 120)]}
+        planned = [_slot(2, 0, 600)]
+        assert helpers.area_forecast(schedule, [], planned, MIN_30, NOW) == []
+        assert helpers.area_forecast(schedule, [], planned, MIN_30, HORIZON) == [
+            _slot(2, 60, 120)
+        ]
+
+    def test_falls_back_to_events(self):
+        events = [_slot(2, 0, 120), _slot(2, 180, 190)]
+        planned = [_slot(0, 0, 600)]
+        forecast = helpers.area_forecast({}, events, planned, MIN_30, HORIZON)
+        assert forecast == events[:1]
+
+
+def _random_area(rng, durations=(120, 150, 240)):
+    """Return a random ``(schedule, events)``; one duration keeps ends ordered."""
+    schedule = {}
+    for stage in range(1, 9):
+        schedule[Stage(stage)] = [
+            _slot(stage, start, start + rng.choice(durations))
+            for start in sorted(rng.sample(range(-600, 6000, 30), stage + 2))
+        ]
+    events = [
+        _slot(rng.randint(1, 8), start, start + rng.choice((15, 120)))
+        for start in range(-120, 1500, 360)
+    ]
+    return schedule, events
+
+
+def _random_planned(rng):
+    planned, start = [], rng.choice((-300, 0, 45))
+    for _ in range(rng.randint(0, 5)):
+        end = start + rng.choice((30, 90, 300, 1440))
+        planned.append(_slot(rng.randint(0, 8), start, end))
+        start = end + rng.choice((0, 0, 120))
+    return planned
+
+
+class TestStageTimelines:
+    def test_matches_area_forecast(self):
+        rng = random.Random(117)
+        for round_ in range(300):
+            durations = (rng.choice((20, 120, 150)),) if round_ % 4 else (120, 240)
+            schedule, events = _random_area(rng, durations)
+            planned = _random_planned(rng)
+            min_duration = timedelta(minutes=rng.choice((0, 30, 60, 121)))
+            horizon = NOW + timedelta(minutes=rng.choice((600, 3000, 10080)))
+            timelines = helpers.StageTimelines(schedule, events, min_duration)
+            assert timelines.forecast(planned, horizon) == helpers.area_forecast(
+                schedule, events, planned, min_duration, horizon
+            )
+
+    def test_splices_unclipped_slots(self):
+        inside = _slot(4, 60, 120)
+        schedule = {Stage.STAGE_4: [_slot(4, -60, 30), inside, _slot(4, 150, 300)]}
+        timelines = helpers.StageTimelines(schedule, [], MIN_30)
+        forecast = timelines.forecast([_slot(4, 0, 180)], HORIZON)
+        assert forecast == [_slot(4, 0, 30), inside, _slot(4, 150, 180)]
+        assert forecast[1] is inside
+
+    def test_reuses_unchanged_stages(self):
+        schedule = {
+            Stage.STAGE_2: [_slot(2, -60, 60), _slot(2, 120, 240)],
+            Stage.STAGE_4: [_slot(4, 0, 120)],
+        }
+        previous = helpers.StageTimelines(schedule, [], MIN_30)
+        pruned = {**schedule, Stage.STAGE_2: schedule[Stage.STAGE_2][1:]}
+        timelines = helpers.StageTimelines(pruned, [], MIN_30, previous)
+        assert timelines._stages[Stage.STAGE_4] is previous._stages[Stage.STAGE_4]
+        assert timelines._stages[Stage.STAGE_2] is not previous._stages[Stage.STAGE_2]
+        forecast = timelines.forecast([_slot(2, -600, 600)], HORIZON)
+        assert forecast == pruned[Stage.STAGE_2]
+
+    def test_project_ignores_events(self):
+        schedule = {Stage.STAGE_4: [_slot(4, -60, 60), _slot(4, 120, 240)]}
+        events = [_slot(2, 300, 420)]
+        unordered = {**schedule, Stage.STAGE_2: [_slot(2, 0, 300), _slot(2, 60, 120)]}
+        window = (NOW, NOW + timedelta(minutes=180))
+        for timelines in (
+            helpers.StageTimelines(schedule, events, MIN_30),
+            helpers.StageTimelines(unordered, events, MIN_30),
+        ):
+            assert timelines.project(Stage.STAGE_4, *window) == [
+                _slot(4, 0, 60),
+                _slot(4, 120, 180),
+            ]
+            assert timelines.project(Stage.STAGE_6, *window) == []
+
+    def test_unordered_schedule_uses_area_forecast(self):
+        schedule = {Stage.STAGE_2: [_slot(2, 0, 300), _slot(2, 60, 120)]}
+        timelines = helpers.StageTimelines(schedule, [], MIN_30)
+        planned = [_slot(2, 90, 600)]
+        assert not timelines.spliceable
+        assert timelines.forecast(planned, HORIZON) == helpers.area_forecast(
+            schedule, [], planned, MIN_30, HORIZON
+        )
+
+
+@pytest.mark.skipif(not helpers.HAS_NUMPY, reason="NumPy is not installed")
+class TestVectorForecastEngine:
+    def test_matches_area_forecast(self):
+        rng = random.Random(116)
+        engine = helpers.VectorForecastEngine()
+        for _ in range(30):
+            groups = [_random_planned(rng) for _ in range(2)]
+            areas = {
+                f"area_{i}": (*_random_area(rng), groups[i % 2])
+                for i in range(rng.randint(1, 12))
+            }
+            min_duration = timedelta(minutes=rng.choice((0, 30, 60, 121)))
+            horizon = NOW + timedelta(minutes=rng.choice((600, 3000, 10080)))
+            expected = {
+                area_id: helpers.area_forecast(*area, min_duration, horizon)
+                for area_id, area in areas.items()
+            }
+            assert engine.forecasts(areas, min_duration, horizon) == expected
+
+    def test_shares_unclipped_slots_and_reuses_packing(self):
+        slot = _slot(4, 60, 120)
+        schedule, planned = {Stage.STAGE_4: [slot]}, [_slot(4, 0, 180)]
+        engine = helpers.VectorForecastEngine()
+        areas = {"a": (schedule, [], planned)}
+        assert engine.forecasts(areas, MIN_30, HORIZON)["a"][0] is slot
+        packed = engine._packed["a"]
+        engine.forecasts(areas, MIN_30, HORIZON)
+        assert engine._packed["a"] is packed
+        assert engine.forecasts({}, MIN_30, HORIZON) == {}
+        assert not engine._packed
+
+
 # ---------------------------------------------------------------------------
 # filter_restorable_attrs — locks #31 whitelist
 # ---------------------------------------------------------------------------
@@ -254,6 +830,21 @@ class TestCalendarHelpers:
         assert len(a_events) == 1
         assert a_events[0]["summary"] == "Stage 2/Stage 4"
 
+    def test_merge_matches_global_sort(self):
+        areas = [
+            self._area("A", [_slot(2, 0, 60), _slot(2, 240, 300)]),
+            self._area("B", [_slot(4, 120, 180), _slot(4, 0, 30)]),
+            self._area("C", [_slot(6, 60, 90)]),
+        ]
+        events = helpers.build_calendar_events(areas, multi_stage_events=False)
+        assert [(e["start"], e["location"]) for e in events] == [
+            (NOW, "A"),
+            (NOW, "B"),
+            (NOW + timedelta(minutes=60), "C"),
+            (NOW + timedelta(minutes=120), "B"),
+            (NOW + timedelta(minutes=240), "A"),
+        ]
+
     def test_empty_area_skipped(self):
         areas = [self._area("A", None), self._area("B", [])]
         assert helpers.build_calendar_events(areas, multi_stage_events=False) == []
@@ -263,7 +854,7 @@ class TestCalendarHelpers:
             [self._area("A", [_slot(2, -180, -60), _slot(4, -10, 50)])],
             multi_stage_events=False,
         )
-        cur = helpers.current_event(events, NOW)
+        cur = helpers.EventIndex(events).current(NOW)
         assert cur is not None
         assert cur["end"] == NOW + timedelta(minutes=50)
 
@@ -271,7 +862,37 @@ class TestCalendarHelpers:
         events = helpers.build_calendar_events(
             [self._area("A", [_slot(2, -180, -60)])], multi_stage_events=False
         )
-        assert helpers.current_event(events, NOW) is None
+        assert helpers.EventIndex(events).current(NOW) is None
+
+    def test_current_event_skips_short_event_inside_longer_one(self):
+        # A long event in one area keeps the index "open" past a short event
+        # that has already ended in another area.
+        events = helpers.build_calendar_events(
+            [
+                self._area("A", [_slot(2, -120, 120)]),
+                self._area("B", [_slot(4, -60, -30)]),
+            ],
+            multi_stage_events=False,
+        )
+        assert helpers.EventIndex(events).current(NOW)["location"] == "A"
+
+    def test_in_range_matches_linear_scan(self):
+        events = helpers.build_calendar_events(
+            [
+                self._area("A", [_slot(2, 0, 600), _slot(4, 720, 840)]),
+                self._area("B", [_slot(4, 60, 120), _slot(6, 300, 330)]),
+                self._area("C", [_slot(6, 120, 180), _slot(8, 840, 900)]),
+            ],
+            multi_stage_events=False,
+        )
+        index = helpers.EventIndex(events)
+        for lo in range(-60, 960, 30):
+            for hi in range(lo + 30, 990, 90):
+                start = NOW + timedelta(minutes=lo)
+                end = NOW + timedelta(minutes=hi)
+                assert index.in_range(start, end) == [
+                    e for e in events if e["end"] > start and e["start"] < end
+                ]
 
 # ---------------------------------------------------------------------------
 # build_sensor_attrs — locks review HIGH (stage vs area merge distinction)
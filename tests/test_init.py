@@ -1,6 +1,7 @@
 """Tests for the Load Shedding integration setup, unload and coordinators."""
 
 from datetime import UTC, datetime, timedelta
+from typing import Any
 from unittest.mock import MagicMock, patch
 
 from freezegun.api import FrozenDateTimeFactory
@@ -18,6 +19,7 @@ from homeassistant.helpers.update_coordinator import UpdateFailed
 from custom_components.load_shedding import (
     LoadSheddingAreaCoordinator,
     LoadSheddingStageCoordinator,
+    _VECTOR_MIN_AREAS,
     _deserialize_area_data,
     _deserialize_stage_data,
     _serialize_area_data,
@@ -39,6 +41,7 @@ from custom_components.load_shedding.const import (
     DOMAIN,
     STAGE_UPDATE_INTERVAL,
 )
+from custom_components.load_shedding.helpers import HAS_NUMPY, Slot, area_forecast
 
 from .conftest import (
     AREA_ID,
@@ -49,7 +52,10 @@ from .conftest import (
     build_config_entry,
 )
 
-from pytest_homeassistant_custom_component.common import MockConfigEntry
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
 
 
 async def test_setup_and_unload(
@@ -116,6 +122,87 @@ async def test_legacy_area_id_creates_repair_issue(
     assert issue.translation_placeholders == {"areas": LEGACY_AREA_NAME}
 
 
+async def test_legacy_area_id_persisted_and_skipped_on_restart(
+    hass: HomeAssistant, mock_sepush: MagicMock, freezer: FrozenDateTimeFactory
+) -> None:
+    """A persisted invalid area id is skipped and its issue restored offline."""
+    freezer.move_to(FROZEN_TIME)
+    frozen_now = datetime.fromisoformat(FROZEN_TIME)
+    entry = build_config_entry(
+        areas=[
+            {
+                CONF_ID: LEGACY_AREA_ID,
+                CONF_NAME: LEGACY_AREA_NAME,
+                "description": LEGACY_AREA_NAME,
+            }
+        ],
+    )
+    entry.add_to_hass(hass)
+
+    store_data = {
+        "last_update": (frozen_now - timedelta(seconds=1)).isoformat(),
+        "data": {},
+        "invalid_area_ids": {
+            LEGACY_AREA_ID: {
+                "status_code": 400,
+                "timestamp": (frozen_now - timedelta(days=1)).isoformat(),
+            }
+        },
+    }
+
+    async def _fake_load():
+        return store_data
+
+    with patch.object(Store, "async_load", side_effect=_fake_load):
+        await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+    area_coordinator = hass.data[DOMAIN][entry.entry_id][ATTR_AREA]
+    assert LEGACY_AREA_ID in area_coordinator._invalid_area_ids
+    issue = ir.async_get(hass).async_get_issue(
+        DOMAIN, f"invalid_area_ids_{entry.entry_id}"
+    )
+    assert issue is not None
+    assert issue.translation_placeholders == {"areas": LEGACY_AREA_NAME}
+
+    # Even a forced refresh must not spend a credit on the known-invalid id.
+    area_coordinator.last_update = None
+    await area_coordinator._async_update_data()
+    mock_sepush.area.assert_not_called()
+
+
+async def test_expired_invalid_area_id_is_retried(
+    hass: HomeAssistant, mock_sepush: MagicMock, freezer: FrozenDateTimeFactory
+) -> None:
+    """An invalid area id older than the expiry period is requested again."""
+    freezer.move_to(FROZEN_TIME)
+    frozen_now = datetime.fromisoformat(FROZEN_TIME)
+    entry = build_config_entry()
+    entry.add_to_hass(hass)
+
+    store_data = {
+        "last_update": None,
+        "data": {},
+        "invalid_area_ids": {
+            AREA_ID: {
+                "status_code": 400,
+                "timestamp": (frozen_now - timedelta(days=30)).isoformat(),
+            }
+        },
+    }
+
+    async def _fake_load():
+        return store_data
+
+    with patch.object(Store, "async_load", side_effect=_fake_load):
+        await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+    area_coordinator = hass.data[DOMAIN][entry.entry_id][ATTR_AREA]
+    assert area_coordinator._invalid_area_ids == {}
+    mock_sepush.area.assert_called_with(AREA_ID)
+
+
 async def test_valid_area_clears_stale_repair_issue(
     hass: HomeAssistant, init_integration: MockConfigEntry
 ) -> None:
@@ -235,7 +322,7 @@ async def test_stage_coordinator_data(
     assert "eskom" in coordinator.data
     assert coordinator.data["eskom"]["name"] == "National"
     planned = coordinator.data["eskom"]["planned"]
-    assert planned[0][ATTR_STAGE] is Stage.STAGE_2
+    assert planned[0].stage is Stage.STAGE_2
 
 
 async def test_stage_coordinator_cached_within_interval(
@@ -329,11 +416,7 @@ async def test_area_forecast_from_planned_schedule(
         "eskom": {
             ATTR_NAME: "National",
             ATTR_PLANNED: [
-                {
-                    ATTR_STAGE: Stage.STAGE_2,
-                    ATTR_START_TIME: planned_start,
-                    ATTR_END_TIME: planned_end,
-                }
+                Slot(Stage.STAGE_2, planned_start, planned_end)
             ],
         }
     }
@@ -344,11 +427,7 @@ async def test_area_forecast_from_planned_schedule(
         AREA_ID: {
             ATTR_SCHEDULE: {
                 Stage.STAGE_2: [
-                    {
-                        ATTR_STAGE: Stage.STAGE_2,
-                        ATTR_START_TIME: slot_start,
-                        ATTR_END_TIME: slot_end,
-                    }
+                    Slot(Stage.STAGE_2, slot_start, slot_end)
                 ]
             },
             ATTR_EVENTS: [],
@@ -359,9 +438,257 @@ async def test_area_forecast_from_planned_schedule(
 
     forecast = area_coordinator.data[AREA_ID][ATTR_FORECAST]
     assert len(forecast) == 1
-    assert forecast[0][ATTR_STAGE] is Stage.STAGE_2
-    assert forecast[0][ATTR_START_TIME] == slot_start
-    assert forecast[0][ATTR_END_TIME] == slot_end
+    assert forecast[0].stage is Stage.STAGE_2
+    assert forecast[0].start_time == slot_start
+    assert forecast[0].end_time == slot_end
+
+
+async def test_area_forecast_respects_horizon(
+    hass: HomeAssistant, init_integration: MockConfigEntry, freezer: FrozenDateTimeFactory
+) -> None:
+    """Schedule slots that start beyond the forecast horizon are left out."""
+    freezer.move_to(FROZEN_TIME)
+    entry = init_integration
+    area_coordinator: LoadSheddingAreaCoordinator = hass.data[DOMAIN][
+        entry.entry_id
+    ][ATTR_AREA]
+    stage_coordinator = area_coordinator.stage_coordinator
+    stage_coordinator.forecast_horizon = timedelta(days=1)
+
+    now = datetime.fromisoformat(FROZEN_TIME)
+    stage_coordinator.data = {
+        "eskom": {
+            ATTR_NAME: "National",
+            ATTR_PLANNED: [
+                Slot(Stage.STAGE_2, now, now + timedelta(days=3))
+            ],
+        }
+    }
+    slots = [
+        Slot(
+            Stage.STAGE_2,
+            now + timedelta(days=day, hours=10),
+            now + timedelta(days=day, hours=12),
+        )
+        for day in range(3)
+    ]
+    area_coordinator.data = {
+        AREA_ID: {ATTR_SCHEDULE: {Stage.STAGE_2: slots}, ATTR_EVENTS: []}
+    }
+
+    await area_coordinator.async_area_forecast()
+
+    assert area_coordinator.data[AREA_ID][ATTR_FORECAST] == slots[:1]
+
+
+@pytest.mark.parametrize(
+    "use_engine",
+    [
+        pytest.param(
+            True,
+            marks=pytest.mark.skipif(not HAS_NUMPY, reason="NumPy is not installed"),
+        ),
+        False,
+    ],
+)
+async def test_unspliceable_area_forecasts(
+    hass: HomeAssistant,
+    init_integration: MockConfigEntry,
+    freezer: FrozenDateTimeFactory,
+    use_engine: bool,
+) -> None:
+    """Many unspliceable areas go through the NumPy engine, when installed.
+
+    The forecasts equal ``area_forecast`` either way.
+    """
+    freezer.move_to(FROZEN_TIME)
+    area_coordinator: LoadSheddingAreaCoordinator = hass.data[DOMAIN][
+        init_integration.entry_id
+    ][ATTR_AREA]
+    if not use_engine:
+        area_coordinator._vector_engine = None
+    stage_coordinator = area_coordinator.stage_coordinator
+    horizon = datetime.fromisoformat(FROZEN_TIME) + stage_coordinator.forecast_horizon
+
+    now = datetime.fromisoformat(FROZEN_TIME)
+    planned = [
+        Slot(Stage.STAGE_2, now, now + timedelta(hours=20)),
+        Slot(Stage.STAGE_4, now + timedelta(hours=20), now + timedelta(days=2)),
+    ]
+    stage_coordinator.data = {"eskom": {ATTR_NAME: "National", ATTR_PLANNED: planned}}
+    schedules = {}
+    for index in range(_VECTOR_MIN_AREAS):
+        start = now + timedelta(minutes=30 * index)
+        # A long slot around a short one: ordered by start but not by end, so
+        # the schedule cannot be spliced.
+        schedules[f"za_area_{index}"] = {
+            stage: [
+                Slot(stage, start, start + timedelta(hours=6)),
+                Slot(stage, start + timedelta(hours=1), start + timedelta(hours=3)),
+                Slot(stage, start + timedelta(hours=19), start + timedelta(hours=23)),
+            ]
+            for stage in (Stage.STAGE_2, Stage.STAGE_4)
+        }
+    area_coordinator.data = {
+        area_id: {ATTR_SCHEDULE: schedule, ATTR_EVENTS: []}
+        for area_id, schedule in schedules.items()
+    }
+
+    await area_coordinator.async_area_forecast()
+
+    for area_id, schedule in schedules.items():
+        assert area_coordinator.data[area_id][ATTR_FORECAST] == area_forecast(
+            schedule, [], planned, timedelta(minutes=30), horizon
+        )
+    assert all(area_coordinator.data[area_id][ATTR_FORECAST] for area_id in schedules)
+    timelines = area_coordinator._timelines.values()
+    assert not any(timeline.spliceable for timeline in timelines)
+    if use_engine:
+        assert set(area_coordinator._vector_engine._packed) == set(schedules)
+
+
+async def test_stage_change_reuses_schedule_index(
+    hass: HomeAssistant, init_integration: MockConfigEntry, freezer: FrozenDateTimeFactory
+) -> None:
+    """A new stage plan is applied to the existing per-stage schedule index."""
+    freezer.move_to(FROZEN_TIME)
+    area_coordinator: LoadSheddingAreaCoordinator = hass.data[DOMAIN][
+        init_integration.entry_id
+    ][ATTR_AREA]
+    stage_coordinator = area_coordinator.stage_coordinator
+
+    now = datetime.fromisoformat(FROZEN_TIME)
+    schedule = {
+        stage: [
+            Slot(stage, now + timedelta(hours=hour), now + timedelta(hours=hour + 2))
+            for hour in range(0, 24, 8 // stage.value)
+        ]
+        for stage in (Stage.STAGE_2, Stage.STAGE_4)
+    }
+    area_coordinator.data = {AREA_ID: {ATTR_SCHEDULE: schedule, ATTR_EVENTS: []}}
+
+    timeline = None
+    for stage in (Stage.STAGE_2, Stage.STAGE_4):
+        stage_coordinator.data = {
+            "eskom": {
+                ATTR_NAME: "National",
+                ATTR_PLANNED: [Slot(stage, now, now + timedelta(hours=24))],
+            }
+        }
+        await area_coordinator.async_area_forecast()
+
+        assert area_coordinator.data[AREA_ID][ATTR_FORECAST] == schedule[stage]
+        if timeline is not None:
+            assert area_coordinator._timelines[AREA_ID] is timeline
+        timeline = area_coordinator._timelines[AREA_ID]
+
+
+async def test_outage_sweep_follows_forecast_changes(
+    hass: HomeAssistant, init_integration: MockConfigEntry
+) -> None:
+    """The any/all-areas sweep is only recomputed when a forecast changes."""
+    area_coordinator: LoadSheddingAreaCoordinator = hass.data[DOMAIN][
+        init_integration.entry_id
+    ][ATTR_AREA]
+    sweep = area_coordinator.outage_sweep()
+    assert sweep.union
+
+    await area_coordinator.async_area_forecast()
+    assert area_coordinator.outage_sweep() is sweep
+
+    area_coordinator.data[AREA_ID][ATTR_FORECAST] = []
+    assert area_coordinator.outage_sweep() == ([], [])
+
+
+async def test_outage_minutes_follow_forecast_changes(
+    hass: HomeAssistant, init_integration: MockConfigEntry
+) -> None:
+    """An area's outage minutes index is only rebuilt when its forecast changes."""
+    area_coordinator: LoadSheddingAreaCoordinator = hass.data[DOMAIN][
+        init_integration.entry_id
+    ][ATTR_AREA]
+    now = datetime.fromisoformat(FROZEN_TIME)
+    index = area_coordinator.outage_minutes(AREA_ID)
+    assert index.minutes(now, now + timedelta(days=1)) == 150
+
+    await area_coordinator.async_area_forecast()
+    assert area_coordinator.outage_minutes(AREA_ID) is index
+
+    area_coordinator.data[AREA_ID][ATTR_FORECAST] = []
+    index = area_coordinator.outage_minutes(AREA_ID)
+    assert index.minutes(now, now + timedelta(days=1)) == 0
+
+
+async def test_stage_update_respects_horizon(
+    hass: HomeAssistant, init_integration: MockConfigEntry
+) -> None:
+    """Stages starting beyond the horizon are dropped.
+
+    The open-ended last stage runs for a horizon from its own start.
+    """
+    coordinator: LoadSheddingStageCoordinator = hass.data[DOMAIN][
+        init_integration.entry_id
+    ][ATTR_STAGE]
+    coordinator.forecast_horizon = timedelta(hours=6)
+
+    data = await coordinator.async_update_stage()
+
+    # Eskom's stage 4 starts at 18:00 UTC, after the horizon.
+    assert [slot.stage for slot in data["eskom"][ATTR_PLANNED]] == [
+        Stage.STAGE_2
+    ]
+    # Cape Town's stage 1 was announced at 07:00 UTC.
+    assert data["capetown"][ATTR_PLANNED][0].end_time == datetime(
+        2026, 6, 18, 13, 0, tzinfo=UTC
+    )
+
+
+async def test_stage_update_is_stable_between_polls(
+    hass: HomeAssistant,
+    init_integration: MockConfigEntry,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Two polls of the same SePush status give equal stage data."""
+    coordinator: LoadSheddingStageCoordinator = hass.data[DOMAIN][
+        init_integration.entry_id
+    ][ATTR_STAGE]
+    freezer.move_to(FROZEN_TIME)
+    first = await coordinator.async_update_stage()
+    freezer.tick(timedelta(minutes=17))
+    second = await coordinator.async_update_stage()
+
+    assert second == first
+
+
+async def test_area_coordinator_prunes_ended_slots(
+    hass: HomeAssistant,
+    init_integration: MockConfigEntry,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Slots that have ended are dropped from the schedule as time advances."""
+    entry = init_integration
+    coordinator: LoadSheddingAreaCoordinator = hass.data[DOMAIN][entry.entry_id][
+        ATTR_AREA
+    ]
+
+    def _slots() -> list:
+        area_data = coordinator.data[AREA_ID]
+        return area_data[ATTR_EVENTS] + [
+            slot for slots in area_data[ATTR_SCHEDULE].values() for slot in slots
+        ]
+
+    now = datetime.fromisoformat(FROZEN_TIME)
+    before = _slots()
+    assert before
+    assert all(slot.end_time >= now for slot in before)
+
+    later = now + timedelta(hours=13)
+    freezer.move_to(later)
+    await coordinator._async_update_data()
+
+    after = _slots()
+    assert len(after) < len(before)
+    assert all(slot.end_time >= later for slot in after)
 
 
 @pytest.mark.parametrize(
@@ -393,7 +720,7 @@ async def test_area_update_handles_malformed_event_note(
 
     result = await coordinator.async_update_area()
 
-    assert result[AREA_ID][ATTR_EVENTS][0][ATTR_STAGE] is Stage.NO_LOAD_SHEDDING
+    assert result[AREA_ID][ATTR_EVENTS][0].stage is Stage.NO_LOAD_SHEDDING
 
 
 async def test_stage_update_skips_malformed_zone(
@@ -465,11 +792,7 @@ def test_stage_cache_round_trip() -> None:
         "eskom": {
             "name": "National",
             ATTR_PLANNED: [
-                {
-                    ATTR_STAGE: Stage.STAGE_2,
-                    ATTR_START_TIME: now,
-                    ATTR_END_TIME: now + timedelta(hours=2),
-                },
+                Slot(Stage.STAGE_2, now, now + timedelta(hours=2)),
             ],
         },
     }
@@ -482,19 +805,11 @@ def test_area_cache_round_trip() -> None:
     data = {
         "za_gt_tsh_garsfontein_gaev": {
             ATTR_EVENTS: [
-                {
-                    ATTR_STAGE: Stage.STAGE_2,
-                    ATTR_START_TIME: now,
-                    ATTR_END_TIME: now + timedelta(hours=2),
-                },
+                Slot(Stage.STAGE_2, now, now + timedelta(hours=2)),
             ],
             ATTR_SCHEDULE: {
                 Stage.STAGE_2: [
-                    {
-                        ATTR_STAGE: Stage.STAGE_2,
-                        ATTR_START_TIME: now,
-                        ATTR_END_TIME: now + timedelta(hours=2),
-                    },
+                    Slot(Stage.STAGE_2, now, now + timedelta(hours=2)),
                 ],
             },
         },
@@ -502,6 +817,160 @@ def test_area_cache_round_trip() -> None:
     assert _deserialize_area_data(_serialize_area_data(data)) == data
 
 
+def test_decoded_areas_share_boundary_datetimes() -> None:
+    """Areas with the same slots decode to the same datetime objects."""
+    now = datetime(2026, 6, 18, 8, 0, tzinfo=UTC)
+    slots = [Slot(Stage.STAGE_2, now, now + timedelta(hours=2))]
+    area_data = {ATTR_EVENTS: slots, ATTR_SCHEDULE: {Stage.STAGE_2: slots}}
+    data = _deserialize_area_data(
+        _serialize_area_data({"area_a": area_data, "area_b": area_data})
+    )
+
+    event_a = data["area_a"][ATTR_EVENTS][0]
+    event_b = data["area_b"][ATTR_EVENTS][0]
+    assert event_a == event_b
+    assert event_a.start_time is event_b.start_time
+    assert event_a.end_time is data["area_b"][ATTR_SCHEDULE][Stage.STAGE_2][0].end_time
+
+
+async def test_timestamp_table_pruned_when_forecast_replaced(
+    hass: HomeAssistant,
+    init_integration: MockConfigEntry,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Each area coordinator prunes its own table, only as forecasts change."""
+    coordinator: LoadSheddingAreaCoordinator = hass.data[DOMAIN][
+        init_integration.entry_id
+    ][ATTR_AREA]
+    stage_coordinator = hass.data[DOMAIN][init_integration.entry_id][ATTR_STAGE]
+    assert coordinator._timestamps is not stage_coordinator._timestamps
+
+    ended = datetime(2026, 6, 18, 7, 0, tzinfo=UTC)
+    coordinator._timestamps.intern(ended)
+    size = len(coordinator._timestamps)
+
+    freezer.tick(timedelta(minutes=1))
+    await coordinator._async_update_data()
+    assert len(coordinator._timestamps) == size
+
+    # The stage 2 outage ends at 20:30 UTC and leaves the forecast.
+    freezer.move_to("2026-06-18T21:00:00+00:00")
+    await coordinator._async_update_data()
+    assert len(coordinator._timestamps) < size
+    assert coordinator._timestamps.intern(ended + timedelta(0)) is not ended
+
+
+def test_area_cache_is_columnar() -> None:
+    """Area slots are stored as delta-encoded epoch minutes, stage implied."""
+    now = datetime(2026, 6, 18, 8, 0, tzinfo=UTC)
+    slots = [
+        Slot(
+            Stage.STAGE_4,
+            now + timedelta(hours=offset),
+            now + timedelta(hours=offset, minutes=150),
+        )
+        for offset in (0, 8)
+    ]
+    stored = _serialize_area_data(
+        {AREA_ID: {ATTR_EVENTS: slots, ATTR_SCHEDULE: {Stage.STAGE_4: slots}}}
+    )[AREA_ID]
+
+    epoch_minutes = int(now.timestamp()) // 60
+    assert stored[ATTR_EVENTS] == {
+        "start": [epoch_minutes, 480],
+        "duration": [150, 150],
+        ATTR_STAGE: [4, 4],
+    }
+    assert stored[ATTR_SCHEDULE] == {
+        "4": {"start": [epoch_minutes, 480], "duration": [150, 150]}
+    }
+
+
+async def test_v1_cache_is_migrated_without_polling(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    mock_sepush: MagicMock,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """A version 1 cache is converted on load and served without an API call."""
+    freezer.move_to(FROZEN_TIME)
+    frozen_now = datetime.fromisoformat(FROZEN_TIME)
+    cache_time = (frozen_now - timedelta(seconds=1)).isoformat()
+    start, end = frozen_now + timedelta(hours=12), frozen_now + timedelta(hours=14)
+    v1_slot = {
+        ATTR_STAGE: 2,
+        ATTR_START_TIME: start.isoformat(),
+        ATTR_END_TIME: end.isoformat(),
+    }
+
+    entry = build_config_entry()
+    entry.add_to_hass(hass)
+    stage_key = f"{DOMAIN}.stage.{entry.entry_id}"
+    area_key = f"{DOMAIN}.area.{entry.entry_id}"
+    hass_storage[stage_key] = {
+        "version": 1,
+        "minor_version": 1,
+        "key": stage_key,
+        "data": {
+            "last_update": cache_time,
+            "data": {"eskom": {"name": "National", ATTR_PLANNED: [v1_slot]}},
+            "rate_limit": None,
+        },
+    }
+    hass_storage[area_key] = {
+        "version": 1,
+        "minor_version": 1,
+        "key": area_key,
+        "data": {
+            "last_update": cache_time,
+            "data": {AREA_ID: {ATTR_EVENTS: [], ATTR_SCHEDULE: {"2": [v1_slot]}}},
+        },
+    }
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    mock_sepush.status.assert_not_called()
+    mock_sepush.area.assert_not_called()
+
+    area = hass.data[DOMAIN][entry.entry_id][ATTR_AREA]
+    assert area.data[AREA_ID][ATTR_SCHEDULE][Stage.STAGE_2] == [
+        Slot(Stage.STAGE_2, start, end)
+    ]
+    assert hass_storage[area_key]["version"] == 2
+    assert hass_storage[area_key]["data"]["last_update"] == cache_time
+    assert hass_storage[area_key]["data"]["data"][AREA_ID][ATTR_SCHEDULE] == {
+        "2": {"start": [int(start.timestamp()) // 60], "duration": [120]}
+    }
+
+
+async def test_unreadable_v1_cache_falls_back_to_poll(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    mock_sepush: MagicMock,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """A version 1 cache that cannot be migrated is dropped and re-polled."""
+    freezer.move_to(FROZEN_TIME)
+    entry = build_config_entry()
+    entry.add_to_hass(hass)
+    area_key = f"{DOMAIN}.area.{entry.entry_id}"
+    hass_storage[area_key] = {
+        "version": 1,
+        "minor_version": 1,
+        "key": area_key,
+        "data": {
+            "last_update": FROZEN_TIME,
+            "data": {AREA_ID: {ATTR_SCHEDULE: {"2": [{ATTR_STAGE: "bogus"}]}}},
+        },
+    }
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    mock_sepush.area.assert_called()
+
+
 async def test_stage_coordinator_cache_skips_api_on_restart(
     hass: HomeAssistant,
     mock_sepush: MagicMock,
@@ -530,11 +999,11 @@ async def test_stage_coordinator_cache_skips_api_on_restart(
                 "eskom": {
                     "name": "National",
                     ATTR_PLANNED: [
-                        {
-                            ATTR_STAGE: Stage.STAGE_2,
-                            ATTR_START_TIME: frozen_now - timedelta(hours=1),
-                            ATTR_END_TIME: frozen_now + timedelta(hours=1),
-                        }
+                        Slot(
+                            Stage.STAGE_2,
+                            frozen_now - timedelta(hours=1),
+                            frozen_now + timedelta(hours=1),
+                        )
                     ],
                 }
             }
@@ -585,11 +1054,11 @@ async def test_stage_coordinator_reseeds_rate_limit_on_restart(
                 "eskom": {
                     "name": "National",
                     ATTR_PLANNED: [
-                        {
-                            ATTR_STAGE: Stage.STAGE_2,
-                            ATTR_START_TIME: frozen_now - timedelta(hours=1),
-                            ATTR_END_TIME: frozen_now + timedelta(hours=1),
-                        }
+                        Slot(
+                            Stage.STAGE_2,
+                            frozen_now - timedelta(hours=1),
+                            frozen_now + timedelta(hours=1),
+                        )
                     ],
                 }
             }
@@ -640,11 +1109,11 @@ async def test_area_coordinator_cache_skips_api_on_restart(
                     ATTR_EVENTS: [],
                     ATTR_SCHEDULE: {
                         Stage.STAGE_2: [
-                            {
-                                ATTR_STAGE: Stage.STAGE_2,
-                                ATTR_START_TIME: frozen_now + timedelta(hours=12),
-                                ATTR_END_TIME: frozen_now + timedelta(hours=14),
-                            }
+                            Slot(
+                                Stage.STAGE_2,
+                                frozen_now + timedelta(hours=12),
+                                frozen_now + timedelta(hours=14),
+                            )
                         ]
                     },
                 }
@@ -663,6 +1132,68 @@ async def test_area_coordinator_cache_skips_api_on_restart(
     mock_sepush.area.assert_not_called()
 
 
+async def test_setup_serves_stale_cache_while_refreshing(
+    hass: HomeAssistant,
+    mock_sepush: MagicMock,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Entities start from a stale cache and stay flagged until fresh data lands.
+
+    The first refresh runs in the background after the platforms are set up, so
+    a failed area poll leaves the cached forecast in place, marked ``stale``.
+    """
+    freezer.move_to(FROZEN_TIME)
+    frozen_now = datetime.fromisoformat(FROZEN_TIME)
+    mock_sepush.area.side_effect = SePushError("boom", status_code=500)
+
+    entry = build_config_entry()
+    entry.add_to_hass(hass)
+
+    area_store_data = {
+        "last_update": (
+            frozen_now - timedelta(seconds=AREA_UPDATE_INTERVAL + 60)
+        ).isoformat(),
+        "data": _serialize_area_data(
+            {
+                AREA_ID: {
+                    ATTR_EVENTS: [
+                        Slot(
+                            Stage.STAGE_2,
+                            frozen_now + timedelta(hours=2),
+                            frozen_now + timedelta(hours=4),
+                        )
+                    ],
+                    ATTR_SCHEDULE: {},
+                }
+            }
+        ),
+    }
+
+    async def _fake_load():
+        return area_store_data
+
+    with patch.object(Store, "async_load", side_effect=_fake_load):
+        await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+    assert entry.state is ConfigEntryState.LOADED
+    mock_sepush.area.assert_called_once_with(AREA_ID)
+    state = hass.states.get("sensor.load_shedding_area_za_gt_tsh_garsfontein_gaev")
+    assert state is not None
+    assert state.attributes["stale"] is True
+    assert len(state.attributes["forecast"]) == 1
+
+
+async def test_setup_clears_stale_flag_after_refresh(
+    hass: HomeAssistant, init_integration: MockConfigEntry
+) -> None:
+    """Fresh data from the background refresh clears the staleness flag."""
+    state = hass.states.get("sensor.load_shedding_area_za_gt_tsh_garsfontein_gaev")
+    assert state.attributes["stale"] is False
+    state = hass.states.get("sensor.load_shedding_stage_eskom")
+    assert state.attributes["stale"] is False
+
+
 async def test_stage_coordinator_saves_cache_after_successful_poll(
     hass: HomeAssistant,
     init_integration: MockConfigEntry,
@@ -675,16 +1206,16 @@ async def test_stage_coordinator_saves_cache_after_successful_poll(
     ]
     saved: list[dict] = []
 
-    async def _capture(data):
-        saved.append(data)
+    def _capture(data_func, delay=0):
+        saved.append(data_func())
 
-    coordinator._store.async_save = _capture  # type: ignore[method-assign]
+    coordinator._store.async_delay_save = _capture  # type: ignore[method-assign]
 
     coordinator.last_update = None  # Force a refresh on next call.
     freezer.tick(timedelta(seconds=STAGE_UPDATE_INTERVAL + 1))
     await coordinator._async_update_data()
 
-    assert saved, "Store.async_save was never called after a successful API poll"
+    assert saved, "No cache write was queued after a successful API poll"
     assert "last_update" in saved[0]
     assert "data" in saved[0]
     assert "rate_limit" in saved[0]
@@ -702,18 +1233,127 @@ async def test_area_coordinator_saves_cache_after_successful_poll(
     ]
     saved: list[dict] = []
 
-    async def _capture(data):
-        saved.append(data)
+    def _capture(data_func, delay=0):
+        saved.append(data_func())
 
-    coordinator._store.async_save = _capture  # type: ignore[method-assign]
+    coordinator._store.async_delay_save = _capture  # type: ignore[method-assign]
 
     coordinator.last_update = None  # Force a refresh on next call.
     freezer.tick(timedelta(seconds=AREA_UPDATE_INTERVAL + 1))
     await coordinator._async_update_data()
 
-    assert saved, "Store.async_save was never called after a successful API poll"
+    assert saved, "No cache write was queued after a successful API poll"
     assert "last_update" in saved[0]
     assert "data" in saved[0]
+    assert "invalid_area_ids" in saved[0]
+
+
+async def test_cache_saves_are_coalesced_and_skipped_when_unchanged(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    init_integration: MockConfigEntry,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Content changes are written after a delay; polls changing nothing wait."""
+    entry = init_integration
+    coordinator: LoadSheddingAreaCoordinator = hass.data[DOMAIN][entry.entry_id][
+        ATTR_AREA
+    ]
+    key = f"{DOMAIN}.area.{entry.entry_id}"
+    await coordinator.async_flush_cache()
+    written = hass_storage[key]["data"]
+
+    # A poll that only moves last_update is held back, but not for long.
+    coordinator.last_update += timedelta(hours=1)
+    await coordinator._save_cache()
+    freezer.tick(timedelta(seconds=11))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert hass_storage[key]["data"] == written
+    freezer.tick(timedelta(seconds=50))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert hass_storage[key]["data"]["last_update"] != written["last_update"]
+    assert hass_storage[key]["data"]["data"] == written["data"]
+    written = hass_storage[key]["data"]
+
+    # A content change is written after the save delay, with the latest poll.
+    coordinator.last_update += timedelta(hours=1)
+    coordinator.data = {}
+    await coordinator._save_cache()
+    freezer.tick(timedelta(seconds=11))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert hass_storage[key]["data"]["data"] == {}
+    assert hass_storage[key]["data"]["last_update"] != written["last_update"]
+
+
+async def test_unload_flushes_poll_only_cache_save(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    init_integration: MockConfigEntry,
+) -> None:
+    """A held-back last_update is written when the entry unloads."""
+    entry = init_integration
+    coordinator: LoadSheddingAreaCoordinator = hass.data[DOMAIN][entry.entry_id][
+        ATTR_AREA
+    ]
+    key = f"{DOMAIN}.area.{entry.entry_id}"
+    await coordinator.async_flush_cache()
+    written = hass_storage[key]["data"]
+
+    coordinator.last_update += timedelta(hours=1)
+    await coordinator._save_cache()
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+    assert hass_storage[key]["data"]["last_update"] != written["last_update"]
+    assert hass_storage[key]["data"]["data"] == written["data"]
+
+
+async def test_stage_cache_quota_is_not_a_content_change(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    init_integration: MockConfigEntry,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """A poll that only moves the quota snapshot is held like last_update."""
+    entry = init_integration
+    coordinator: LoadSheddingStageCoordinator = hass.data[DOMAIN][entry.entry_id][
+        ATTR_STAGE
+    ]
+    key = f"{DOMAIN}.stage.{entry.entry_id}"
+    await coordinator.async_flush_cache()
+    written = hass_storage[key]["data"]
+
+    coordinator.sepush._rate_limit = {"used": 7, "limit": 50}
+    await coordinator._save_cache()
+    freezer.tick(timedelta(seconds=11))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert hass_storage[key]["data"] == written
+    freezer.tick(timedelta(seconds=50))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert hass_storage[key]["data"]["rate_limit"] == {"used": 7, "limit": 50}
+
+
+async def test_unload_flushes_queued_cache_save(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    init_integration: MockConfigEntry,
+) -> None:
+    """A save still waiting on its delay is written when the entry unloads."""
+    entry = init_integration
+    coordinator: LoadSheddingStageCoordinator = hass.data[DOMAIN][entry.entry_id][
+        ATTR_STAGE
+    ]
+    coordinator.data = {}
+    await coordinator._save_cache()
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+    assert hass_storage[f"{DOMAIN}.stage.{entry.entry_id}"]["data"]["data"] == {}
 
 
 @pytest.mark.parametrize(
@@ -1,27 +1,52 @@
 """Tests for the Load Shedding sensor platform."""
 
 from datetime import UTC, datetime, timedelta
-from unittest.mock import MagicMock
+from typing import Any
+from unittest.mock import MagicMock, patch
 
 from freezegun.api import FrozenDateTimeFactory
 from load_shedding.libs.sepush import SePushError
 from load_shedding.providers import Stage
-
-from homeassistant.const import ATTR_NAME, STATE_OFF, STATE_ON
+import pytest
+
+from homeassistant.const import (
+    ATTR_NAME,
+    CONF_ID,
+    CONF_NAME,
+    EVENT_STATE_CHANGED,
+    STATE_OFF,
+    STATE_ON,
+    STATE_UNKNOWN,
+)
 from homeassistant.core import HomeAssistant, State
+from homeassistant.util import dt as dt_util
 
+from custom_components.load_shedding import (
+    _serialize_area_data,
+    _serialize_stage_data,
+)
 from custom_components.load_shedding.const import (
     ATTR_AREA,
+    ATTR_END_IN,
     ATTR_END_TIME,
     ATTR_EVENTS,
     ATTR_FORECAST,
+    ATTR_FORECAST_CALENDAR,
     ATTR_PLANNED,
+    ATTR_PROJECTION,
     ATTR_SCHEDULE,
     ATTR_STAGE,
+    ATTR_START_IN,
     ATTR_START_TIME,
+    ATTR_TIMELINE,
+    CONF_MINUTE_COUNTDOWNS,
+    CONF_OUTAGE_MINUTES_HOURS,
+    CONF_PROJECTION_STAGE,
+    CONF_TIMELINE_DAYS,
     DOMAIN,
     STAGE_UPDATE_INTERVAL,
 )
+from custom_components.load_shedding.helpers import Slot
 from custom_components.load_shedding.sensor import (
     clean,
     get_sensor_attrs,
@@ -32,6 +57,8 @@ from .conftest import AREA_ID, FROZEN_TIME, STATUS_DATA, build_config_entry
 
 from pytest_homeassistant_custom_component.common import (
     MockConfigEntry,
+    async_capture_events,
+    async_fire_time_changed,
     mock_restore_cache_with_extra_data,
 )
 
@@ -97,11 +124,7 @@ async def test_area_sensor_updates_active(
     new_data = dict(coordinator.data)
     new_data[AREA_ID] = {
         ATTR_FORECAST: [
-            {
-                ATTR_STAGE: Stage.STAGE_2,
-                ATTR_START_TIME: now - timedelta(hours=1),
-                ATTR_END_TIME: now + timedelta(hours=1),
-            }
+            Slot(Stage.STAGE_2, now - timedelta(hours=1), now + timedelta(hours=1))
         ],
         ATTR_SCHEDULE: {},
         ATTR_EVENTS: [],
@@ -204,6 +227,87 @@ async def test_quota_sensor_restores_attributes_on_restart(
     mock_sepush.rate_limit.assert_not_called()
 
 
+async def test_area_sensor_restores_attributes_without_cache(
+    hass: HomeAssistant,
+    mock_sepush: MagicMock,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """With no coordinator cache the area sensor falls back to its last state."""
+    freezer.move_to(FROZEN_TIME)
+    start = datetime.fromisoformat(FROZEN_TIME) + timedelta(hours=2)
+    forecast = [
+        {
+            ATTR_STAGE: Stage.STAGE_2.value,
+            ATTR_START_TIME: start.isoformat(),
+            ATTR_END_TIME: (start + timedelta(hours=2)).isoformat(),
+        }
+    ]
+    mock_restore_cache_with_extra_data(
+        hass,
+        (
+            (
+                State(
+                    f"sensor.load_shedding_area_{AREA_ID}",
+                    STATE_OFF,
+                    attributes={ATTR_FORECAST: forecast},
+                ),
+                {"native_value": STATE_OFF, "native_unit_of_measurement": None},
+            ),
+        ),
+    )
+    mock_sepush.area.side_effect = SePushError("quota exceeded", status_code=429)
+
+    entry = build_config_entry()
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    state = hass.states.get(f"sensor.load_shedding_area_{AREA_ID}")
+    assert state.attributes[ATTR_FORECAST][0][ATTR_START_TIME] == start
+
+
+async def test_sensors_skip_recorded_state_when_cached(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    mock_sepush: MagicMock,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Entities take their attributes from the coordinator cache on restart."""
+    freezer.move_to(FROZEN_TIME)
+    frozen_now = datetime.fromisoformat(FROZEN_TIME)
+    slot = Slot(
+        Stage.STAGE_2,
+        frozen_now + timedelta(hours=2),
+        frozen_now + timedelta(hours=4),
+    )
+    entry = build_config_entry()
+    entry.add_to_hass(hass)
+    cache_time = (frozen_now - timedelta(seconds=1)).isoformat()
+    stage_data = {"eskom": {"name": "National", ATTR_PLANNED: [slot]}}
+    area_data = {AREA_ID: {ATTR_EVENTS: [], ATTR_SCHEDULE: {Stage.STAGE_2: [slot]}}}
+    for kind, data in (
+        ("stage", _serialize_stage_data(stage_data)),
+        ("area", _serialize_area_data(area_data)),
+    ):
+        key = f"{DOMAIN}.{kind}.{entry.entry_id}"
+        hass_storage[key] = {
+            "version": 2,
+            "minor_version": 1,
+            "key": key,
+            "data": {"last_update": cache_time, "data": data},
+        }
+
+    with patch(
+        "custom_components.load_shedding.sensor.restorable_attrs"
+    ) as restorable_attrs:
+        await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+    restorable_attrs.assert_not_called()
+    state = hass.states.get(f"sensor.load_shedding_area_{AREA_ID}")
+    assert state.attributes[ATTR_FORECAST] == [slot._asdict()]
+
+
 def test_get_sensor_attrs_no_forecast() -> None:
     """With no forecast only the stage attribute is returned."""
     attrs = get_sensor_attrs([], Stage.STAGE_3)
@@ -215,11 +319,7 @@ def test_get_sensor_attrs_upcoming_event(freezer: FrozenDateTimeFactory) -> None
     freezer.move_to("2026-06-18T08:00:00+00:00")
     now = datetime.now(UTC)
     forecast = [
-        {
-            ATTR_STAGE: Stage.STAGE_2,
-            ATTR_START_TIME: now + timedelta(hours=1),
-            ATTR_END_TIME: now + timedelta(hours=3),
-        }
+        Slot(Stage.STAGE_2, now + timedelta(hours=1), now + timedelta(hours=3))
     ]
     attrs = get_sensor_attrs(forecast, Stage.STAGE_2)
     assert attrs[ATTR_STAGE] == Stage.STAGE_2.value
@@ -231,11 +331,7 @@ def test_get_sensor_attrs_active_event(freezer: FrozenDateTimeFactory) -> None:
     freezer.move_to("2026-06-18T08:00:00+00:00")
     now = datetime.now(UTC)
     forecast = [
-        {
-            ATTR_STAGE: Stage.STAGE_4,
-            ATTR_START_TIME: now - timedelta(hours=1),
-            ATTR_END_TIME: now + timedelta(hours=2),
-        }
+        Slot(Stage.STAGE_4, now - timedelta(hours=1), now + timedelta(hours=2))
     ]
     attrs = get_sensor_attrs(forecast, Stage.STAGE_4)
     assert attrs["ends_in"] == 120
@@ -282,11 +378,7 @@ async def test_area_sensor_attributes_clear_when_forecast_empties(
     new_data = dict(coordinator.data)
     new_data[AREA_ID] = {
         ATTR_FORECAST: [
-            {
-                ATTR_STAGE: Stage.STAGE_2,
-                ATTR_START_TIME: now + timedelta(hours=1),
-                ATTR_END_TIME: now + timedelta(hours=3),
-            }
+            Slot(Stage.STAGE_2, now + timedelta(hours=1), now + timedelta(hours=3))
         ],
         ATTR_SCHEDULE: {},
         ATTR_EVENTS: [],
@@ -352,16 +444,8 @@ async def test_area_sensor_merges_contiguous_end_time(
     new_data = dict(coordinator.data)
     new_data[AREA_ID] = {
         ATTR_FORECAST: [
-            {
-                ATTR_STAGE: Stage.STAGE_2,
-                ATTR_START_TIME: now - timedelta(hours=1),
-                ATTR_END_TIME: now + timedelta(hours=1),
-            },
-            {
-                ATTR_STAGE: Stage.STAGE_4,
-                ATTR_START_TIME: now + timedelta(hours=1),
-                ATTR_END_TIME: now + timedelta(hours=3),
-            },
+            Slot(Stage.STAGE_2, now - timedelta(hours=1), now + timedelta(hours=1)),
+            Slot(Stage.STAGE_4, now + timedelta(hours=1), now + timedelta(hours=3)),
         ],
         ATTR_SCHEDULE: {},
         ATTR_EVENTS: [],
@@ -373,6 +457,290 @@ async def test_area_sensor_merges_contiguous_end_time(
     assert attrs[ATTR_END_TIME] == (now + timedelta(hours=3)).isoformat()
 
 
+async def test_area_sensor_caps_list_attributes(
+    hass: HomeAssistant,
+    init_integration: MockConfigEntry,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Forecast list attributes are capped; the calendar keeps every event."""
+    freezer.move_to(FROZEN_TIME)
+    entry = init_integration
+    coordinator = hass.data[DOMAIN][entry.entry_id][ATTR_AREA]
+    entity_id = "sensor.load_shedding_area_za_gt_tsh_garsfontein_gaev"
+    now = datetime(2026, 6, 18, 8, 0, tzinfo=UTC)
+
+    # The default 7 day horizon exposes 8 slots per day.
+    limit = 7 * 8
+    assert coordinator.stage_coordinator.list_attr_limit == limit
+    count = limit + 6
+    new_data = dict(coordinator.data)
+    new_data[AREA_ID] = {
+        ATTR_FORECAST: [
+            Slot(
+                Stage.STAGE_2,
+                now + timedelta(minutes=150 * i + 60),
+                now + timedelta(minutes=150 * i + 180),
+            )
+            for i in range(count)
+        ],
+        ATTR_SCHEDULE: {},
+        ATTR_EVENTS: [],
+    }
+    coordinator.async_set_updated_data(new_data)
+    await hass.async_block_till_done()
+
+    attrs = hass.states.get(entity_id).attributes
+    assert len(attrs[ATTR_FORECAST]) == limit
+    assert len(attrs[ATTR_FORECAST_CALENDAR]) == limit
+    assert attrs["next_start_time"] == (now + timedelta(hours=1)).isoformat()
+
+    events = await hass.services.async_call(
+        "calendar",
+        "get_events",
+        {
+            "entity_id": "calendar.load_shedding_forecast",
+            "start_date_time": now,
+            "end_date_time": now + timedelta(days=7),
+        },
+        blocking=True,
+        return_response=True,
+    )
+    assert len(events["calendar.load_shedding_forecast"]["events"]) == count
+
+
+async def test_area_sensor_projection_attribute(
+    hass: HomeAssistant, mock_sepush: MagicMock, freezer: FrozenDateTimeFactory
+) -> None:
+    """With a projection stage configured, area sensors project its schedule."""
+    freezer.move_to(FROZEN_TIME)
+    entry = build_config_entry(options_extra={CONF_PROJECTION_STAGE: 2})
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    entity_id = "sensor.load_shedding_area_za_gt_tsh_garsfontein_gaev"
+    attrs = hass.states.get(entity_id).attributes
+    assert attrs[ATTR_PROJECTION] == {
+        ATTR_STAGE: 2,
+        "outages": [
+            [
+                datetime(2026, 6, 18, 18, 0, tzinfo=UTC),
+                datetime(2026, 6, 18, 20, 30, tzinfo=UTC),
+            ]
+        ],
+    }
+
+
+async def test_area_sensor_projection_is_stable_between_outages(
+    hass: HomeAssistant, mock_sepush: MagicMock, freezer: FrozenDateTimeFactory
+) -> None:
+    """The projection keeps a running outage's start and ignores minute ticks."""
+    freezer.move_to(FROZEN_TIME)
+    entry = build_config_entry(options_extra={CONF_PROJECTION_STAGE: 2})
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    entity_id = "sensor.load_shedding_area_za_gt_tsh_garsfontein_gaev"
+    outage = [
+        datetime(2026, 6, 18, 18, 0, tzinfo=UTC),
+        datetime(2026, 6, 18, 20, 30, tzinfo=UTC),
+    ]
+    for moment in (
+        datetime(2026, 6, 18, 19, 0, 30, tzinfo=UTC),
+        datetime(2026, 6, 18, 19, 1, 30, tzinfo=UTC),
+    ):
+        freezer.move_to(moment)
+        async_fire_time_changed(hass, moment)
+        await hass.async_block_till_done()
+        attrs = hass.states.get(entity_id).attributes
+        assert attrs[ATTR_PROJECTION] == {ATTR_STAGE: 2, "outages": [outage]}
+
+    moment = datetime(2026, 6, 18, 20, 31, tzinfo=UTC)
+    freezer.move_to(moment)
+    async_fire_time_changed(hass, moment)
+    await hass.async_block_till_done()
+    attrs = hass.states.get(entity_id).attributes
+    assert attrs[ATTR_PROJECTION] == {ATTR_STAGE: 2, "outages": []}
+
+
+async def test_area_sensor_without_projection_stage(
+    hass: HomeAssistant, init_integration: MockConfigEntry
+) -> None:
+    """The projection and timeline attributes are opt-in."""
+    entity_id = "sensor.load_shedding_area_za_gt_tsh_garsfontein_gaev"
+    assert ATTR_PROJECTION not in hass.states.get(entity_id).attributes
+    assert ATTR_TIMELINE not in hass.states.get(entity_id).attributes
+
+
+async def test_area_sensor_timeline_attribute(
+    hass: HomeAssistant, mock_sepush: MagicMock, freezer: FrozenDateTimeFactory
+) -> None:
+    """With timeline days configured, area sensors add a compact timeline."""
+    freezer.move_to(FROZEN_TIME)
+    entry = build_config_entry(options_extra={CONF_TIMELINE_DAYS: 2})
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    entity_id = "sensor.load_shedding_area_za_gt_tsh_garsfontein_gaev"
+    timeline = hass.states.get(entity_id).attributes[ATTR_TIMELINE]
+    start = dt_util.start_of_local_day()
+    assert timeline["start"] == start
+    # The stage 2 forecast runs from 18:00 to 20:30 UTC.
+    first = (datetime(2026, 6, 18, 18, 0, tzinfo=UTC) - start) // timedelta(minutes=30)
+    stages = timeline["stages"]
+    assert len(stages) == 96
+    assert stages[first : first + 5] == "22222"
+    assert stages.count("0") == 91
+
+
+@pytest.mark.parametrize(("hours", "minutes"), [(24, 150), (11, 60), (10, 0)])
+async def test_outage_minutes_sensor(
+    hass: HomeAssistant,
+    mock_sepush: MagicMock,
+    freezer: FrozenDateTimeFactory,
+    hours: int,
+    minutes: int,
+) -> None:
+    """The outage minutes sensor sums the forecast over the next hours."""
+    freezer.move_to(FROZEN_TIME)
+    entry = build_config_entry(options_extra={CONF_OUTAGE_MINUTES_HOURS: hours})
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    state = hass.states.get(
+        "sensor.load_shedding_outage_minutes_za_gt_tsh_garsfontein_gaev"
+    )
+    assert state.state == str(minutes)
+    assert state.attributes["unit_of_measurement"] == "min"
+
+
+async def test_outage_minutes_sensor_is_opt_in(
+    hass: HomeAssistant, init_integration: MockConfigEntry
+) -> None:
+    """Without a window configured no outage minutes sensors are created."""
+    assert not any(
+        "outage_minutes" in entity_id
+        for entity_id in hass.states.async_entity_ids("sensor")
+    )
+
+
+async def test_next_start_and_end_sensors(
+    hass: HomeAssistant, init_integration: MockConfigEntry
+) -> None:
+    """Timestamp sensors report the next outage boundaries of each area."""
+    next_start = hass.states.get(
+        "sensor.load_shedding_next_start_za_gt_tsh_garsfontein_gaev"
+    )
+    next_end = hass.states.get(
+        "sensor.load_shedding_next_end_za_gt_tsh_garsfontein_gaev"
+    )
+    assert next_start.state == "2026-06-18T18:00:00+00:00"
+    assert next_start.attributes["device_class"] == "timestamp"
+    assert next_end.state == "2026-06-18T20:30:00+00:00"
+
+    # During an outage the end is the running one's; no outage follows.
+    coordinator = hass.data[DOMAIN][init_integration.entry_id][ATTR_AREA]
+    now = datetime.fromisoformat(FROZEN_TIME)
+    hour = timedelta(hours=1)
+    coordinator.async_set_updated_data(
+        {
+            AREA_ID: {
+                ATTR_FORECAST: [Slot(Stage.STAGE_2, now - hour, now + hour)],
+                ATTR_SCHEDULE: {},
+                ATTR_EVENTS: [],
+            }
+        }
+    )
+    await hass.async_block_till_done()
+    assert hass.states.get(next_start.entity_id).state == STATE_UNKNOWN
+    assert hass.states.get(next_end.entity_id).state == "2026-06-18T09:00:00+00:00"
+
+
+@pytest.mark.parametrize("countdowns", [True, False])
+async def test_minute_countdowns_option(
+    hass: HomeAssistant,
+    mock_sepush: MagicMock,
+    freezer: FrozenDateTimeFactory,
+    countdowns: bool,
+) -> None:
+    """Without the minute countdowns a poll between boundaries writes nothing."""
+    freezer.move_to(FROZEN_TIME)
+    entry = build_config_entry(options_extra={CONF_MINUTE_COUNTDOWNS: countdowns})
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    entity_id = "sensor.load_shedding_area_za_gt_tsh_garsfontein_gaev"
+    attrs = hass.states.get(entity_id).attributes
+    assert (ATTR_START_IN in attrs) is countdowns
+    assert (ATTR_END_IN in attrs) is countdowns
+
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+    freezer.tick(timedelta(minutes=1))
+    hass.data[DOMAIN][entry.entry_id][ATTR_AREA].async_update_listeners()
+    await hass.async_block_till_done()
+    changed = {event.data["entity_id"] for event in events}
+    assert (entity_id in changed) is countdowns
+    assert "sensor.load_shedding_next_start_za_gt_tsh_garsfontein_gaev" not in changed
+
+
+async def test_any_and_all_areas_sensors(
+    hass: HomeAssistant, mock_sepush: MagicMock, freezer: FrozenDateTimeFactory
+) -> None:
+    """With several areas, sensors report when any and when all are off."""
+    freezer.move_to(FROZEN_TIME)
+    other_id = "za_gt_tsh_moreletapark_1a2b"
+    entry = build_config_entry(
+        areas=[
+            {CONF_ID: AREA_ID, CONF_NAME: "Garsfontein"},
+            {CONF_ID: other_id, CONF_NAME: "Moreleta Park"},
+        ]
+    )
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    coordinator = hass.data[DOMAIN][entry.entry_id][ATTR_AREA]
+    now = datetime.fromisoformat(FROZEN_TIME)
+    coordinator.async_set_updated_data(
+        {
+            area_id: {
+                ATTR_FORECAST: [Slot(Stage.STAGE_2, now + start, now + end)],
+                ATTR_SCHEDULE: {},
+                ATTR_EVENTS: [],
+            }
+            for area_id, start, end in (
+                (AREA_ID, timedelta(hours=-1), timedelta(hours=1)),
+                (other_id, timedelta(minutes=30), timedelta(hours=3)),
+            )
+        }
+    )
+    await hass.async_block_till_done()
+
+    any_area = hass.states.get("sensor.load_shedding_any_area")
+    assert any_area.state == STATE_ON
+    assert any_area.attributes[ATTR_END_TIME] == (now + timedelta(hours=3)).isoformat()
+    all_areas = hass.states.get("sensor.load_shedding_all_areas")
+    assert all_areas.state == STATE_OFF
+    assert all_areas.attributes["next_start_time"] == (
+        now + timedelta(minutes=30)
+    ).isoformat()
+    assert all_areas.attributes["next_end_time"] == (
+        now + timedelta(hours=1)
+    ).isoformat()
+
+
+async def test_no_aggregate_sensors_for_one_area(
+    hass: HomeAssistant, init_integration: MockConfigEntry
+) -> None:
+    """A single area gets no any/all-areas sensors."""
+    assert hass.states.get("sensor.load_shedding_any_area") is None
+    assert hass.states.get("sensor.load_shedding_all_areas") is None
+
+
 async def test_stage_sensor_preserves_next_fields(
     hass: HomeAssistant,
     init_integration: MockConfigEntry,
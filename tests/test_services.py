@@ -0,0 +1,269 @@
+"""Tests for the Load Shedding services."""
+
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ServiceValidationError
+
+from custom_components.load_shedding.const import (
+    ATTR_AREA,
+    DOMAIN,
+    SERVICE_FIND_FREE_WINDOWS,
+    SERVICE_OUTAGE_MINUTES,
+    SERVICE_PROJECT_STAGE,
+)
+
+from .conftest import AREA_ID
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+
+async def test_project_stage(
+    hass: HomeAssistant, init_integration: MockConfigEntry
+) -> None:
+    """Outages are projected from the schedule of the requested stage."""
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_PROJECT_STAGE,
+        {"stage": 2},
+        blocking=True,
+        return_response=True,
+    )
+    assert response == {
+        "stage": 2,
+        "areas": {
+            AREA_ID: [
+                {
+                    "start_time": "2026-06-18T18:00:00+00:00",
+                    "end_time": "2026-06-18T20:30:00+00:00",
+                }
+            ]
+        },
+    }
+
+
+async def test_project_stage_clips_to_window(
+    hass: HomeAssistant, init_integration: MockConfigEntry
+) -> None:
+    """Slots are clipped to the requested window, like a planned stage."""
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_PROJECT_STAGE,
+        {
+            "stage": 2,
+            "area_id": AREA_ID,
+            "start": "2026-06-18T19:00:00+00:00",
+            "end": "2026-06-18T23:00:00+00:00",
+        },
+        blocking=True,
+        return_response=True,
+    )
+    assert response["areas"][AREA_ID] == [
+        {
+            "start_time": "2026-06-18T19:00:00+00:00",
+            "end_time": "2026-06-18T20:30:00+00:00",
+        }
+    ]
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_PROJECT_STAGE,
+        {"stage": 4, "area_id": AREA_ID},
+        blocking=True,
+        return_response=True,
+    )
+    assert response["areas"] == {AREA_ID: []}
+
+
+@pytest.mark.parametrize(
+    ("data", "translation_key"),
+    [
+        ({"stage": 2, "area_id": "za_unknown"}, "unknown_area"),
+        (
+            {
+                "stage": 2,
+                "start": "2026-06-18T12:00:00+00:00",
+                "end": "2026-06-18T12:00:00+00:00",
+            },
+            "invalid_window",
+        ),
+    ],
+)
+async def test_project_stage_rejects_bad_input(
+    hass: HomeAssistant,
+    init_integration: MockConfigEntry,
+    data: dict,
+    translation_key: str,
+) -> None:
+    """Unknown areas and empty windows are rejected."""
+    with pytest.raises(ServiceValidationError) as err:
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_PROJECT_STAGE,
+            data,
+            blocking=True,
+            return_response=True,
+        )
+    assert err.value.translation_key == translation_key
+
+
+async def test_find_free_windows(
+    hass: HomeAssistant, init_integration: MockConfigEntry
+) -> None:
+    """Free windows are the gaps between the areas' forecast outages."""
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_FIND_FREE_WINDOWS,
+        {"duration": {"hours": 2}, "horizon": {"hours": 24}, "area_id": AREA_ID},
+        blocking=True,
+        return_response=True,
+    )
+    assert response == {
+        "windows": [
+            {
+                "start_time": "2026-06-18T08:00:00+00:00",
+                "end_time": "2026-06-18T18:00:00+00:00",
+            },
+            {
+                "start_time": "2026-06-18T20:30:00+00:00",
+                "end_time": "2026-06-19T08:00:00+00:00",
+            },
+        ],
+        "unavailable_areas": [],
+    }
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_FIND_FREE_WINDOWS,
+        {"duration": {"hours": 11}, "horizon": {"hours": 24}},
+        blocking=True,
+        return_response=True,
+    )
+    assert response["windows"] == [
+        {
+            "start_time": "2026-06-18T20:30:00+00:00",
+            "end_time": "2026-06-19T08:00:00+00:00",
+        }
+    ]
+
+
+async def test_find_free_windows_reuses_the_entry_sweep(
+    hass: HomeAssistant, init_integration: MockConfigEntry
+) -> None:
+    """Searching every area of one entry reads the coordinator's cached sweep."""
+    with patch(
+        "custom_components.load_shedding.services.sweep_outages"
+    ) as sweep_outages:
+        response = await hass.services.async_call(
+            DOMAIN,
+            SERVICE_FIND_FREE_WINDOWS,
+            {"duration": {"hours": 11}, "horizon": {"hours": 24}},
+            blocking=True,
+            return_response=True,
+        )
+    sweep_outages.assert_not_called()
+    assert len(response["windows"]) == 1
+
+
+async def test_find_free_windows_skips_areas_without_forecast(
+    hass: HomeAssistant, init_integration: MockConfigEntry
+) -> None:
+    """An area with no forecast yet is listed, not counted as never off."""
+    coordinator = hass.data[DOMAIN][init_integration.entry_id][ATTR_AREA]
+    coordinator.data.pop(AREA_ID)
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_FIND_FREE_WINDOWS,
+        {"duration": {"hours": 2}},
+        blocking=True,
+        return_response=True,
+    )
+    assert response == {"windows": [], "unavailable_areas": [AREA_ID]}
+
+
+async def test_find_free_windows_rejects_unknown_area(
+    hass: HomeAssistant, init_integration: MockConfigEntry
+) -> None:
+    """Every requested area must be configured."""
+    with pytest.raises(ServiceValidationError) as err:
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_FIND_FREE_WINDOWS,
+            {"duration": {"hours": 2}, "area_id": [AREA_ID, "za_unknown"]},
+            blocking=True,
+            return_response=True,
+        )
+    assert err.value.translation_key == "unknown_area"
+
+
+async def test_outage_minutes(
+    hass: HomeAssistant, init_integration: MockConfigEntry
+) -> None:
+    """Outage minutes are summed over the forecast within the window."""
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_OUTAGE_MINUTES,
+        {},
+        blocking=True,
+        return_response=True,
+    )
+    assert response == {"areas": {AREA_ID: 150}}
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_OUTAGE_MINUTES,
+        {
+            "area_id": AREA_ID,
+            "start": "2026-06-18T19:00:00+00:00",
+            "end": "2026-06-18T23:00:00+00:00",
+        },
+        blocking=True,
+        return_response=True,
+    )
+    assert response == {"areas": {AREA_ID: 90}}
+
+
+async def test_outage_minutes_rejects_empty_window(
+    hass: HomeAssistant, init_integration: MockConfigEntry
+) -> None:
+    """The end of the window must be after its start."""
+    with pytest.raises(ServiceValidationError) as err:
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_OUTAGE_MINUTES,
+            {
+                "start": "2026-06-18T12:00:00+00:00",
+                "end": "2026-06-18T11:00:00+00:00",
+            },
+            blocking=True,
+            return_response=True,
+        )
+    assert err.value.translation_key == "invalid_window"
+
+
+@pytest.mark.parametrize(
+    ("service", "data"),
+    [
+        (SERVICE_PROJECT_STAGE, {"stage": 2, "area_id": AREA_ID}),
+        (SERVICE_FIND_FREE_WINDOWS, {"duration": {"hours": 2}, "area_id": AREA_ID}),
+        (SERVICE_OUTAGE_MINUTES, {"area_id": AREA_ID}),
+    ],
+)
+async def test_services_skip_unloaded_entries(
+    hass: HomeAssistant,
+    init_integration: MockConfigEntry,
+    service: str,
+    data: dict,
+) -> None:
+    """Areas of an unloaded entry are no longer served."""
+    assert await hass.config_entries.async_unload(init_integration.entry_id)
+    await hass.async_block_till_done()
+
+    with pytest.raises(ServiceValidationError) as err:
+        await hass.services.async_call(
+            DOMAIN, service, data, blocking=True, return_response=True
+        )
+    assert err.value.translation_key == "unknown_area"